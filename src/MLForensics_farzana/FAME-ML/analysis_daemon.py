@@ -0,0 +1,234 @@
+'''
+Warm analysis daemon for FAME-ML
+Serves analysis requests on a local Unix socket from a pool of workers that stay up between requests, so a CI job
+that checks a handful of files does not pay interpreter startup, imports and rule setup every time
+'''
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import logging
+import tempfile
+import socketserver
+import multiprocessing
+import constants
+import count_matrix
+import main
+
+# log_pipeline.py is shared with the mining scripts and lives in the package root
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import log_pipeline
+
+FAMEML_LOGGER = logging.getLogger( constants.FAMEML_LOGGER_KW )
+
+
+def getResultRecord( file_name, result_tup, count_header ):
+    '''
+    { file, counts, error, events } for a getFileResult tuple ... counts maps the CSV count columns to the file's
+    rolled up detector counts and is None, like events, for a file that does not parse or goes over a limit
+    '''
+    count_tup, parse_error, event_list, _ = result_tup
+    count_dict = None if count_tup is None else dict( zip( count_header, count_matrix.rollUpRow( count_tup ) ) )
+    return { constants.EVENT_FILE_KW: file_name, constants.DAEMON_COUNTS_KW: count_dict,
+             constants.DAEMON_ERROR_KW: parse_error, constants.DAEMON_EVENTS_KW: event_list }
+
+
+def analyzeSource( file_name, source_text ):
+    '''
+    getFileResult for source text sent by a client ... the text goes to a temporary file with the extension of file_name,
+    so that notebooks, limits and the cache work as for files on disk. events carry file_name
+    '''
+    file_ext = os.path.splitext( file_name )[1]
+    if file_ext not in constants.ANALYZED_FILE_EXTENSIONS:
+        file_ext = constants.PY_FILE_EXTENSION
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join( temp_dir, constants.DAEMON_SOURCE_STEM + file_ext )
+        with open( temp_file, 'wb' ) as file_:
+            file_.write( source_text.encode( constants.UTF_ENCODING ) )
+        count_tup, parse_error, event_list, file_profile = main.getFileResult( temp_file )
+    if event_list is not None:
+        for event_ in event_list:
+            event_[constants.EVENT_FILE_KW] = file_name
+    return ( count_tup, parse_error, event_list, file_profile )
+
+
+def analyzeDaemonTask( task_ ):
+    '''
+    pool task, ( file name, source text or None ) ... a file that can not be opened or analyzed gets the class of its
+    error as its error, so one bad file does not fail the whole request
+    '''
+    file_name, source_text = task_
+    try:
+        if source_text is None:
+            return main.getFileResult( file_name )
+        return analyzeSource( file_name, source_text )
+    except Exception as err_:
+        return ( None, type( err_ ).__name__, None, None )
+
+
+def getDaemonTasks( request_dict ):
+    '''
+    ( file name, source text or None ) per file of an analyze request, files first ... raises ValueError for a request
+    that is not a list of paths and a list of { name, text } sources
+    '''
+    file_list = request_dict.get( constants.DAEMON_FILES_KW, [] )
+    source_list = request_dict.get( constants.DAEMON_SOURCES_KW, [] )
+    if ( not isinstance( file_list, list ) ) or ( not all( isinstance( file_, str ) for file_ in file_list ) ):
+        raise ValueError( constants.DAEMON_REQUEST_ERROR.format( constants.DAEMON_FILES_KW ) )
+    if ( not isinstance( source_list, list ) ) or ( not all( isinstance( source_, dict ) and \
+           isinstance( source_.get( constants.DAEMON_NAME_KW ), str ) and isinstance( source_.get( constants.DAEMON_TEXT_KW ), str ) \
+           for source_ in source_list ) ):
+        raise ValueError( constants.DAEMON_REQUEST_ERROR.format( constants.DAEMON_SOURCES_KW ) )
+    task_list = [ ( file_, None ) for file_ in file_list ]
+    task_list.extend( ( source_[constants.DAEMON_NAME_KW], source_[constants.DAEMON_TEXT_KW] ) for source_ in source_list )
+    return task_list
+
+
+class AnalysisServer( socketserver.ThreadingMixIn, socketserver.UnixStreamServer ):
+    '''
+    one thread per client connection, all of them feeding the same worker pool ... a client can send any number of
+    requests over its connection
+    '''
+    daemon_threads = True
+
+    def __init__( self, socket_path, pool_, workers, count_header ):
+        self.pool_, self.workers, self.count_header = pool_, workers, count_header
+        socketserver.UnixStreamServer.__init__( self, socket_path, AnalysisHandler )
+
+    def answerRequest( self, request_line ):
+        '''
+        ( response dict, op ) for one request line ... a bad request is answered with its error and does not close the connection
+        '''
+        try:
+            request_dict = json.loads( request_line )
+            if not isinstance( request_dict, dict ):
+                raise ValueError( constants.DAEMON_REQUEST_ERROR.format( constants.DAEMON_OP_KW ) )
+            op_ = request_dict.get( constants.DAEMON_OP_KW, constants.DAEMON_ANALYZE_KW )
+            if op_ not in constants.DAEMON_OP_LIST:
+                raise ValueError( constants.DAEMON_REQUEST_ERROR.format( constants.DAEMON_OP_KW ) )
+            task_list = getDaemonTasks( request_dict ) if op_ == constants.DAEMON_ANALYZE_KW else []
+        except ValueError as err_:
+            return { constants.DAEMON_ERROR_KW: str( err_ ) }, None
+        if op_ != constants.DAEMON_ANALYZE_KW:
+            return { constants.DAEMON_OK_KW: True, constants.DAEMON_WORKERS_KW: self.workers }, op_
+        start_time = time.perf_counter()
+        # map only blocks this client's thread, other clients keep submitting to the pool
+        result_list = self.pool_.map( analyzeDaemonTask, task_list, chunksize = 1 ) if task_list else []
+        FAMEML_LOGGER.info( constants.DAEMON_REQUEST_LOG_KW, len( task_list ), time.perf_counter() - start_time )
+        return { constants.DAEMON_RESULTS_KW: [ getResultRecord( file_name, result_tup, self.count_header )
+                                                for ( file_name, _ ), result_tup in zip( task_list, result_list ) ] }, op_
+
+
+class AnalysisHandler( socketserver.StreamRequestHandler ):
+    def handle( self ):
+        while True:
+            request_line = self.rfile.readline( constants.DAEMON_MAX_REQUEST_BYTES + 1 )
+            if not request_line:
+                return
+            if len( request_line ) > constants.DAEMON_MAX_REQUEST_BYTES:
+                # the rest of the line can not be told apart from the next request
+                self.writeResponse( { constants.DAEMON_ERROR_KW: constants.DAEMON_REQUEST_ERROR.format( constants.DAEMON_MAX_REQUEST_BYTES ) } )
+                return
+            if not request_line.strip():
+                continue
+            response_dict, op_ = self.server.answerRequest( request_line )
+            self.writeResponse( response_dict )
+            if op_ == constants.DAEMON_SHUTDOWN_KW:
+                # handlers run on their own threads, so waiting here for serve_forever to return can not deadlock
+                self.server.shutdown()
+                return
+
+    def writeResponse( self, response_dict ):
+        self.wfile.write( json.dumps( response_dict ).encode( constants.UTF_ENCODING ) + b'\n' )
+
+
+def removeStaleSocket( socket_path ):
+    '''
+    a socket file left behind by a daemon that died is removed ... raises ValueError if a daemon still answers on it
+    '''
+    if not os.path.exists( socket_path ):
+        return
+    with socket.socket( socket.AF_UNIX, socket.SOCK_STREAM ) as client_:
+        try:
+            client_.connect( socket_path )
+        except OSError:
+            os.unlink( socket_path )
+            return
+    raise ValueError( constants.DAEMON_SOCKET_IN_USE.format( socket_path ) )
+
+
+def startDaemon( socket_path, workers = 1, cache_path = None, logging_flag = False, file_limits = None ):
+    '''
+    starts the worker pool and binds socket_path, readable by this user only ... returns the server, see serveDaemon.
+    options are those of main.runFameML, fixed for the life of the daemon. detection events are always sent back
+    '''
+    removeStaleSocket( socket_path )
+    csv_header = constants.CSV_LOGGING_HEADER if logging_flag else constants.CSV_HEADER
+    worker_args = ( cache_path, logging_flag, False, True, False, file_limits )
+    pool_ = multiprocessing.Pool( workers, initializer = main.initPoolWorker, initargs = ( log_pipeline.getWorkerConfig(), ) + worker_args )
+    try:
+        old_umask = os.umask( 0o777 ^ constants.DAEMON_SOCKET_MODE )
+        try:
+            server_ = AnalysisServer( socket_path, pool_, workers, csv_header[2:] )
+        finally:
+            os.umask( old_umask )
+    except BaseException:
+        pool_.terminate()
+        raise
+    FAMEML_LOGGER.info( constants.DAEMON_LISTENING_LOG_KW, socket_path, workers )
+    return server_
+
+
+def stopDaemon( server_ ):
+    '''
+    closes the socket, removes its file and stops the workers
+    '''
+    socket_path = server_.server_address
+    server_.server_close()
+    if os.path.exists( socket_path ):
+        os.unlink( socket_path )
+    server_.pool_.terminate()
+    server_.pool_.join()
+    FAMEML_LOGGER.info( constants.DAEMON_STOPPED_LOG_KW, socket_path )
+
+
+def serveDaemon( socket_path, workers = 1, cache_path = None, logging_flag = False, file_limits = None ):
+    '''
+    serves until a shutdown request, SIGTERM or Ctrl-C, see startDaemon
+    '''
+    server_ = startDaemon( socket_path, workers, cache_path, logging_flag, file_limits )
+    def stopOnSignal( signum, frame ):
+        raise KeyboardInterrupt
+    old_handler = signal.signal( signal.SIGTERM, stopOnSignal )
+    try:
+        server_.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal( signal.SIGTERM, old_handler )
+        stopDaemon( server_ )
+
+
+def requestAnalysis( socket_path, file_list = None, source_dict = None, op_ = constants.DAEMON_ANALYZE_KW ):
+    '''
+    client side: sends one request and returns the response dict ... source_dict maps a file name to its source text
+    '''
+    request_dict = { constants.DAEMON_OP_KW: op_ }
+    if file_list:
+        request_dict[constants.DAEMON_FILES_KW] = [ os.path.abspath( file_ ) for file_ in file_list ]
+    if source_dict:
+        request_dict[constants.DAEMON_SOURCES_KW] = [ { constants.DAEMON_NAME_KW: name_, constants.DAEMON_TEXT_KW: text_ }
+                                                      for name_, text_ in source_dict.items() ]
+    with socket.socket( socket.AF_UNIX, socket.SOCK_STREAM ) as client_:
+        client_.connect( socket_path )
+        client_.sendall( json.dumps( request_dict ).encode( constants.UTF_ENCODING ) + b'\n' )
+        with client_.makefile( 'rb' ) as response_:
+            return json.loads( response_.readline() )
+
+
+if __name__=='__main__':
+    # python analysis_daemon.py SOCKET FILE ... prints the response of a running daemon, see fame-ml daemon
+    print( json.dumps( requestAnalysis( sys.argv[1], sys.argv[2:] ), indent = 1 ) )
@@ -221,13 +221,117 @@ INFO_KW = 'info'
 TF_KW = 'tf'
 
 
+ATTRIB_FUNCS_KW = 'attrib_funcs'
+FUNC_ASSIGNMENTS_KW = 'func_assignments'
+FUNC_DEFINITIONS_KW = 'func_definitions'
+FUNC_ASSIGNMENTS_MULTI_LHS_KW = 'func_assignments_multi_lhs'
+FUNC_ASSIGNMENTS_LABEL_LHS_KW = 'func_assignments_label_lhs'
+EXTRACTOR_LIST = [ATTRIB_FUNCS_KW, FUNC_ASSIGNMENTS_KW, FUNC_DEFINITIONS_KW, FUNC_ASSIGNMENTS_MULTI_LHS_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW]
+
+DATA_LOAD_COUNTA_KW = 'data_load_counta'
+DATA_LOAD_COUNTB_KW = 'data_load_countb'
+DATA_LOAD_COUNTC_KW = 'data_load_countc'
+MODEL_LOAD_COUNTA_KW = 'model_load_counta'
+MODEL_LOAD_COUNTB_KW = 'model_load_countb'
+MODEL_LOAD_COUNTC_KW = 'model_load_countc'
+MODEL_LOAD_COUNTD_KW = 'model_load_countd'
+DATA_DOWNLOAD_COUNTA_KW = 'data_download_counta'
+DATA_DOWNLOAD_COUNTB_KW = 'data_download_countb'
+MODEL_LABEL_COUNTA_KW = 'model_label_counta'
+MODEL_OUTPUT_COUNTA_KW = 'model_output_counta'
+MODEL_OUTPUT_COUNTB_KW = 'model_output_countb'
+DATA_PIPELINE_COUNTA_KW = 'data_pipeline_counta'
+DATA_PIPELINE_COUNTB_KW = 'data_pipeline_countb'
+DATA_PIPELINE_COUNTC_KW = 'data_pipeline_countc'
+ENVIRONMENT_COUNTA_KW = 'environment_counta'
+STATE_OBSERVE_COUNT_KW = 'state_observe_count'
+
 DUMMY_LOG_KW = 'pytorch'
+LOGGING_PRESENT_KW = 'logging_present'
+
+KEYWORD_PATTERN_TEMPLATE = r'(?<!\w)(?:{})(?!\w)'
+KEYWORD_ALTERNATION_KW = '|'
+NFKC_KW = 'NFKC'
+DECODE_REPLACE_KW = 'replace'
 PY_FILE_EXTENSION = '.py'
+NOTEBOOK_FILE_EXTENSION = '.ipynb'
+ANALYZED_FILE_EXTENSIONS = ( PY_FILE_EXTENSION, NOTEBOOK_FILE_EXTENSION )
+NEWLINE_KW = '\n'
+TAB_KW = '\t'
+
+MANIFEST_EXTENSION = '.manifest'
+PARSE_FAILURE_EXTENSION = '.parse_failures.csv'
+PARSE_FAILURE_HEADER = ['REPO_FULL_PATH', 'FILE_FULL_PATH', 'ERROR_CLASS']
+RESUME_MISSING_ERROR = 'can not resume {}: {} of the interrupted run is missing, run without --resume to start over'
+RESUME_HEADER_ERROR = 'can not resume {}: its columns {} differ from the columns of this run {}, use the options of the interrupted run ( e.g. --logging ) or run without --resume'
+PARSE_ERROR_KW = 'parse_error'
+
+RULE_ID_TEMPLATE = '{}/{}/{}'
+RULE_TARGET_TEMPLATE = '{}.{}'
+EVENT_REPO_KW = 'repo'
+EVENT_FILE_KW = 'file'
+EVENT_LINE_KW = 'line'
+EVENT_CATEGORY_KW = 'category'
+EVENT_DETECTOR_KW = 'detector'
+EVENT_RULE_KW = 'rule'
+EVENT_BUFFER_BYTES = 1 << 20
+CONSOLE_HITS_KW = 'hits'
+CONSOLE_SUMMARY_KW = 'summary'
+CONSOLE_NONE_KW = 'none'
+CONSOLE_MODE_LIST = [CONSOLE_HITS_KW, CONSOLE_SUMMARY_KW, CONSOLE_NONE_KW]
+
+GIT_KW = 'git'
+GIT_DIR_FLAG = '-C'
+GIT_REV_PARSE_KW = 'rev-parse'
+GIT_COMMIT_SUFFIX = '^{commit}'
+GIT_HEAD_KW = 'HEAD'
+GIT_DIFF_ARGS = ['diff', '--name-status', '--find-renames', '--relative', '--no-color']
+GIT_ADDED_KW = 'A'
+GIT_DELETED_KW = 'D'
+GIT_RENAMED_KW = 'R'
+GIT_COPIED_KW = 'C'
+GIT_UNCHANGED_RENAME_KW = 'R100'
 ANALYZING_KW = 'Finished Analyzing:'
+CACHE_PURGED_KW = 'Dropped cached results of older rule sets:'
+ANALYZING_LOG_KW = ANALYZING_KW + ' %s'
+CACHE_PURGED_LOG_KW = CACHE_PURGED_KW + ' %s'
+DETECTION_SUMMARY_KW = 'Detections per category:'
+PARSE_FAILURES_KW = 'Files that could not be parsed, see {}:'
+DELTA_SUMMARY_KW = 'Incremental scan finished:'
+DELTA_CHECKOUT_ERROR = '{} must be checked out at {} for an incremental scan'
+DELTA_ANALYZED_KW = 'analyzed'
+DELTA_CARRIED_KW = 'carried_forward'
+DELTA_RENAMED_KW = 'renamed'
+DELTA_DELETED_KW = 'deleted'
 PARSING_ERROR_KW = 'Due to parsing errors skipping file:'
 ASK_INPUT_FROM_USER = 'Please type the directory to your machine learning repository and then hit enter:'
+CLI_DESCRIPTION = 'FAME-ML: detects forensics-relevant events in machine learning repositories'
+WORKERS_HELP = 'number of worker processes used to analyze files (default: 1, serial)'
+POOL_CHUNK_SIZE = 4
+DELTA_HELP = 'only re-analyze .py files changed between two commits of --repo, carrying --prior-csv rows forward'
+DELTA_REPO_HELP = 'repository for --delta, checked out at NEW_COMMIT'
+DELTA_PRIOR_HELP = 'CSV of an earlier run that covers --repo at OLD_COMMIT'
+DELTA_OUTPUT_HELP = 'CSV written by the scan'
+RESUME_HELP = 'skip repos already listed in the manifest of the output CSV and append the rest'
+LOGGING_HELP = 'add a LOGGING_PRESENT column: 1 when a file imports logging and passes the tracked data to a logging call'
+EVENTS_HELP = 'write one JSON line per detection ( repo, file, line, category, detector, rule ) to this file'
+CONSOLE_HELP = 'hits: print every detection, summary: print category totals at the end, none: only progress ( default: summary )'
+LOG_LEVEL_HELP = 'per-subsystem log levels, e.g. fameml.engine=DEBUG,mining=INFO, or one level for all ( default: $FAME_LOG_LEVELS )'
+LOG_FILE_HELP = 'write diagnostics to this file instead of stderr'
+CACHE_HELP = 'SQLite file used to cache per-file results across runs (default: no cache)'
+
+# bump when py_parser extraction changes results, so cached entries get rebuilt 
+CACHE_SCHEMA_VERSION = 3
+CACHE_TIMEOUT_SECONDS = 60
+CACHE_PRAGMA_WAL_SQL = 'PRAGMA journal_mode=WAL'
+CACHE_CREATE_TABLE_SQL = 'CREATE TABLE IF NOT EXISTS file_results ( content_hash TEXT NOT NULL, rule_hash TEXT NOT NULL, counts TEXT NOT NULL, hits TEXT NOT NULL, PRIMARY KEY ( content_hash, rule_hash ) )'
+CACHE_SELECT_SQL = 'SELECT hits FROM file_results WHERE content_hash = ? AND rule_hash = ?'
+CACHE_INSERT_SQL = 'INSERT OR REPLACE INTO file_results ( content_hash, rule_hash, counts, hits ) VALUES ( ?, ?, ?, ? )'
+# entries of the current rules with and without logging presence are both kept, so --logging runs do not purge the others 
+CACHE_PURGE_SQL  = 'DELETE FROM file_results WHERE rule_hash NOT IN ( ?, ? )'
 
 CONSOLE_STR_DISPLAY   = 'Detected {}, at line {}, in {}'
+CONSOLE_CELL_DISPLAY  = '{} [cell {}]'
 CONSOLE_STR_DATA_LOAD = 'DATA_LOAD_EVENT'
 CONSOLE_STR_MODEL_LOAD= 'MODEL_LOAD_EVENT'
 CONSOLE_STR_DATA_DLOAD= 'DATA_DOWNLOAD_EVENT'
@@ -249,4 +353,398 @@ UTF_ENCODING   = 'utf-8'
 
 CSV_HEADER = ['REPO_FULL_PATH','FILE_FULL_PATH','DATA_LOAD_COUNT', 'MODEL_LOAD_COUNT','DATA_DOWNLOAD_COUNT',\
 		'MODEL_LABEL_COUNT','MODEL_OUTPUT_COUNT','DATA_PIPELINE_COUNT','ENVIRONMENT_COUNT',\
-		'STATE_OBSERVE_COUNT', 'TOTAL_EVENT_COUNT']
\ No newline at end of file
+		'STATE_OBSERVE_COUNT', 'TOTAL_EVENT_COUNT']
+LOGGING_PRESENT_COLUMN = 'LOGGING_PRESENT'
+CSV_LOGGING_HEADER = CSV_HEADER + [LOGGING_PRESENT_COLUMN]
+
+
+'''
+FAME-ML rule registry ... lint_engine compiles this into method -> receiver lookups, so adding a rule here needs no code change 
+'''
+DETECTOR_LIST = [DATA_LOAD_COUNTA_KW, DATA_LOAD_COUNTB_KW, DATA_LOAD_COUNTC_KW, MODEL_LOAD_COUNTA_KW, MODEL_LOAD_COUNTB_KW,\
+		MODEL_LOAD_COUNTC_KW, MODEL_LOAD_COUNTD_KW, DATA_DOWNLOAD_COUNTA_KW, DATA_DOWNLOAD_COUNTB_KW, MODEL_LABEL_COUNTA_KW,\
+		MODEL_OUTPUT_COUNTA_KW, MODEL_OUTPUT_COUNTB_KW, DATA_PIPELINE_COUNTA_KW, DATA_PIPELINE_COUNTB_KW, DATA_PIPELINE_COUNTC_KW,\
+		ENVIRONMENT_COUNTA_KW, STATE_OBSERVE_COUNT_KW]
+
+DETECTOR_EVENT_DICT = {
+    DATA_LOAD_COUNTA_KW     : CONSOLE_STR_DATA_LOAD,
+    DATA_LOAD_COUNTB_KW     : CONSOLE_STR_DATA_LOAD,
+    DATA_LOAD_COUNTC_KW     : CONSOLE_STR_DATA_LOAD,
+    MODEL_LOAD_COUNTA_KW    : CONSOLE_STR_MODEL_LOAD,
+    MODEL_LOAD_COUNTB_KW    : CONSOLE_STR_MODEL_LOAD,
+    MODEL_LOAD_COUNTC_KW    : CONSOLE_STR_MODEL_LOAD,
+    MODEL_LOAD_COUNTD_KW    : CONSOLE_STR_MODEL_LOAD,
+    DATA_DOWNLOAD_COUNTA_KW : CONSOLE_STR_DATA_DLOAD,
+    DATA_DOWNLOAD_COUNTB_KW : CONSOLE_STR_DATA_DLOAD,
+    MODEL_LABEL_COUNTA_KW   : CONSOLE_STR_MODEL_LABEL,
+    MODEL_OUTPUT_COUNTA_KW  : CONSOLE_STR_MODEL_OUTPUT,
+    MODEL_OUTPUT_COUNTB_KW  : CONSOLE_STR_MODEL_OUTPUT,
+    DATA_PIPELINE_COUNTA_KW : CONSOLE_STR_PIPELINE,
+    DATA_PIPELINE_COUNTB_KW : CONSOLE_STR_PIPELINE,
+    DATA_PIPELINE_COUNTC_KW : CONSOLE_STR_PIPELINE,
+    ENVIRONMENT_COUNTA_KW   : CONSOLE_STR_REL_ENV,
+    STATE_OBSERVE_COUNT_KW  : CONSOLE_STR_REL_ENV,
+}
+
+# ( detector name, extractor kind, receiver, method, min number of call arguments ) ... receiver is None for extractors without one 
+RULE_LIST = [
+    # data_load_counta, see lint_engine.getDataLoadCount
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, TORCH_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DATA_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, PICKLE_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, JSON_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, NP_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, LATEST_BLOB_KW, DOWNLOAD_TO_FILENAME_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, BLOB_KW, UPLOAD_FROM_FILENAME_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, VISDOM_LOGGER_KW, LOAD_PREVIOUS_VALUES_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, COCO_GT_KW, LOADRES_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, YAML_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, HUB_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DATA_LOADER_FACTORY_KW, GET_DATA_LOADER_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, IO_KW, READ_FILE_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DATASET_KW, TENSOR_SLICE_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, SP_MODEL_KW, LOAD_CAPITAL_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, TAGGING_DATA_LOADER_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, PD_KW, READ_CSV_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, FILES_KW, LOAD_FILES_LIST_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, IBROSA_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DATA_UTILS_KW, LOAD_CELEBA_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DSET_KW, MNIST_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, TARFILE_KW, OPEN_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, AUDIO_KW, LOAD_WAV_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, IMAGE_KW, OPEN_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, REPLAY_BUFFER_KW, LOAD_KW, 0 ),
+    ( DATA_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, H5PY_KW, FILE_KW, 0 ),
+
+    # data_load_countb, see lint_engine.getDataLoadCountb
+    ( DATA_LOAD_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, GET_LOADER_KW, 1 ),
+    ( DATA_LOAD_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, FROM_BUFFER_KW, 1 ),
+
+    # data_load_countc, see lint_engine.getDataLoadCountc
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_RANDOMLY_AUGMENTED_AUDIO_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, _DOWNLOAD_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, OPEN_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_GENERIC_AUDIO_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_AUDIO_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_IMAGE_DATASET_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, DOWNLOAD_FROM_URL_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, GET_RAW_FILES_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_VOCAB_FILE_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_ATTRIBUTE_DATASET_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, READ_H5FILE_KW, 1 ),
+    ( DATA_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_LUA_KW, 1 ),
+
+    # model_load_counta, see lint_engine.getModelLoadCounta
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, DEEP_SPEECH_KW, LOAD_MODEL_PACKAGE_KW, 0 ),
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, MODELS_KW, LOAD_MODEL_KW, 0 ),
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, MODEL_KW, LOAD_STATE_DICT_KW, 0 ),
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, NETWORK_KW, LOAD_NET_KW, 0 ),
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, VGG_KW, LOAD_FROM_NPY_FILE_KW, 0 ),
+    ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, CAFFE_PARSER_KW, READ_CAFFE_MODEL_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, TRAIN_KW, CHECK_POINT_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, TF_HUB_KW, LOAD_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( MODEL_LOAD_COUNTA_KW, ATTRIB_FUNCS_KW, MISC_KW, IMRE_SIZE_KW, 0 ),
+
+    # model_load_countb, see lint_engine.getModelLoadCountb
+    ( MODEL_LOAD_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, PATCH_PATH_KW, 1 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( MODEL_LOAD_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, CAFFE_FUNCTION_KW, 1 ),
+
+    # model_load_countc, see lint_engine.getModelLoadCountc
+    ( MODEL_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_MODEL_KW, 1 ),
+    ( MODEL_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_DECODER_KW, 1 ),
+    ( MODEL_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_PREVIOUS_VALUES_KW, 1 ),
+    ( MODEL_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_PRETRAINED_KW, 1 ),
+    ( MODEL_LOAD_COUNTC_KW, FUNC_DEFINITIONS_KW, None, LOAD_PARAM_KW, 1 ),
+
+    # model_load_countd, see lint_engine.getModelLoadCountd
+    ( MODEL_LOAD_COUNTD_KW, FUNC_ASSIGNMENTS_MULTI_LHS_KW, None, SEQ_LABEL_KW, 1 ),
+    ( MODEL_LOAD_COUNTD_KW, FUNC_ASSIGNMENTS_MULTI_LHS_KW, None, LOAD_CHECKPOINT_KW, 1 ),
+
+    # data_download_counta, see lint_engine.getDataDownLoadCount
+    ( DATA_DOWNLOAD_COUNTA_KW, ATTRIB_FUNCS_KW, WGET_KW, DOWNLOAD_KW, 0 ),
+    ( DATA_DOWNLOAD_COUNTA_KW, ATTRIB_FUNCS_KW, REQUEST_KW, URL_OPEN_KW, 0 ),
+    ( DATA_DOWNLOAD_COUNTA_KW, ATTRIB_FUNCS_KW, MODEL_ZOO_KW, LOAD_URL_KW, 0 ),
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( DATA_DOWNLOAD_COUNTA_KW, ATTRIB_FUNCS_KW, URL_LIB_KW, URL_RETRIEVE_KW, 0 ),
+    ( DATA_DOWNLOAD_COUNTA_KW, ATTRIB_FUNCS_KW, AGENT_KW, LOAD_KW, 0 ),
+
+    # data_download_countb, see lint_engine.getDataDownLoadCountb
+    ( DATA_DOWNLOAD_COUNTB_KW, FUNC_DEFINITIONS_KW, None, PREPARE_URL_IMAGE_KW, 1 ),
+
+    # model_label_counta, see lint_engine.getModelLabelCount
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, READ_H5FILE_KW, 1 ),
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, ARRAY_KW, 1 ),
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, CONVERT_KW, 1 ),
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, AS_TYPE_KW, 1 ),
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, LOAD_DATA_AND_LABELS_KW, 1 ),
+    ( MODEL_LABEL_COUNTA_KW, FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, CREATE_DATASET_KW, 1 ),
+
+    # model_output_counta, see lint_engine.getModelOutputCount
+    # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+    # ( MODEL_OUTPUT_COUNTA_KW, ATTRIB_FUNCS_KW, MODEL_KW, SUMMARY_KW, 0 ),
+    ( MODEL_OUTPUT_COUNTA_KW, ATTRIB_FUNCS_KW, DATA_KW, SHOW_DATA_SUMMARY_KW, 0 ),
+
+    # model_output_countb, see lint_engine.getModelOutputCountb
+    ( MODEL_OUTPUT_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, GET_TENSOR_KW, 1 ),
+    ( MODEL_OUTPUT_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, EVALUATE_KW, 1 ),
+    ( MODEL_OUTPUT_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, EVAL_KW, 0 ),
+
+    # data_pipeline_counta, see lint_engine.getDataPipelineCount
+    ( DATA_PIPELINE_COUNTA_KW, ATTRIB_FUNCS_KW, ARG_PARSE_KW, ARGUMENT_PARSER_KW, 1 ),
+
+    # data_pipeline_countb, see lint_engine.getDataPipelineCountb
+    ( DATA_PIPELINE_COUNTB_KW, FUNC_ASSIGNMENTS_KW, None, TRAIN_EVAL_PIPELINE_CONFIG_KW, 0 ),
+
+    # data_pipeline_countc, see lint_engine.getDataPipelineCountc
+    ( DATA_PIPELINE_COUNTC_KW, FUNC_DEFINITIONS_KW, None, GET_CONFIGS_FROM_PIPELINE_FILE_KW, 1 ),
+
+    # environment_counta, see lint_engine.getEnvironmentCount
+    ( ENVIRONMENT_COUNTA_KW, ATTRIB_FUNCS_KW, WRAPPED_ENV_KW, STEP_KW, 1 ),
+    ( ENVIRONMENT_COUNTA_KW, ATTRIB_FUNCS_KW, ENV_KW, STEP_KW, 1 ),
+    ( ENVIRONMENT_COUNTA_KW, ATTRIB_FUNCS_KW, GYM_KW, MAKE_KW, 1 ),
+
+    # state_observe_count, see lint_engine.getStateObserveCount
+    ( STATE_OBSERVE_COUNT_KW, ATTRIB_FUNCS_KW, ENV_KW, STEP_KW, 1 ),
+
+]
+
+
+'''
+logger names, see log_pipeline.py in the package root 
+'''
+FAMEML_LOGGER_KW = 'fameml'
+ENGINE_LOGGER_KW = 'fameml.engine'
+CACHE_LOGGER_KW  = 'fameml.cache'
+PARSE_ERROR_LOG_KW = 'could not parse %s: %s'
+PREFILTER_SKIP_LOG_KW = 'no rule keyword in %s, skipping the tree walk'
+CACHE_MISS_LOG_KW = 'cache miss for %s'
+
+
+'''
+profiling, see scan_profiler.py 
+'''
+PROFILE_DISCOVER_KW  = 'discover'
+PROFILE_READ_KW      = 'read'
+PROFILE_CACHE_KW     = 'cache'
+PROFILE_PARSE_KW     = 'parse'
+PROFILE_PREFILTER_KW = 'prefilter'
+PROFILE_EXTRACT_KW   = 'extract'
+PROFILE_MATCH_KW     = 'match'
+PROFILE_LOGGING_KW   = 'logging'
+PROFILE_REPORT_KW    = 'report'
+PROFILE_WRITE_KW     = 'write'
+PROFILE_STAGE_LIST = [PROFILE_DISCOVER_KW, PROFILE_READ_KW, PROFILE_CACHE_KW, PROFILE_PARSE_KW, PROFILE_PREFILTER_KW, PROFILE_EXTRACT_KW,\
+		PROFILE_MATCH_KW, PROFILE_LOGGING_KW, PROFILE_REPORT_KW, PROFILE_WRITE_KW]
+PROFILE_FILE_KW       = 'file'
+PROFILE_BYTES_KW      = 'bytes'
+PROFILE_SECONDS_KW    = 'seconds'
+PROFILE_SHARE_KW      = 'share'
+PROFILE_FUNCTION_KW   = 'function'
+PROFILE_FILE_COUNT_KW = 'files'
+PROFILE_FILE_LIST_KW  = 'file_list'
+PROFILE_WALL_KW       = 'wall_seconds'
+PROFILE_STAGES_KW     = 'stages'
+PROFILE_EXTRACTORS_KW = 'extractors'
+PROFILE_DETECTORS_KW  = 'detectors'
+PROFILE_TOP_FILES_KW  = 'top_files'
+PROFILE_NOTE_KW       = 'note'
+PROFILE_NOTE = 'stage, extractor and detector seconds are summed over files, so with several workers they exceed wall_seconds. each extractor walks the tree on its own while profiling, a normal scan shares one walk between them'
+PROFILE_FILES_EXTENSION = '.files.csv'
+PROFILE_FILES_HEADER = ['FILE_FULL_PATH', 'BYTES', 'SECONDS'] + [ stage_.upper() for stage_ in PROFILE_STAGE_LIST ]
+PROFILE_TOP_DEFAULT = 20
+PROFILE_WRITTEN_KW = 'Profile written to:'
+PROFILE_HELP = 'time every stage, extractor and detector per file and write a JSON summary here, with per-file times next to it'
+PROFILE_TOP_HELP = 'number of slowest files listed in the --profile summary ( default: 20 )'
+
+'''
+legacy function behind every extractor kind and detector, named in the profile summary 
+'''
+EXTRACTOR_FUNCTION_DICT = {
+    ATTRIB_FUNCS_KW                : 'py_parser.getPythonAtrributeFuncs',
+    FUNC_ASSIGNMENTS_KW            : 'py_parser.getFunctionAssignments',
+    FUNC_DEFINITIONS_KW            : 'py_parser.getFunctionDefinitions',
+    FUNC_ASSIGNMENTS_MULTI_LHS_KW  : 'py_parser.getFunctionAssignmentsWithMultipleLHS',
+    FUNC_ASSIGNMENTS_LABEL_LHS_KW  : 'py_parser.getLabelAssignments',
+}
+DETECTOR_FUNCTION_DICT = {
+    DATA_LOAD_COUNTA_KW     : 'lint_engine.getDataLoadCount',
+    DATA_LOAD_COUNTB_KW     : 'lint_engine.getDataLoadCountb',
+    DATA_LOAD_COUNTC_KW     : 'lint_engine.getDataLoadCountc',
+    MODEL_LOAD_COUNTA_KW    : 'lint_engine.getModelLoadCounta',
+    MODEL_LOAD_COUNTB_KW    : 'lint_engine.getModelLoadCountb',
+    MODEL_LOAD_COUNTC_KW    : 'lint_engine.getModelLoadCountc',
+    MODEL_LOAD_COUNTD_KW    : 'lint_engine.getModelLoadCountd',
+    DATA_DOWNLOAD_COUNTA_KW : 'lint_engine.getDataDownLoadCount',
+    DATA_DOWNLOAD_COUNTB_KW : 'lint_engine.getDataDownLoadCountb',
+    MODEL_LABEL_COUNTA_KW   : 'lint_engine.getModelLabelCount',
+    MODEL_OUTPUT_COUNTA_KW  : 'lint_engine.getModelOutputCount',
+    MODEL_OUTPUT_COUNTB_KW  : 'lint_engine.getModelOutputCountb',
+    DATA_PIPELINE_COUNTA_KW : 'lint_engine.getDataPipelineCount',
+    DATA_PIPELINE_COUNTB_KW : 'lint_engine.getDataPipelineCountb',
+    DATA_PIPELINE_COUNTC_KW : 'lint_engine.getDataPipelineCountc',
+    ENVIRONMENT_COUNTA_KW   : 'lint_engine.getEnvironmentCount',
+    STATE_OBSERVE_COUNT_KW  : 'lint_engine.getStateObserveCount',
+}
+
+'''
+per-file resource limits, see resource_guard ... a file over a limit is skipped and recorded with the reason as its error class 
+'''
+LIMIT_BYTES_KW = 'max_bytes'
+LIMIT_NODES_KW = 'max_nodes'
+LIMIT_SECONDS_KW = 'max_seconds'
+LIMIT_MEMORY_KW = 'max_memory_mb'
+LIMIT_REASON_DICT = {
+    LIMIT_BYTES_KW   : 'FileSizeLimit',
+    LIMIT_NODES_KW   : 'NodeCountLimit',
+    LIMIT_SECONDS_KW : 'WallTimeLimit',
+    LIMIT_MEMORY_KW  : 'MemoryLimit',
+}
+LIMIT_REASON_LIST = list( LIMIT_REASON_DICT.values() )
+PROCESS_LIMIT_KW_LIST = [LIMIT_SECONDS_KW, LIMIT_MEMORY_KW]
+LIMIT_NAME_SEPARATOR = ', '
+LIMIT_MESSAGE_TEMPLATE = '{} over the limit of {}'
+MEGA_BYTES = 1 << 20
+PROC_STATM_PATH = '/proc/self/statm'
+PAGE_SIZE_KW = 'SC_PAGE_SIZE'
+FILE_SKIPPED_LOG_KW = 'Skipped %s: %s'
+LIMITS_IGNORED_LOG_KW = '%s only apply in worker processes, ignored without --workers above 1'
+FILE_SKIPS_KW = 'Files skipped by resource limits, see {}:'
+MAX_BYTES_HELP = 'skip files larger than this many bytes'
+MAX_NODES_HELP = 'skip files whose syntax tree has more than this many nodes'
+MAX_SECONDS_HELP = 'skip files whose analysis takes longer than this many seconds, checked between Python steps, so a long parse is bounded by --max-bytes and --max-memory-mb. worker processes only: needs --workers above 1 for scan'
+MAX_MEMORY_HELP = 'skip files whose analysis needs more than this many MB of extra memory. worker processes only: needs --workers above 1 for scan'
+
+'''
+notebooks, see notebook_reader ... only code cells are analyzed, cells are numbered from 1 in notebook order 
+'''
+NOTEBOOK_CELLS_KW = 'notebook_cells'
+NOTEBOOK_CELL_LIST_KW = b'cells'
+NOTEBOOK_WORKSHEETS_KW = b'worksheets'
+NOTEBOOK_CELL_TYPE_KW = b'cell_type'
+NOTEBOOK_SOURCE_KW_LIST = [ b'source', b'input' ]
+NOTEBOOK_CODE_CELL_KW = 'code'
+NOTEBOOK_CELL_MAGIC_KW = '%%'
+NOTEBOOK_MAGIC_PREFIXES = ( '%', '!' )
+NOTEBOOK_MAGIC_STAND_IN = 'pass'
+NOTEBOOK_TOKEN_PATTERN = rb'[ \t\r\n]*(?:(")|([\[\]{}:,])|([^ \t\r\n\[\]{}:,"]+))'
+NOTEBOOK_STRING_TAIL_PATTERN = rb'[^"\\]*(?:\\.[^"\\]*)*"'
+NOTEBOOK_FORMAT_ERROR = 'not a notebook, {} at byte {}'
+EVENT_CELL_KW = 'cell'
+
+'''
+analysis daemon, see analysis_daemon.py ... one JSON request per line in, one JSON response per line out 
+'''
+DAEMON_OP_KW       = 'op'
+DAEMON_ANALYZE_KW  = 'analyze'
+DAEMON_PING_KW     = 'ping'
+DAEMON_SHUTDOWN_KW = 'shutdown'
+DAEMON_OP_LIST     = [DAEMON_ANALYZE_KW, DAEMON_PING_KW, DAEMON_SHUTDOWN_KW]
+DAEMON_FILES_KW    = 'files'
+DAEMON_SOURCES_KW  = 'sources'
+DAEMON_NAME_KW     = 'name'
+DAEMON_TEXT_KW     = 'text'
+DAEMON_RESULTS_KW  = 'results'
+DAEMON_COUNTS_KW   = 'counts'
+DAEMON_EVENTS_KW   = 'events'
+DAEMON_ERROR_KW    = 'error'
+DAEMON_OK_KW       = 'ok'
+DAEMON_WORKERS_KW  = 'workers'
+DAEMON_SOURCE_STEM = 'source'
+DAEMON_SOCKET_MODE = 0o600
+DAEMON_MAX_REQUEST_BYTES = 64 << 20
+DAEMON_REQUEST_ERROR = 'bad request: {}'
+DAEMON_SOCKET_IN_USE = 'a daemon is already listening on {}'
+DAEMON_LISTENING_LOG_KW = 'analysis daemon listening on %s with %s workers'
+DAEMON_STOPPED_LOG_KW = 'analysis daemon on %s stopped'
+DAEMON_REQUEST_LOG_KW = 'analyzed %s files for a client in %.3f seconds'
+
+'''
+fame-ml command line, see fame_ml.py ... report and stats read the CSV of a scan 
+'''
+CLI_PROG = 'fame-ml'
+CLI_SCAN_KW = 'scan'
+CLI_REPORT_KW = 'report'
+CLI_STATS_KW = 'stats'
+CLI_DAEMON_KW = 'daemon'
+SCAN_HELP = 'analyze every repo under INPUT_DIR, or only the files a --delta changed'
+REPORT_HELP = 'per-category detections and share of files with at least one detection, from the CSV of a scan'
+STATS_HELP = 'repo, file, line and parse failure counts of the CSV of a scan'
+DAEMON_CMD_HELP = 'keep the engine warm and serve analysis requests on a Unix socket, see analysis_daemon.py'
+INPUT_DIR_HELP = 'directory with one sub-directory per repo'
+RESULT_CSV_HELP = 'CSV written by fame-ml scan'
+SOCKET_HELP = 'path of the Unix socket to listen on'
+REPORT_OUTPUT_HELP = 'also write one row per repo and category ( REPO_NAME, TOTAL_FILES, CATEGORY, ATLEASTONE, PROP_VAL ) to this CSV'
+SCAN_INPUT_ERROR = 'scan needs INPUT_DIR and --output-csv, or --delta OLD_COMMIT NEW_COMMIT with --repo, --prior-csv and --output-csv'
+DELTA_OPTION_ERROR = '--delta rewrites the whole CSV in one process and does not support {}'
+DELTA_OPTION_SEPARATOR = ', '
+STARTED_AT_KW = 'Started at:'
+ENDED_AT_KW = 'Ended at:'
+DURATION_KW = 'Duration: {} minutes'
+BANNER_WIDTH = 100
+REPORT_CATEGORY_DISPLAY = 'CATEGORY:{}, TOTAL_EVENT_COUNT:{}, ATLEASTONE:{}, PROP_VAL:{}'
+REPORT_HEADER = ['REPO_NAME', 'TOTAL_FILES', 'CATEGORY', 'ATLEASTONE', 'PROP_VAL']
+REPORT_WRITTEN_KW = 'Per-repo report written to:'
+STATS_REPO_COUNT_KW = 'REPO_COUNT'
+STATS_FILE_COUNT_KW = 'ALL_FILE_COUNT'
+STATS_FILE_SIZE_KW = 'ALL_FILE_SIZE'
+STATS_MISSING_KW = 'MISSING_FILE_COUNT'
+STATS_PARSE_FAILURE_KW = 'PARSE_FAILURE_COUNT'
+STATS_LIMIT_SKIP_KW = 'LIMIT_SKIP_COUNT'
+STATS_KW_LIST = [STATS_REPO_COUNT_KW, STATS_FILE_COUNT_KW, STATS_FILE_SIZE_KW, STATS_MISSING_KW, STATS_PARSE_FAILURE_KW, STATS_LIMIT_SKIP_KW]
+
+'''
+corpus-wide deduplication, see content_dedup.py ... byte-identical files are analyzed once per run 
+'''
+DEDUP_BLOBS_KW        = 'blobs'
+DEDUP_COPIES_KW       = 'copies'
+DEDUP_FILES_KW        = 'files'
+DEDUP_UNIQUE_KW       = 'unique_blobs'
+DEDUP_RATIO_KW        = 'dedup_ratio'
+DEDUP_HASH_SECONDS_KW = 'hash_seconds'
+DEDUP_SAVED_SECONDS_KW = 'saved_seconds'
+DEDUP_SUMMARY_KW = 'Deduplication:'
+DEDUP_HELP = 'hash file contents while listing files, analyze byte-identical files once and copy the result to every path'
+
+'''
+result matrix, see count_matrix.py ... one uint32 row per file with the counts of DETECTOR_LIST, rolled up into the 
+CSV count columns. repos with fewer files than COUNT_MATRIX_MIN_ROWS are rolled up one row at a time, importing numpy 
+costs more than their rows 
+'''
+COUNT_MATRIX_DTYPE      = 'uint32'
+COUNT_TOTAL_DTYPE       = 'uint64'
+COUNT_MATRIX_CHUNK_ROWS = 4096
+COUNT_MATRIX_MIN_ROWS   = 4096
+
+'''
+scheduled runs, see main.getScheduledTasks ... one 4-byte repo index, file index and task position and one 8-byte size per file 
+'''
+TASK_INDEX_TYPECODE = 'I'
+TASK_SIZE_TYPECODE  = 'Q'
+# one detector group per count column of CSV_HEADER ... model feature (3.1), model label b (3.2b), model output c (3.3c), 
+# data pipeline d (4.4), environment b (5.1b) and DNN decision (6.2) are skipped as per 
+# https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
+CATEGORY_DETECTOR_LIST = [
+    [DATA_LOAD_COUNTA_KW, DATA_LOAD_COUNTB_KW, DATA_LOAD_COUNTC_KW],
+    [MODEL_LOAD_COUNTA_KW, MODEL_LOAD_COUNTB_KW, MODEL_LOAD_COUNTC_KW, MODEL_LOAD_COUNTD_KW],
+    [DATA_DOWNLOAD_COUNTA_KW, DATA_DOWNLOAD_COUNTB_KW],
+    [MODEL_LABEL_COUNTA_KW],
+    [MODEL_OUTPUT_COUNTA_KW, MODEL_OUTPUT_COUNTB_KW],
+    [DATA_PIPELINE_COUNTA_KW, DATA_PIPELINE_COUNTB_KW, DATA_PIPELINE_COUNTC_KW],
+    [ENVIRONMENT_COUNTA_KW],
+    [STATE_OBSERVE_COUNT_KW],
+    # TOTAL_EVENT_COUNT, total security-related logging event count 
+    DETECTOR_LIST,
+]
+
+'''
+columnar output, see result_table.py in the package root 
+'''
+COLUMNAR_HELP = 'also write the results as Parquet ( .parquet ) or Arrow IPC ( .arrow, .feather ) with dictionary-encoded repo paths, needs pyarrow'
+COLUMNAR_WRITTEN_KW = 'Columnar results written to:'
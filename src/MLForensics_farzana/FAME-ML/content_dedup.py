@@ -0,0 +1,105 @@
+'''
+Corpus-wide content deduplication for FAME-ML
+Vendored libraries, forks and copied notebooks put the same bytes under many paths. Files are hashed while they are
+listed, each distinct blob is analyzed once per run and its result is copied to every path that has the same content
+'''
+
+import time
+import constants
+import result_cache
+
+
+def newDedupState():
+    '''
+    per-run state ... blobs maps a blob key to its analyzed result ( serial runs ) or to its first file ( scheduled runs ),
+    copies maps the first file of a blob to the files waiting for its result
+    '''
+    return { constants.DEDUP_BLOBS_KW: {}, constants.DEDUP_COPIES_KW: {}, constants.DEDUP_FILES_KW: 0, constants.DEDUP_UNIQUE_KW: 0,
+             constants.DEDUP_HASH_SECONDS_KW: 0.0, constants.DEDUP_SAVED_SECONDS_KW: 0.0 }
+
+
+def getBlobKey( py_file ):
+    '''
+    ( content hash, is a notebook ) ... the same bytes are analyzed differently as a notebook and as a .py file.
+    None for a file that can not be read, which is then analyzed on its own and fails as it would without deduplication
+    '''
+    try:
+        content_hash = result_cache.getContentHash( py_file )
+    except OSError:
+        return None
+    return ( content_hash, py_file.endswith( constants.NOTEBOOK_FILE_EXTENSION ) )
+
+
+def getBlobKeys( dedup_state, file_list ):
+    start_time = time.perf_counter()
+    key_list = [ getBlobKey( py_file ) for py_file in file_list ]
+    dedup_state[constants.DEDUP_FILES_KW] += len( file_list )
+    dedup_state[constants.DEDUP_HASH_SECONDS_KW] += time.perf_counter() - start_time
+    return key_list
+
+
+def getCopyResult( result_tup, py_file ):
+    '''
+    the result of a blob for another file with the same content ... events carry py_file, there is no profile since
+    the copy took no analysis time
+    '''
+    count_tup, parse_error, event_list, _ = result_tup
+    if event_list is not None:
+        event_list = [ { **event_, constants.EVENT_FILE_KW: py_file } for event_ in event_list ]
+    return ( count_tup, parse_error, event_list, None )
+
+
+def iterDedupResults( dedup_state, file_list, timed_result_func ):
+    '''
+    serial runs: yields the result of every file of file_list in order, analyzing each blob once per run ...
+    timed_result_func gives ( result, seconds ) for a file, see main.getTimedFileResult. results are kept for the rest
+    of the run, so a copy in a later repo is not analyzed either
+    '''
+    blob_dict = dedup_state[constants.DEDUP_BLOBS_KW]
+    for py_file, blob_key in zip( file_list, getBlobKeys( dedup_state, file_list ) ):
+        if blob_key in blob_dict:
+            result_tup, blob_seconds = blob_dict[blob_key]
+            dedup_state[constants.DEDUP_SAVED_SECONDS_KW] += blob_seconds
+            yield getCopyResult( result_tup, py_file )
+            continue
+        result_tup, blob_seconds = timed_result_func( py_file )
+        dedup_state[constants.DEDUP_UNIQUE_KW] += 1
+        if blob_key is not None:
+            blob_dict[blob_key] = ( result_tup[:3] + ( None, ), blob_seconds )
+        yield result_tup
+
+
+def addBlobFile( dedup_state, blob_key, file_position ):
+    '''
+    scheduled runs: True if file_position, ( repo index, file index, file ), is the first file of its blob and has to be
+    analyzed ... otherwise it waits for the result of that first file, see popCopies
+    '''
+    if blob_key is None:
+        dedup_state[constants.DEDUP_UNIQUE_KW] += 1
+        return True
+    first_position = dedup_state[constants.DEDUP_BLOBS_KW].setdefault( blob_key, file_position )
+    if first_position is file_position:
+        dedup_state[constants.DEDUP_UNIQUE_KW] += 1
+        return True
+    dedup_state[constants.DEDUP_COPIES_KW].setdefault( first_position[:2], [] ).append( file_position )
+    return False
+
+
+def popCopies( dedup_state, repo_index, file_index, blob_seconds ):
+    '''
+    scheduled runs: the ( repo index, file index, file ) copies of a first file whose result took blob_seconds
+    '''
+    copy_list = dedup_state[constants.DEDUP_COPIES_KW].pop( ( repo_index, file_index ), [] )
+    dedup_state[constants.DEDUP_SAVED_SECONDS_KW] += blob_seconds * len( copy_list )
+    return copy_list
+
+
+def getDedupSummary( dedup_state ):
+    '''
+    files, distinct blobs, files per blob, seconds spent hashing and analysis seconds the copies did not take
+    '''
+    file_count, unique_count = dedup_state[constants.DEDUP_FILES_KW], dedup_state[constants.DEDUP_UNIQUE_KW]
+    return { constants.DEDUP_FILES_KW: file_count, constants.DEDUP_UNIQUE_KW: unique_count,
+             constants.DEDUP_RATIO_KW: round( file_count / unique_count, 3 ) if unique_count > 0 else 1.0,
+             constants.DEDUP_HASH_SECONDS_KW: round( dedup_state[constants.DEDUP_HASH_SECONDS_KW], 3 ),
+             constants.DEDUP_SAVED_SECONDS_KW: round( dedup_state[constants.DEDUP_SAVED_SECONDS_KW], 3 ) }
@@ -0,0 +1,94 @@
+'''
+Result matrix for FAME-ML
+Per-file detector counts of a large repo are kept in one preallocated NumPy uint32 matrix that grows in chunks, 4 bytes
+per count instead of a tuple of int objects per file. The CSV count columns and the run totals are matrix reductions.
+numpy is imported only when a matrix is built, so small scans and --help do not pay for it, see collectRepoResults in main.py
+'''
+
+import constants
+
+
+'''
+matrix width -> column indices of every CSV count column, see getCategoryGroups
+'''
+CATEGORY_GROUP_CACHE = {}
+
+
+class CountMatrix:
+    '''
+    rows x width counts ... capacity is allocated up front and grows by constants.COUNT_MATRIX_CHUNK_ROWS rows
+    '''
+
+    def __init__( self, width, capacity = 0 ):
+        import numpy
+        self.numpy, self.width, self.rows = numpy, width, 0
+        self.counts_ = numpy.zeros( ( capacity, width ), dtype = constants.COUNT_MATRIX_DTYPE )
+
+    def addCapacity( self, row_count ):
+        chunk_ = self.numpy.zeros( ( row_count, self.width ), dtype = constants.COUNT_MATRIX_DTYPE )
+        self.counts_ = self.numpy.concatenate( ( self.counts_, chunk_ ) )
+
+    def __len__( self ):
+        return self.rows
+
+    def appendRow( self, count_tup ):
+        if self.rows == len( self.counts_ ):
+            self.addCapacity( constants.COUNT_MATRIX_CHUNK_ROWS )
+        self.counts_[self.rows] = count_tup
+        self.rows += 1
+
+    def getRows( self ):
+        '''
+        the filled rows, a view
+        '''
+        return self.counts_[:self.rows]
+
+    def getColumnTotals( self ):
+        return self.getRows().sum( axis = 0, dtype = constants.COUNT_TOTAL_DTYPE ).tolist()
+
+    def iterRows( self ):
+        '''
+        rows as tuples of int, converted in one call
+        '''
+        for row_ in self.getRows().tolist():
+            yield tuple( row_ )
+
+    def rollUp( self, group_list ):
+        '''
+        matrix with one column per list of column indices in group_list, holding the sum of those columns ... one
+        product with a 0/1 matrix that maps every column to its groups
+        '''
+        group_matrix = self.numpy.zeros( ( self.width, len( group_list ) ), dtype = constants.COUNT_MATRIX_DTYPE )
+        for group_index, column_list in enumerate( group_list ):
+            group_matrix[column_list, group_index] = 1
+        rolled_ = CountMatrix( len( group_list ) )
+        rolled_.counts_ = self.getRows() @ group_matrix
+        rolled_.rows = self.rows
+        return rolled_
+
+
+def getCategoryGroups( width ):
+    '''
+    column indices of constants.CATEGORY_DETECTOR_LIST in a row of width counts ... a column past the detectors
+    is the LOGGING_PRESENT flag and is passed through
+    '''
+    if width not in CATEGORY_GROUP_CACHE:
+        detector_index = { detector_: index_ for index_, detector_ in enumerate( constants.DETECTOR_LIST ) }
+        group_list = [ [ detector_index[detector_] for detector_ in detector_list ] for detector_list in constants.CATEGORY_DETECTOR_LIST ]
+        group_list.extend( [ index_ ] for index_ in range( len( constants.DETECTOR_LIST ), width ) )
+        CATEGORY_GROUP_CACHE[width] = group_list
+    return CATEGORY_GROUP_CACHE[width]
+
+
+def rollUpCounts( detector_matrix ):
+    '''
+    the CSV count columns of every row of a matrix of detector counts, see main.getCountTuple
+    '''
+    return detector_matrix.rollUp( getCategoryGroups( detector_matrix.width ) )
+
+
+def rollUpRow( count_tup ):
+    '''
+    CSV count columns of one file, plain sums ... for single files and repos too small to be worth a matrix
+    '''
+    return tuple( sum( count_tup[index_] for index_ in column_list ) for column_list in getCategoryGroups( len( count_tup ) ) )
@@ -0,0 +1,170 @@
+'''
+fame-ml command line: scan, report, stats and daemon
+Only argparse and constants are imported up front, each subcommand imports what it needs when it runs, so --help
+and small scans start fast. pandas is only imported by a --delta scan
+'''
+
+import os
+import sys
+import time
+import argparse
+import constants
+
+# log_pipeline.py and source_reader.py are shared with the mining scripts and live in the package root
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+
+def addLogArguments( parser_ ):
+    # None falls back to $FAME_LOG_LEVELS once log_pipeline is imported, see startLogs
+    parser_.add_argument( '--log-level', default = None, help = constants.LOG_LEVEL_HELP )
+    parser_.add_argument( '--log-file', default = None, help = constants.LOG_FILE_HELP )
+
+
+def addAnalysisArguments( parser_ ):
+    '''
+    options shared by scan and daemon
+    '''
+    parser_.add_argument( '--workers', type = int, default = 1, help = constants.WORKERS_HELP )
+    parser_.add_argument( '--cache', default = None, help = constants.CACHE_HELP )
+    parser_.add_argument( '--logging', action = 'store_true', help = constants.LOGGING_HELP )
+    parser_.add_argument( '--max-bytes', type = int, default = None, help = constants.MAX_BYTES_HELP )
+    parser_.add_argument( '--max-nodes', type = int, default = None, help = constants.MAX_NODES_HELP )
+    parser_.add_argument( '--max-seconds', type = float, default = None, help = constants.MAX_SECONDS_HELP )
+    parser_.add_argument( '--max-memory-mb', type = float, default = None, help = constants.MAX_MEMORY_HELP )
+    addLogArguments( parser_ )
+
+
+def getArgumentParser():
+    parser = argparse.ArgumentParser( prog = constants.CLI_PROG, description = constants.CLI_DESCRIPTION )
+    command_parsers = parser.add_subparsers( dest = 'command', metavar = 'COMMAND', required = True )
+
+    scan_parser = command_parsers.add_parser( constants.CLI_SCAN_KW, help = constants.SCAN_HELP, description = constants.SCAN_HELP )
+    scan_parser.add_argument( 'input_dir', nargs = '?', default = None, metavar = 'INPUT_DIR', help = constants.INPUT_DIR_HELP )
+    scan_parser.add_argument( '--output-csv', '-o', default = None, help = constants.DELTA_OUTPUT_HELP )
+    scan_parser.add_argument( '--resume', action = 'store_true', help = constants.RESUME_HELP )
+    scan_parser.add_argument( '--console', choices = constants.CONSOLE_MODE_LIST, default = constants.CONSOLE_SUMMARY_KW, help = constants.CONSOLE_HELP )
+    scan_parser.add_argument( '--events', default = None, help = constants.EVENTS_HELP )
+    scan_parser.add_argument( '--profile', default = None, help = constants.PROFILE_HELP )
+    scan_parser.add_argument( '--profile-top', type = int, default = constants.PROFILE_TOP_DEFAULT, help = constants.PROFILE_TOP_HELP )
+    scan_parser.add_argument( '--delta', nargs = 2, metavar = ( 'OLD_COMMIT', 'NEW_COMMIT' ), default = None, help = constants.DELTA_HELP )
+    scan_parser.add_argument( '--repo', default = None, help = constants.DELTA_REPO_HELP )
+    scan_parser.add_argument( '--prior-csv', default = None, help = constants.DELTA_PRIOR_HELP )
+    scan_parser.add_argument( '--dedup', action = 'store_true', help = constants.DEDUP_HELP )
+    scan_parser.add_argument( '--columnar', default = None, help = constants.COLUMNAR_HELP )
+    addAnalysisArguments( scan_parser )
+
+    report_parser = command_parsers.add_parser( constants.CLI_REPORT_KW, help = constants.REPORT_HELP, description = constants.REPORT_HELP )
+    report_parser.add_argument( 'result_csv', metavar = 'RESULT_CSV', help = constants.RESULT_CSV_HELP )
+    report_parser.add_argument( '--output', default = None, help = constants.REPORT_OUTPUT_HELP )
+
+    stats_parser = command_parsers.add_parser( constants.CLI_STATS_KW, help = constants.STATS_HELP, description = constants.STATS_HELP )
+    stats_parser.add_argument( 'result_csv', metavar = 'RESULT_CSV', help = constants.RESULT_CSV_HELP )
+
+    daemon_parser = command_parsers.add_parser( constants.CLI_DAEMON_KW, help = constants.DAEMON_CMD_HELP, description = constants.DAEMON_CMD_HELP )
+    daemon_parser.add_argument( 'socket_path', metavar = 'SOCKET', help = constants.SOCKET_HELP )
+    addAnalysisArguments( daemon_parser )
+    return parser
+
+
+def startLogs( cli_args, process_safe ):
+    import log_pipeline
+    level_spec = cli_args.log_level
+    if level_spec is None:
+        level_spec = os.environ.get( log_pipeline.LEVEL_SPEC_ENV, constants.EMPTY_STRING )
+    log_pipeline.startLogPipeline( log_pipeline.parseLevelSpec( level_spec ), cli_args.log_file, process_safe = process_safe )
+
+
+def getFileLimits( cli_args ):
+    import resource_guard
+    return resource_guard.getFileLimits( cli_args.max_bytes, cli_args.max_nodes, cli_args.max_seconds, cli_args.max_memory_mb )
+
+
+def getDeltaConflicts( cli_args ):
+    '''
+    options of a full scan that a --delta scan would ignore ... the LOGGING_PRESENT column follows --prior-csv, and a delta
+    only prints its own summary, so --logging and a --console other than the default are ignored too
+    '''
+    option_list = [ ( '--workers', cli_args.workers != 1 ), ( '--resume', cli_args.resume ), ( '--events', cli_args.events is not None ),
+                    ( '--profile', cli_args.profile is not None ), ( '--dedup', cli_args.dedup ), ( '--logging', cli_args.logging ),
+                    ( '--console', cli_args.console != constants.CONSOLE_SUMMARY_KW ) ]
+    return [ option_ for option_, is_set in option_list if is_set ]
+
+
+def runScan( parser, cli_args ):
+    delta_ready = ( cli_args.repo or cli_args.input_dir ) and cli_args.prior_csv and cli_args.output_csv
+    if ( cli_args.delta is not None and not delta_ready ) or ( cli_args.delta is None and not ( cli_args.input_dir and cli_args.output_csv ) ):
+        parser.error( constants.SCAN_INPUT_ERROR )
+    delta_conflicts = getDeltaConflicts( cli_args ) if cli_args.delta is not None else []
+    if delta_conflicts:
+        parser.error( constants.DELTA_OPTION_ERROR.format( constants.DELTA_OPTION_SEPARATOR.join( delta_conflicts ) ) )
+    import main
+    import log_pipeline
+    startLogs( cli_args, cli_args.workers > 1 )
+    try:
+        start_time = time.time()
+        print( constants.STARTED_AT_KW, main.giveTimeStamp() )
+        print( '*' * constants.BANNER_WIDTH )
+        if cli_args.delta is not None:
+            old_commit, new_commit = cli_args.delta
+            main.runFameMLDelta( cli_args.repo or cli_args.input_dir, old_commit, new_commit, cli_args.prior_csv, cli_args.output_csv,
+                                 cli_args.cache, getFileLimits( cli_args ), cli_args.columnar )
+        else:
+            main.runFameML( cli_args.input_dir, cli_args.output_csv, cli_args.workers, cli_args.cache, cli_args.resume, cli_args.logging,
+                            cli_args.console, cli_args.events, cli_args.profile, cli_args.profile_top, getFileLimits( cli_args ),
+                            cli_args.dedup, cli_args.columnar )
+        print( '*' * constants.BANNER_WIDTH )
+        print( constants.ENDED_AT_KW, main.giveTimeStamp() )
+        print( '*' * constants.BANNER_WIDTH )
+        print( constants.DURATION_KW.format( round( ( time.time() - start_time ) / 60, 5 ) ) )
+        print( '*' * constants.BANNER_WIDTH )
+    finally:
+        log_pipeline.stopLogPipeline()
+
+
+def runReport( cli_args ):
+    import scan_report
+    corpus_list, repo_list = scan_report.getCategoryReport( cli_args.result_csv )
+    for category_, event_count, atleast_one, prop_metric in corpus_list:
+        print( constants.REPORT_CATEGORY_DISPLAY.format( category_, event_count, atleast_one, prop_metric ) )
+    if cli_args.output is not None:
+        scan_report.writeCategoryReport( cli_args.output, repo_list )
+        print( constants.REPORT_WRITTEN_KW, cli_args.output )
+
+
+def runStats( cli_args ):
+    import scan_report
+    stats_dict = scan_report.getDatasetStats( cli_args.result_csv )
+    for stats_kw in constants.STATS_KW_LIST:
+        print( stats_kw + ':', stats_dict[stats_kw] )
+
+
+def runDaemon( cli_args ):
+    import analysis_daemon
+    import log_pipeline
+    # daemon workers are pool workers even when there is only one
+    startLogs( cli_args, True )
+    try:
+        analysis_daemon.serveDaemon( cli_args.socket_path, cli_args.workers, cli_args.cache, cli_args.logging, getFileLimits( cli_args ) )
+    finally:
+        log_pipeline.stopLogPipeline()
+
+
+def main( arg_list = None ):
+    '''
+    runs one subcommand and returns the exit status
+    '''
+    parser = getArgumentParser()
+    cli_args = parser.parse_args( arg_list )
+    if cli_args.command == constants.CLI_SCAN_KW:
+        runScan( parser, cli_args )
+    elif cli_args.command == constants.CLI_REPORT_KW:
+        runReport( cli_args )
+    elif cli_args.command == constants.CLI_STATS_KW:
+        runStats( cli_args )
+    else:
+        runDaemon( cli_args )
+    return 0
+
+
+if __name__=='__main__':
+    sys.exit( main() )
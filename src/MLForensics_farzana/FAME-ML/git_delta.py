@@ -0,0 +1,45 @@
+'''
+Git helpers for incremental FAME-ML scans
+Lists the Python files that changed between two commits of one repository
+'''
+
+import subprocess
+import constants
+
+
+def runGit( repo_dir, arg_list ):
+    output_ = subprocess.check_output( [ constants.GIT_KW, constants.GIT_DIR_FLAG, repo_dir ] + arg_list )
+    return output_.decode( constants.UTF_ENCODING )
+
+
+def getCommitHash( repo_dir, commit_ ):
+    return runGit( repo_dir, [ constants.GIT_REV_PARSE_KW, commit_ + constants.GIT_COMMIT_SUFFIX ] ).strip()
+
+
+def getChangedPythonFiles( repo_dir, old_commit, new_commit ):
+    '''
+    parses `git diff --name-status` between the two commits ... returns a list of ( status letter, old path, new path )
+    with paths relative to repo_dir. old path is None for added files, new path is None for deleted files,
+    renames keep their similarity score in the status ( R100 means the content did not change ). only .py files and 
+    notebooks are listed
+    '''
+    diff_output = runGit( repo_dir, constants.GIT_DIFF_ARGS + [ old_commit, new_commit ] )
+    change_list = []
+    for line_ in diff_output.split( constants.NEWLINE_KW ):
+        if len( line_ ) == 0:
+            continue
+        field_list = line_.split( constants.TAB_KW )
+        status_ = field_list[0]
+        if status_[0] in ( constants.GIT_RENAMED_KW, constants.GIT_COPIED_KW ):
+            old_path, new_path = field_list[1], field_list[2]
+        elif status_[0] == constants.GIT_DELETED_KW:
+            old_path, new_path = field_list[1], None
+        elif status_[0] == constants.GIT_ADDED_KW:
+            old_path, new_path = None, field_list[1]
+        else:
+            old_path, new_path = field_list[1], field_list[1]
+        old_is_py = ( old_path is not None ) and old_path.endswith( constants.ANALYZED_FILE_EXTENSIONS )
+        new_is_py = ( new_path is not None ) and new_path.endswith( constants.ANALYZED_FILE_EXTENSIONS )
+        if old_is_py or new_is_py:
+            change_list.append( ( status_, old_path if old_is_py else None, new_path if new_is_py else None ) )
+    return change_list
@@ -5,383 +5,344 @@ Oct 20, 2020
 Executes the pattern matching and data flow analysis 
 '''
 
+import os
+import re
+import bisect
+import contextlib
+import logging
+import unicodedata
 import py_parser
 import constants 
+import resource_guard 
+import scan_profiler 
+import notebook_reader 
+# py_parser puts the package root on the path 
+import source_reader 
 
-def getDataLoadCount( py_file ):
-    data_load_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.TORCH_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.DATA_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.PICKLE_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.JSON_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.NP_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.LATEST_BLOB_KW ) and (func_name == constants.DOWNLOAD_TO_FILENAME_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.BLOB_KW ) and (func_name == constants.UPLOAD_FROM_FILENAME_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
-        # elif(( class_name == constants.VISDOM_LOGGER_KW ) and (func_name == constants.LOAD_PREVIOUS_VALUES_KW ) ):
-        #     data_load_count += 1 
-        #     # print(def_)
-            
-        elif(( class_name == constants.COCO_GT_KW ) and (func_name == constants.LOADRES_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.YAML_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.HUB_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.DATA_LOADER_FACTORY_KW ) and (func_name == constants.GET_DATA_LOADER_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.IO_KW ) and (func_name == constants.READ_FILE_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.DATASET_KW ) and (func_name == constants.TENSOR_SLICE_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.SP_MODEL_KW ) and (func_name == constants.LOAD_CAPITAL_KW) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.TAGGING_DATA_LOADER_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.PD_KW ) and (func_name == constants.READ_CSV_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-        # elif(( class_name == constants.FILES_KW ) and (func_name == constants.LOAD_FILES_LIST_KW ) ):
-        #     data_load_count += 1 
-            
-        elif(( class_name == constants.IBROSA_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.DATA_UTILS_KW ) and (func_name == constants.LOAD_CELEBA_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.DSET_KW ) and (func_name == constants.MNIST_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.TARFILE_KW ) and (func_name == constants.OPEN_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.AUDIO_KW ) and (func_name == constants.LOAD_WAV_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.IMAGE_KW) and (func_name == constants.OPEN_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-                    
-        elif(( class_name == constants.REPLAY_BUFFER_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.H5PY_KW ) and (func_name == constants.FILE_KW ) ):
-            data_load_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
+'''
+rule index cache ... tuple of enabled detectors -> compiled index 
+'''
+RULE_INDEX_CACHE = {}
 
-    # LOGGING_IS_ON_FLAG = py_parser.checkLogging( py_tree,  func_def_list, 'akond' )
-    # this will be used to check if the file_name passed in as file to read, is logged  
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_load_count) 
-    return data_load_count 
-    
-    
-def getDataLoadCountb( py_file ):
-    data_load_countb = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignments( py_tree ) 
+'''
+keyword prefilter cache ... sorted method names of a rule index -> ( bytes pattern, str pattern ) 
+'''
+KEYWORD_PATTERN_CACHE = {}
 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        
-        if( (func_name == constants.GET_LOADER_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-        
-        elif( (func_name == constants.FROM_BUFFER_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_load_countb) 
-    return data_load_countb 
+ENGINE_LOGGER = logging.getLogger( constants.ENGINE_LOGGER_KW )
 
 
-def getDataLoadCountc( py_file ):
-    data_load_countc = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionDefinitions( py_tree ) 
-    for func_ in func_assign_list:
-        func_name, func_line, func_arg_list = func_ 
-        
-        if( (func_name == constants.LOAD_RANDOMLY_AUGMENTED_AUDIO_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants._DOWNLOAD_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.OPEN_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_GENERIC_AUDIO_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_AUDIO_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_IMAGE_DATASET_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.DOWNLOAD_FROM_URL_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.GET_RAW_FILES_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_VOCAB_FILE_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_ATTRIBUTE_DATASET_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.READ_H5FILE_KW ) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_LUA_KW) and (len(func_arg_list) > 0) ):
-            data_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_LOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_load_countc) 
-    return data_load_countc 
+def compileRuleIndex( rule_list, detector_list = constants.DETECTOR_LIST ):
+    '''
+    compiles the flat rule table into extractor kind -> method -> receiver -> [ ( detector name, min args, rule id ) ] ... 
+    so that matching a call site costs two dict lookups no matter how many rules there are 
+    '''
+    rule_index = {}
+    enabled_detectors = set( detector_list )
+    for detector_name, extractor_, receiver_, method_, min_args in rule_list:
+        if detector_name in enabled_detectors:
+            receiver_dict = rule_index.setdefault( extractor_, {} ).setdefault( method_, {} )
+            rule_id = getRuleId( detector_name, extractor_, receiver_, method_ )
+            receiver_dict.setdefault( receiver_, [] ).append( ( detector_name, min_args, rule_id ) )
+    return rule_index 
 
 
-def getModelLoadCounta( py_file ):
-    model_load_counta = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.DEEP_SPEECH_KW ) and (func_name == constants.LOAD_MODEL_PACKAGE_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-        
-        elif(( class_name == constants.MODELS_KW ) and (func_name == constants.LOAD_MODEL_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.MODEL_KW ) and (func_name == constants.LOAD_STATE_DICT_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.NETWORK_KW ) and (func_name == constants.LOAD_NET_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.VGG_KW ) and (func_name == constants.LOAD_FROM_NPY_FILE_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.CAFFE_PARSER_KW ) and (func_name == constants.READ_CAFFE_MODEL_KW) ):
-            model_load_counta += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md     
-        # elif(( class_name == constants.TRAIN_KW ) and (func_name == constants.CHECK_POINT_KW) ):
-        #     model_load_counta += 1 
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md     
-        # elif(( class_name == constants.TF_HUB_KW ) and (func_name == constants.LOAD_KW) ):
-        #     model_load_counta += 1 
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md     
-        # elif(( class_name == constants.MISC_KW ) and (func_name == constants.IMRE_SIZE_KW) ):
-        #     model_load_counta += 1 
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW )    
-    # print(LOGGING_IS_ON_FLAG, model_load_counta) 
-    return model_load_counta 
+def getRuleId( detector_name, extractor_, receiver_, method_ ):
+    '''
+    stable name of one RULE_LIST row, like data_load_counta/attrib_funcs/torch.load 
+    '''
+    rule_target = method_ if receiver_ is None else constants.RULE_TARGET_TEMPLATE.format( receiver_, method_ )
+    return constants.RULE_ID_TEMPLATE.format( detector_name, extractor_, rule_target )
+
+
+def getRuleIndex( detector_list = constants.DETECTOR_LIST ):
+    detector_key = tuple( detector_list )
+    if detector_key not in RULE_INDEX_CACHE:
+        RULE_INDEX_CACHE[detector_key] = compileRuleIndex( constants.RULE_LIST, detector_key )
+    return RULE_INDEX_CACHE[detector_key]
+
+
+def getKeywordPatterns( rule_index ):
+    '''
+    one compiled alternation over every method name of the rule index, matched as a whole identifier ... 
+    a call site can only hit a rule if its method name is in the source 
+    '''
+    method_key = tuple( sorted( { method_ for method_dict in rule_index.values() for method_ in method_dict } ) )
+    if method_key not in KEYWORD_PATTERN_CACHE:
+        # longest first, so that no name stops the alternation at a shorter prefix 
+        alternation_ = constants.KEYWORD_ALTERNATION_KW.join( re.escape( method_ ) for method_ in sorted( method_key, key = len, reverse = True ) )
+        str_pattern  = constants.KEYWORD_PATTERN_TEMPLATE.format( alternation_ )
+        KEYWORD_PATTERN_CACHE[method_key] = ( re.compile( str_pattern.encode( constants.UTF_ENCODING ), re.ASCII ), re.compile( str_pattern ) )
+    return KEYWORD_PATTERN_CACHE[method_key]
+
+
+def mayMatchRules( source_bytes, rule_index ):
+    '''
+    byte level prefilter, False only when no rule of rule_index can match ... non ASCII sources are NFKC normalized 
+    first, the same way the parser normalizes identifiers 
+    '''
+    bytes_pattern, str_pattern = getKeywordPatterns( rule_index )
+    if source_reader.isAsciiSource( source_bytes ):
+        return bytes_pattern.search( source_bytes ) is not None 
+    try:
+        source_text = source_reader.decodeSource( source_bytes, constants.DECODE_REPLACE_KW )
+    except SyntaxError:
+        # a bad coding cookie only gets here for a file that parsed, so the cookie did not matter 
+        source_text = str( source_bytes, constants.UTF_ENCODING, constants.DECODE_REPLACE_KW )
+    source_text = unicodedata.normalize( constants.NFKC_KW, source_text )
+    return str_pattern.search( source_text ) is not None 
+
+
+def matchCallSite( extractor_, call_site, method_dict, hit_dict ):
+    '''
+    looks the call site up by method name and then receiver ... ( line, rule id ) of hits go to hit_dict[detector name] 
+    '''
+    if extractor_ == constants.ATTRIB_FUNCS_KW:
+        receiver_, func_name, func_line, arg_call_list = call_site 
+    elif extractor_ == constants.FUNC_DEFINITIONS_KW:
+        func_name, func_line, arg_call_list = call_site 
+        receiver_ = None 
+    else:
+        lhs, func_name, func_line, arg_call_list = call_site 
+        receiver_ = None 
+    receiver_dict = method_dict.get( func_name )
+    if receiver_dict is not None:
+        for detector_name, min_args, rule_id in receiver_dict.get( receiver_, () ):
+            if len(arg_call_list) >= min_args:
+                hit_dict[detector_name].append( ( func_line, rule_id ) )
+
+
+def matchCallSites( extractor_, call_site_list, method_dict, hit_dict ):
+    for call_site in call_site_list:
+        matchCallSite( extractor_, call_site, method_dict, hit_dict )
+
+
+def getCallSiteHits( call_site_dict, rule_index, detector_list ):
+    hit_dict = { detector_name: [] for detector_name in detector_list }
+    for extractor_, method_dict in rule_index.items():
+        matchCallSites( extractor_, call_site_dict[extractor_], method_dict, hit_dict )
+    return hit_dict 
+
+
+def matchCompactCallSite( call_site, method_dict, hit_dict ):
+    '''
+    matchCallSite for a py_parser.CallSite ... rules only look at the argument count 
+    '''
+    receiver_dict = method_dict.get( call_site.func_name )
+    if receiver_dict is not None:
+        for detector_name, min_args, rule_id in receiver_dict.get( call_site.receiver, () ):
+            if call_site.arg_count >= min_args:
+                hit_dict[detector_name].append( ( call_site.line, rule_id ) )
+
+
+def getStreamedCallSiteHits( call_site_iter, rule_index, detector_list ):
+    '''
+    same result as getCallSiteHits for a stream of ( extractor kind, CallSite ) pairs, without keeping the call sites ... 
+    hits are kept per extractor and joined in rule index order so every detector lists its lines in the same order 
+    '''
+    extractor_hit_dict = { extractor_: { detector_name: [] for detector_name in detector_list } for extractor_ in rule_index }
+    for extractor_, call_site in call_site_iter:
+        matchCompactCallSite( call_site, rule_index[extractor_], extractor_hit_dict[extractor_] )
+    hit_dict = { detector_name: [] for detector_name in detector_list }
+    for extractor_ in rule_index:
+        for detector_name in detector_list:
+            hit_dict[detector_name].extend( extractor_hit_dict[extractor_][detector_name] )
+    return hit_dict 
+
+
+def getCellLine( cell_list, func_line ):
+    '''
+    ( cell number, line in the cell ) of a line of the source read from a notebook, see notebook_reader.readNotebookSource 
+    '''
+    cell_index = bisect.bisect_right( cell_list, [ func_line, float( 'inf' ) ] ) - 1 
+    first_line, cell_number = cell_list[cell_index]
+    return cell_number, func_line - first_line + 1 
+
+
+def reportDetectorHits( py_file, hit_dict, detector_list = constants.DETECTOR_LIST, print_flag = False ):
+    '''
+    prints every detection if print_flag is on and returns a dict of detector name -> count ... 
+    notebook detections are printed with their cell and the line in that cell 
+    '''
+    count_dict = {}
+    cell_list = hit_dict.get( constants.NOTEBOOK_CELLS_KW )
+    for detector_name in detector_list:
+        if print_flag:
+            for func_line, _ in hit_dict[detector_name]:
+                display_file = py_file 
+                if cell_list is not None:
+                    cell_number, func_line = getCellLine( cell_list, func_line )
+                    display_file = constants.CONSOLE_CELL_DISPLAY.format( py_file, cell_number )
+                print( constants.CONSOLE_STR_DISPLAY.format( constants.DETECTOR_EVENT_DICT[detector_name], func_line , display_file  ) )
+        count_dict[detector_name] = len( hit_dict[detector_name] )
+    if constants.LOGGING_PRESENT_KW in hit_dict:
+        count_dict[constants.LOGGING_PRESENT_KW] = int( len( hit_dict[constants.LOGGING_PRESENT_KW] ) > 0 )
+    if constants.PARSE_ERROR_KW in hit_dict:
+        count_dict[constants.PARSE_ERROR_KW] = hit_dict[constants.PARSE_ERROR_KW][0]
+    return count_dict 
+
+
+def getDetectionEvents( py_file, hit_dict, detector_list = constants.DETECTOR_LIST ):
+    '''
+    one structured record per detection, in the order reportDetectorHits prints them ... notebook records also 
+    carry the cell, and their line is the line in that cell 
+    '''
+    event_list = []
+    cell_list = hit_dict.get( constants.NOTEBOOK_CELLS_KW )
+    for detector_name in detector_list:
+        category_ = constants.DETECTOR_EVENT_DICT[detector_name]
+        for func_line, rule_id in hit_dict[detector_name]:
+            event_ = { constants.EVENT_FILE_KW: py_file, constants.EVENT_LINE_KW: func_line, constants.EVENT_CATEGORY_KW: category_, 
+                       constants.EVENT_DETECTOR_KW: detector_name, constants.EVENT_RULE_KW: rule_id }
+            if cell_list is not None:
+                event_[constants.EVENT_CELL_KW], event_[constants.EVENT_LINE_KW] = getCellLine( cell_list, func_line )
+            event_list.append( event_ )
+    return event_list 
+
+
+@contextlib.contextmanager
+def openAnalysisSource( py_file ):
+    '''
+    yields ( content to parse, cell list, None ) inside a with block, see source_reader.openSource ... for a notebook the 
+    source of its code cells and the cell list that maps its lines back, see notebook_reader.readNotebookSource. 
+    a notebook that can not be read yields ( None, None, error class name ) 
+    '''
+    if py_file.endswith( constants.NOTEBOOK_FILE_EXTENSION ):
+        try:
+            source_bytes, cell_list = notebook_reader.readNotebookSource( py_file )
+        except ValueError as err_:
+            yield None, None, type( err_ ).__name__ 
+        else:
+            yield source_bytes, cell_list, None 
+    else:
+        with source_reader.openSource( py_file ) as source_bytes:
+            yield source_bytes, None, None 
+
+
+def getProfiledCallSiteHits( py_tree, rule_index, detector_list, file_profile, mark_stage ):
+    '''
+    getStreamedCallSiteHits for a profiled scan ... each extractor walks the tree on its own so that its time can be told 
+    apart, and each detector is matched against the call sites of an extractor on its own. hits come out in the same 
+    order as the single walk 
+    '''
+    hit_dict = { detector_name: [] for detector_name in detector_list }
+    for extractor_ in rule_index:
+        call_site_list = [ call_site for _, call_site in py_parser.iterCompactCallSites( py_tree, [ extractor_ ] ) ]
+        scan_profiler.addNamedTime( file_profile, constants.PROFILE_EXTRACTORS_KW, extractor_, mark_stage( constants.PROFILE_EXTRACT_KW ) )
+        for detector_name in detector_list:
+            method_dict = getRuleIndex( [ detector_name ] ).get( extractor_ )
+            if method_dict is None:
+                continue
+            for call_site in call_site_list:
+                matchCompactCallSite( call_site, method_dict, hit_dict )
+            scan_profiler.addNamedTime( file_profile, constants.PROFILE_DETECTORS_KW, detector_name, mark_stage( constants.PROFILE_MATCH_KW ) )
+    return hit_dict 
+
+
+def getDetectorHits( py_file, detector_list = constants.DETECTOR_LIST, logging_flag = False, file_limits = None, file_profile = None ):
+    '''
+    parses py_file once and walks the tree once, matching each call site against every enabled detector as it is found ... 
+    returns a dict of detector name -> list of ( line number, rule id ). with logging_flag the same tree also gives 
+    hit_dict[LOGGING_PRESENT_KW], the lines that log the tracked data. a file that does not parse gets 
+    hit_dict[PARSE_ERROR_KW] = [ error class name ]. a file over one of file_limits raises resource_guard.FileLimitError. 
+    notebooks are analyzed through their code cells, with hit_dict[NOTEBOOK_CELLS_KW] to map lines back to cells. 
+    with a file_profile, see scan_profiler.newFileProfile, the time of every stage, extractor and detector is added to it 
+    '''
+    rule_index = getRuleIndex( detector_list )
+    mark_stage = scan_profiler.getStageClock( file_profile )
+    with resource_guard.guardFile( py_file, file_limits ), openAnalysisSource( py_file ) as ( source_bytes, cell_list, parse_error ):
+        mark_stage( constants.PROFILE_READ_KW )
+        # the parse doubles as the parseability check, so it runs even when the prefilter rules out every hit 
+        if parse_error is None:
+            py_tree, parse_error = source_reader.parseSource( source_bytes )
+        mark_stage( constants.PROFILE_PARSE_KW )
+        if file_profile is not None:
+            file_profile[constants.PROFILE_BYTES_KW] = os.path.getsize( py_file )
+        if parse_error is not None:
+            ENGINE_LOGGER.debug( constants.PARSE_ERROR_LOG_KW, py_file, parse_error )
+            hit_dict = { detector_name: [] for detector_name in detector_list }
+            hit_dict[constants.PARSE_ERROR_KW] = [ parse_error ]
+            return hit_dict 
+        resource_guard.checkNodeCount( py_tree, file_limits )
+        rules_wanted   = mayMatchRules( source_bytes, rule_index )
+        # logging presence needs a logging import, so the name must appear somewhere 
+        logging_wanted = logging_flag and ( source_bytes.find( constants.LOGGING_KW.encode( constants.UTF_ENCODING ) ) >= 0 )
+        mark_stage( constants.PROFILE_PREFILTER_KW )
+        if not rules_wanted:
+            ENGINE_LOGGER.debug( constants.PREFILTER_SKIP_LOG_KW, py_file )
+            hit_dict = { detector_name: [] for detector_name in detector_list }
+        elif file_profile is None:
+            call_site_iter = py_parser.iterCompactCallSites( py_tree, list( rule_index ) )
+            hit_dict = getStreamedCallSiteHits( call_site_iter, rule_index, detector_list )
+        else:
+            hit_dict = getProfiledCallSiteHits( py_tree, rule_index, detector_list, file_profile, mark_stage )
+        if logging_flag:
+            hit_dict[constants.LOGGING_PRESENT_KW] = py_parser.getLoggingLines( py_tree, constants.DUMMY_LOG_KW ) if logging_wanted else []
+            mark_stage( constants.PROFILE_LOGGING_KW )
+        if cell_list is not None:
+            hit_dict[constants.NOTEBOOK_CELLS_KW] = cell_list 
+        return hit_dict 
+
+
+def getDetectorCounts( py_file, detector_list = constants.DETECTOR_LIST, logging_flag = False, print_flag = False ):
+    '''
+    returns a dict of detector name -> count, see getDetectorHits ... LOGGING_PRESENT_KW maps to 0 or 1, 
+    PARSE_ERROR_KW to the error class name of a file that does not parse 
+    '''
+    hit_dict = getDetectorHits( py_file, detector_list, logging_flag )
+    return reportDetectorHits( py_file, hit_dict, detector_list, print_flag )
+
+
+def getDetectorCount( py_file, detector_name, call_site_list = None ):
+    '''
+    count for a single detector ... call_site_list is the already extracted list for the detector's extractor, if any 
+    '''
+    rule_index = getRuleIndex( [ detector_name ] )
+    if call_site_list is None:
+        py_tree = py_parser.getPythonParseObject(py_file)
+        call_site_dict = py_parser.getPythonCallSites( py_tree, list( rule_index ) )
+    else:
+        call_site_dict = { extractor_: call_site_list for extractor_ in rule_index }
+    hit_dict = getCallSiteHits( call_site_dict, rule_index, [ detector_name ] )
+    count_dict = reportDetectorHits( py_file, hit_dict, [ detector_name ] )
+    return count_dict[detector_name] 
+
+
+def getDataLoadCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.DATA_LOAD_COUNTA_KW, func_def_list ) 
     
     
-def getModelLoadCountb( py_file ):
-    model_load_countb = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignments( py_tree ) 
+def getDataLoadCountb( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.DATA_LOAD_COUNTB_KW, func_assign_list ) 
 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        
-        if( (func_name == constants.PATCH_PATH_KW  ) and (len(func_arg_list) > 0) ):
-            model_load_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-        
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md     
-        # elif( (func_name == constants.CAFFE_FUNCTION_KW ) and (len(func_arg_list) > 0) ):
-        #     model_load_countb += 1 
-        #     # print(assign_)
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_load_countb) 
-    return model_load_countb 
+
+def getDataLoadCountc( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.DATA_LOAD_COUNTC_KW, func_assign_list ) 
+
+
+def getModelLoadCounta( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_LOAD_COUNTA_KW, func_def_list ) 
     
     
-def getModelLoadCountc( py_file ):
-    model_load_countc = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionDefinitions( py_tree ) 
-    for func_ in func_assign_list:
-        func_name, func_line, func_arg_list = func_ 
-        
-        if( (func_name == constants.LOAD_MODEL_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-
-        elif( (func_name == constants.LOAD_DECODER_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_PREVIOUS_VALUES_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_PRETRAINED_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-        elif( (func_name == constants.LOAD_PARAM_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_load_countc) 
-    return model_load_countc 
+def getModelLoadCountb( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_LOAD_COUNTB_KW, func_assign_list ) 
     
     
-def getModelLoadCountd( py_file ):
-    model_load_countd = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignmentsWithMultipleLHS( py_tree ) 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        
-        if( (func_name == constants.SEQ_LABEL_KW  ) and (len(func_arg_list) > 0) ):
-            model_load_countd += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-        
-        elif( (func_name == constants.LOAD_CHECKPOINT_KW ) and (len(func_arg_list) > 0) ):
-            model_load_countd += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_load_countd) 
-    return model_load_countd 
+def getModelLoadCountc( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_LOAD_COUNTC_KW, func_assign_list ) 
     
     
-def getDataDownLoadCount( py_file ):
-    data_download_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.WGET_KW ) and (func_name == constants.DOWNLOAD_KW ) ):
-            data_download_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_DLOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.REQUEST_KW ) and (func_name == constants.URL_OPEN_KW ) ):
-            data_download_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_DLOAD, func_line , py_file  ) )
-            
-        elif(( class_name == constants.MODEL_ZOO_KW ) and (func_name == constants.LOAD_URL_KW ) ):
-            data_download_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_DLOAD, func_line , py_file  ) )
-            
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-        # elif(( class_name == constants.URL_LIB_KW  ) and (func_name == constants.URL_RETRIEVE_KW ) ):
-        #     data_download_count += 1 
-            
-        elif(( class_name == constants.AGENT_KW ) and (func_name == constants.LOAD_KW ) ):
-            data_download_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_DLOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_download_count) 
-    return data_download_count 
+def getModelLoadCountd( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_LOAD_COUNTD_KW, func_assign_list ) 
     
     
-def getDataDownLoadCountb( py_file ):
-    data_download_countb = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionDefinitions( py_tree ) 
-    for func_ in func_assign_list:
-        func_name, func_line, func_arg_list = func_ 
-        
-        if( (func_name == constants.PREPARE_URL_IMAGE_KW ) and (len(func_arg_list) > 0) ):
-            data_download_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_DATA_DLOAD, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_download_countb) 
-    return data_download_countb
+def getDataDownLoadCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.DATA_DOWNLOAD_COUNTA_KW, func_def_list ) 
+    
+    
+def getDataDownLoadCountb( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.DATA_DOWNLOAD_COUNTB_KW, func_assign_list ) 
             
             
 def getModelFeatureCount( py_file ):
@@ -400,36 +361,8 @@ def getModelFeatureCount( py_file ):
     return model_feature_count
     
 
-def getModelLabelCount( py_file ):
-    model_label_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignmentsWithMultipleLHS( py_tree ) 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        for var_name in lhs:
-            if ( constants.LABEL_KW in var_name):
-                if( (func_name == constants.READ_H5FILE_KW  ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-                elif( (func_name == constants.ARRAY_KW ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-                elif( (func_name == constants.CONVERT_KW ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-                elif( (func_name == constants.AS_TYPE_KW ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-                elif( (func_name == constants.LOAD_DATA_AND_LABELS_KW ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-                elif( (func_name == constants.CREATE_DATASET_KW ) and (len(func_arg_list) > 0) ):
-                    model_label_count += 1 
-                    print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_LABEL, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_label_count) 
-    return model_label_count 
+def getModelLabelCount( py_file, label_assign_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_LABEL_COUNTA_KW, label_assign_list ) 
     
 
 def getModelLabelCountb( py_file ):
@@ -450,49 +383,12 @@ def getModelLabelCountb( py_file ):
     return model_label_countb 
     
     
-def getModelOutputCount( py_file ):
-    model_output_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        # # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
-        # if(( class_name == constants.MODEL_KW ) and (func_name == constants.SUMMARY_KW ) ):
-        #     model_output_count += 1 
-        #     # print(def_)
-            
-        if(( class_name == constants.DATA_KW ) and (func_name == constants.SHOW_DATA_SUMMARY_KW ) ):
-            model_output_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_OUTPUT, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_output_count) 
-    return model_output_count 
+def getModelOutputCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_OUTPUT_COUNTA_KW, func_def_list ) 
     
 
-def getModelOutputCountb( py_file ):
-    model_output_countb = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignments( py_tree ) 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        
-        if( (func_name == constants.GET_TENSOR_KW ) and (len(func_arg_list) > 0) ):
-            model_output_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_OUTPUT, func_line , py_file  ) )
-            
-        elif( (func_name == constants.EVALUATE_KW ) and (len(func_arg_list) > 0) ):
-            model_output_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_OUTPUT, func_line , py_file  ) )
-                          
-        elif(( func_name == constants.EVAL_KW ) ):
-            model_output_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_MODEL_OUTPUT, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, model_output_countb) 
-    return model_output_countb 
+def getModelOutputCountb( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.MODEL_OUTPUT_COUNTB_KW, func_assign_list ) 
     
     
 def getModelOutputCountc( py_file ):
@@ -524,52 +420,16 @@ def getModelOutputCountc( py_file ):
     return model_output_countc 
     
     
-def getDataPipelineCount( py_file ):
-    data_pipeline_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.ARG_PARSE_KW ) and (func_name == constants.ARGUMENT_PARSER_KW ) and (len(arg_call_list) > 0)):
-            data_pipeline_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_PIPELINE, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_pipeline_count) 
-    return data_pipeline_count 
+def getDataPipelineCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.DATA_PIPELINE_COUNTA_KW, func_def_list ) 
     
     
-def getDataPipelineCountb( py_file ):
-    data_pipeline_countb = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionAssignments( py_tree ) 
-    for assign_ in func_assign_list:
-        lhs, func_name, func_line, func_arg_list = assign_ 
-        
-        if( (func_name == constants.TRAIN_EVAL_PIPELINE_CONFIG_KW ) ):
-            data_pipeline_countb += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_PIPELINE, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_pipeline_countb) 
-    return data_pipeline_countb 
+def getDataPipelineCountb( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.DATA_PIPELINE_COUNTB_KW, func_assign_list ) 
 
 
-def getDataPipelineCountc( py_file ):
-    data_pipeline_countc = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_assign_list  = py_parser.getFunctionDefinitions( py_tree ) 
-    for func_ in func_assign_list:
-        func_name, func_line, func_arg_list = func_ 
-        
-        if( (func_name == constants.GET_CONFIGS_FROM_PIPELINE_FILE_KW ) and (len(func_arg_list) > 0) ):
-            data_pipeline_countc += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_PIPELINE, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, data_pipeline_countc) 
-    return data_pipeline_countc
+def getDataPipelineCountc( py_file, func_assign_list = None ):
+    return getDetectorCount( py_file, constants.DATA_PIPELINE_COUNTC_KW, func_assign_list ) 
     
 
 def getDataPipelineCountd( py_file ):
@@ -588,28 +448,8 @@ def getDataPipelineCountd( py_file ):
 	return data_pipeline_countd
 	
 
-def getEnvironmentCount( py_file ):
-    environment_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.WRAPPED_ENV_KW ) and (func_name == constants.STEP_KW ) and (len(arg_call_list) > 0)):
-            environment_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_REL_ENV, func_line , py_file  ) )
-            
-        elif(( class_name == constants.ENV_KW ) and (func_name == constants.STEP_KW ) and (len(arg_call_list) > 0)):
-            environment_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_REL_ENV, func_line , py_file  ) )
-            
-        elif(( class_name == constants.GYM_KW ) and (func_name == constants.MAKE_KW ) and (len(arg_call_list) > 0)):
-            environment_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_REL_ENV, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, environment_count) 
-    return environment_count 
+def getEnvironmentCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.ENVIRONMENT_COUNTA_KW, func_def_list ) 
 	
 
 def getEnvironmentCountb( py_file ):
@@ -632,20 +472,8 @@ def getEnvironmentCountb( py_file ):
 	return environment_countb
 	
 
-def getStateObserveCount( py_file ):
-    state_observe_count = 0 
-    py_tree = py_parser.getPythonParseObject(py_file)
-    func_def_list  = py_parser.getPythonAtrributeFuncs( py_tree ) 
-    for def_ in func_def_list:
-        class_name, func_name, func_line, arg_call_list = def_ 
-        
-        if(( class_name == constants.ENV_KW ) and (func_name == constants.STEP_KW ) and (len(arg_call_list) > 0)):
-            state_observe_count += 1 
-            print( constants.CONSOLE_STR_DISPLAY.format( constants.CONSOLE_STR_REL_ENV, func_line , py_file  ) )
-            
-    LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
-    # print(LOGGING_IS_ON_FLAG, state_observe_count) 
-    return state_observe_count 
+def getStateObserveCount( py_file, func_def_list = None ):
+    return getDetectorCount( py_file, constants.STATE_OBSERVE_COUNT_KW, func_def_list ) 
     
     
 def getDNNImportStatus( py_tree ):
@@ -782,4 +610,4 @@ def getIncompleteLoggingCount( py_file ):
 				
 	LOGGING_IS_ON_FLAG = py_parser.checkLoggingPerData( py_tree, constants.DUMMY_LOG_KW ) 
 	# print(LOGGING_IS_ON_FLAG, incomplete_logging_count) 
-	return incomplete_logging_count 
\ No newline at end of file
+	return incomplete_logging_count
@@ -7,11 +7,55 @@ Main executor
 import lint_engine
 import constants 
 import time 
+import array 
 import datetime 
 import os 
-import pandas as pd
+import sys 
+import logging 
 import py_parser 
-import numpy as np 
+import multiprocessing 
+import result_cache 
+import git_delta 
+import result_writer 
+import scan_profiler 
+import resource_guard 
+import content_dedup 
+import count_matrix 
+
+# log_pipeline.py, result_table.py and path_store.py are shared with the mining and empirical scripts and live in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import log_pipeline 
+import result_table 
+import path_store 
+
+FAMEML_LOGGER = logging.getLogger( constants.FAMEML_LOGGER_KW )
+
+'''
+per-process cache state, set by initResultCache ... ( connection, rule set hash ) or None when caching is off 
+'''
+RESULT_CACHE = None 
+
+'''
+per-process switch for the optional LOGGING_PRESENT column, set by initWorkerState 
+'''
+LOGGING_COLUMNS = False 
+
+'''
+per-process output switches, set by initWorkerState ... PRINT_HITS prints every detection, 
+EVENTS_ON sends structured detection events back with the counts 
+'''
+PRINT_HITS = False 
+EVENTS_ON  = False 
+
+'''
+per-process switch for --profile, set by initWorkerState ... every file result then carries its timings, see scan_profiler 
+'''
+PROFILE_ON = False 
+
+'''
+per-process resource limits, set by initWorkerState ... see resource_guard.getFileLimits, None when no limit is set 
+'''
+FILE_LIMITS = None 
 
 
 def giveTimeStamp():
@@ -20,192 +64,426 @@ def giveTimeStamp():
   return strToret
   
 
-def getCSVData(dic_, dir_repo):
-	temp_list = []
-	for TEST_ML_SCRIPT in dic_:
-		# print(constants.ANALYZING_KW + TEST_ML_SCRIPT) 
-		# Section 1.1a
-		data_load_counta = lint_engine.getDataLoadCount( TEST_ML_SCRIPT ) 
-
-		# Section 1.1b
-		data_load_countb = lint_engine.getDataLoadCountb( TEST_ML_SCRIPT ) 
-
-		# Section 1.1c
-		data_load_countc = lint_engine.getDataLoadCountc( TEST_ML_SCRIPT ) 
-
-		# Section 1.2a
-		model_load_counta = lint_engine.getModelLoadCounta( TEST_ML_SCRIPT ) 
-
-		# Section 1.2b
-		model_load_countb = lint_engine.getModelLoadCountb( TEST_ML_SCRIPT ) 
-
-		# Section 1.2c
-		model_load_countc = lint_engine.getModelLoadCountc( TEST_ML_SCRIPT ) 
-
-		# Section 1.2d
-		model_load_countd = lint_engine.getModelLoadCountd( TEST_ML_SCRIPT ) 
-
-		# Section 2.1a
-		data_download_counta = lint_engine.getDataDownLoadCount( TEST_ML_SCRIPT ) 
-
-		# Section 2.1b
-		data_download_countb = lint_engine.getDataDownLoadCountb( TEST_ML_SCRIPT )
-
-		# Section 3.1
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_feature_count = lint_engine.getModelFeatureCount( TEST_ML_SCRIPT ) 
-
-		# Section 3.2a
-		model_label_counta = lint_engine.getModelLabelCount( TEST_ML_SCRIPT ) 
-	
-		# Section 3.2b
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_label_countb = lint_engine.getModelLabelCountb( TEST_ML_SCRIPT ) 
-
-		# Section 3.3a
-		model_output_counta = lint_engine.getModelOutputCount( TEST_ML_SCRIPT ) 
-	
-		# Section 3.3b
-		model_output_countb = lint_engine.getModelOutputCountb( TEST_ML_SCRIPT ) 
-
-		# Section 3.3c
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_output_countc = lint_engine.getModelOutputCountc( TEST_ML_SCRIPT ) 
-
-		# Section 4.1
-		data_pipeline_counta = lint_engine.getDataPipelineCount( TEST_ML_SCRIPT ) 
-
-		# Section 4.2
-		data_pipeline_countb = lint_engine.getDataPipelineCountb( TEST_ML_SCRIPT ) 
-
-		# Section 4.3
-		data_pipeline_countc = lint_engine.getDataPipelineCountc( TEST_ML_SCRIPT ) 
-
-		# Section 4.4
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# data_pipeline_countd = lint_engine.getDataPipelineCountd( TEST_ML_SCRIPT ) 
-
-		# Section 5.1a
-		environment_counta = lint_engine.getEnvironmentCount( TEST_ML_SCRIPT ) 
-
-		# Section 5.1b
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
-		# environment_countb = lint_engine.getEnvironmentCountb( TEST_ML_SCRIPT ) 
-
-		# Section 5.2
-		state_observe_count = lint_engine.getStateObserveCount( TEST_ML_SCRIPT ) 
-
-		# Section 6.2 , skipping as syntax analysis will yield false positives 
-		# dnn_decision_countb = lint_engine.getDNNDecisionCountb( TEST_ML_SCRIPT ) 
-		# the following checks except related blocks 
-
-		# Section 7
-		# except_flag = lint_engine.getExcepts( TEST_ML_SCRIPT ) 
-
-		# Section 8
-		# incomplete_logging_count = lint_engine.getIncompleteLoggingCount( TEST_ML_SCRIPT ) 
-		
-		data_load_count = data_load_counta + data_load_countb + data_load_countc
-		model_load_count = model_load_counta + model_load_countb + model_load_countc + model_load_countd
-		data_download_count = data_download_counta + data_download_countb
-		# model_label_count = model_label_counta + model_label_countb
-		model_label_count = model_label_counta 
-		# model_output_count = model_output_counta + model_output_countb + model_output_countc
-		model_output_count = model_output_counta + model_output_countb 
-		# data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc + data_pipeline_countd
-		data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc 
-		# environment_count = environment_counta + environment_countb
-		environment_count  = environment_counta 
-		# dnn_decision_count = dnn_decision_countb
-		
-		# the_tup = ( dir_repo, TEST_ML_SCRIPT, data_load_count, model_load_count, data_download_count, model_feature_count, \
-  		# 		  model_label_count, model_output_count, data_pipeline_count, environment_count, state_observe_count, \
-  		# 		  dnn_decision_count, incomplete_logging_count, except_flag)
-		'''
-		Total security-related logging event count 
-		'''
-		
-		total_event_count = data_load_count   + model_load_count    + data_download_count + \
-		                    model_label_count + model_output_count  + data_pipeline_count + \
-							environment_count + state_observe_count 
-		
-		the_tup = ( dir_repo, TEST_ML_SCRIPT, data_load_count, model_load_count, data_download_count, \
-  				  model_label_count, model_output_count, data_pipeline_count, environment_count, state_observe_count, total_event_count )
-
-		temp_list.append( the_tup )
-		# print('='*25)
-	return temp_list
+def getFileResult(TEST_ML_SCRIPT):
+	'''
+	( category counts, None, events, profile ) for a file that parses, ( None, error class name, None, profile ) for one that does not, 
+	( None, limit reason, None, profile ) for one skipped by FILE_LIMITS ... events is None unless EVENTS_ON, profile is None 
+	unless PROFILE_ON, then it holds the per-stage, per-extractor and per-detector seconds of the file. kept small so that 
+	pool workers mostly send back a tuple of ints 
+	'''
+	file_profile = scan_profiler.newFileProfile( TEST_ML_SCRIPT ) if PROFILE_ON else None 
+	start_time = time.perf_counter()
+	# one parse and one tree walk feed all detectors, see constants.DETECTOR_LIST 
+	try:
+		if RESULT_CACHE is None:
+			hit_dict = lint_engine.getDetectorHits( TEST_ML_SCRIPT, logging_flag = LOGGING_COLUMNS, file_limits = FILE_LIMITS, file_profile = file_profile ) 
+		else:
+			cache_connection, rule_hash = RESULT_CACHE 
+			hit_dict = result_cache.getCachedDetectorHits( cache_connection, TEST_ML_SCRIPT, rule_hash, logging_flag = LOGGING_COLUMNS, file_limits = FILE_LIMITS, file_profile = file_profile ) 
+	except resource_guard.FileLimitError as err_:
+		FAMEML_LOGGER.warning( constants.FILE_SKIPPED_LOG_KW, TEST_ML_SCRIPT, err_ )
+		return ( None, err_.reason, None, scan_profiler.closeFileProfile( file_profile, start_time ) )
+	mark_stage = scan_profiler.getStageClock( file_profile )
+	count_dict = lint_engine.reportDetectorHits( TEST_ML_SCRIPT, hit_dict, print_flag = PRINT_HITS )
+	if constants.PARSE_ERROR_KW in count_dict:
+		result_tup = ( None, count_dict[ constants.PARSE_ERROR_KW ], None )
+	else:
+		event_list = lint_engine.getDetectionEvents( TEST_ML_SCRIPT, hit_dict ) if EVENTS_ON else None 
+		result_tup = ( getCountTuple( count_dict ), None, event_list )
+	mark_stage( constants.PROFILE_REPORT_KW )
+	return result_tup + ( scan_profiler.closeFileProfile( file_profile, start_time ), )
+
+
+def getTimedFileResult(TEST_ML_SCRIPT):
+	'''
+	( getFileResult, seconds it took ) ... what a deduplicated run saves for every copy of the file, see content_dedup 
+	'''
+	start_time = time.perf_counter()
+	result_tup = getFileResult( TEST_ML_SCRIPT )
+	return result_tup, time.perf_counter() - start_time 
+
+
+def getFileCounts(TEST_ML_SCRIPT):
+	'''
+	per-file category counts, None when the file does not parse 
+	'''
+	count_tup = getFileResult( TEST_ML_SCRIPT )[0] 
+	return None if count_tup is None else count_matrix.rollUpRow( count_tup )
+
+
+def getCountTuple(count_dict):
+	'''
+	per-file counts of every detector, in the order of constants.DETECTOR_LIST ... rolled up into the CSV categories 
+	when the repo's rows are collected, see count_matrix.rollUpCounts 
+	'''
+	count_tup = tuple( count_dict[ detector_ ] for detector_ in constants.DETECTOR_LIST )
+	# Section 8, optional: computed once per file from the same parse 
+	if LOGGING_COLUMNS:
+		count_tup = count_tup + ( count_dict[ constants.LOGGING_PRESENT_KW ], )
+	return count_tup 
+
+
+def collectRepoResults(dir_repo, file_list, result_list, failure_list = None, event_list = None, profile_list = None, total_list = None):
+	'''
+	one row per file that parses ... files that do not are left out and, if failure_list is given, 
+	added to it as ( repo, file, error class name ). detection events go to event_list, file profiles to profile_list, if given. 
+	a repo of constants.COUNT_MATRIX_MIN_ROWS files or more keeps its detector counts in a count_matrix.CountMatrix and 
+	rolls them up into the CSV categories with matrix reductions, a smaller one rolls up each row on its own. 
+	the column totals of the repo are added to total_list, if given 
+	'''
+	matrix_flag = len( file_list ) >= constants.COUNT_MATRIX_MIN_ROWS 
+	detector_matrix, category_list, parsed_list = None, [], []
+	for TEST_ML_SCRIPT, ( count_tup, parse_error, file_events, file_profile ) in zip( file_list, result_list ):
+		if parse_error is None:
+			if not matrix_flag:
+				category_list.append( count_matrix.rollUpRow( count_tup ) )
+			else:
+				if detector_matrix is None:
+					detector_matrix = count_matrix.CountMatrix( len( count_tup ), len( file_list ) )
+				detector_matrix.appendRow( count_tup )
+			parsed_list.append( TEST_ML_SCRIPT )
+		elif failure_list is not None:
+			failure_list.append( ( dir_repo, TEST_ML_SCRIPT, parse_error ) )
+		if ( event_list is not None ) and ( file_events is not None ):
+			event_list.extend( { constants.EVENT_REPO_KW: dir_repo, **event_ } for event_ in file_events )
+		if ( profile_list is not None ) and ( file_profile is not None ):
+			profile_list.append( file_profile )
+	if detector_matrix is None:
+		category_total_list = [ sum( column_ ) for column_ in zip( *category_list ) ]
+	else:
+		category_matrix = count_matrix.rollUpCounts( detector_matrix )
+		category_list, category_total_list = category_matrix.iterRows(), category_matrix.getColumnTotals()
+	if total_list is not None:
+		for index_, count_ in enumerate( category_total_list ):
+			total_list[index_] += count_ 
+	return [ ( dir_repo, TEST_ML_SCRIPT ) + count_tup for TEST_ML_SCRIPT, count_tup in zip( parsed_list, category_list ) ]
+
+
+def getCSVData(dic_, dir_repo, pool_ = None, failure_list = None, event_list = None, profile_list = None, dedup_state = None, total_list = None):
+	if dedup_state is not None:
+		# byte-identical files are analyzed once per run, serially, see content_dedup.iterDedupResults 
+		result_list = content_dedup.iterDedupResults( dedup_state, dic_, getTimedFileResult )
+	elif pool_ is None:
+		result_list = map( getFileResult, dic_ )
+	else:
+		# imap hands results back in input order, so rows match a serial run 
+		result_list = pool_.imap( getFileResult, dic_, chunksize = constants.POOL_CHUNK_SIZE )
+	return collectRepoResults( dir_repo, dic_, result_list, failure_list, event_list, profile_list, total_list )
   
   
 def getAllPythonFilesinRepo(path2dir):
+	'''
+	every .py file and notebook of the repo, sorted, in a path_store.PathStore ... parseability is checked by the analysis 
+	itself, see getFileResult. runFameML keeps one of these per repo for the whole run 
+	'''
 	valid_list = []
 	for root_, dirnames, filenames in os.walk(path2dir):
 		for file_ in filenames:
 			full_path_file = os.path.join(root_, file_) 
 			if( os.path.exists( full_path_file ) ):
-				if (file_.endswith( constants.PY_FILE_EXTENSION ) and (py_parser.checkIfParsablePython( full_path_file ) )   ):
+				if file_.endswith( constants.ANALYZED_FILE_EXTENSIONS ):
 					valid_list.append(full_path_file) 
-	valid_list = np.unique(  valid_list )
-	return valid_list
-
-
-def runFameML(inp_dir, csv_fil):
+	# sorted and unique, as np.unique gave it, without importing numpy for a scan 
+	return path_store.PathStore( sorted( set( valid_list ) ) )
+
+
+def initResultCache(cache_path):
+	'''
+	turns the result cache on ( or off, with None ) for this process ... also the pool initializer, so every worker opens its own connection 
+	'''
+	global RESULT_CACHE 
+	if RESULT_CACHE is not None:
+		RESULT_CACHE[0].close()
+	if cache_path is None:
+		RESULT_CACHE = None 
+	else:
+		RESULT_CACHE = ( result_cache.openResultCache( cache_path ), result_cache.getRuleSetHash( logging_flag = LOGGING_COLUMNS ) )
+
+
+def initWorkerState(cache_path, logging_flag = False, print_hits = False, events_flag = False, profile_flag = False, file_limits = None):
+	'''
+	sets the per-process options of a run 
+	'''
+	global LOGGING_COLUMNS, PRINT_HITS, EVENTS_ON, PROFILE_ON, FILE_LIMITS 
+	LOGGING_COLUMNS = logging_flag 
+	PRINT_HITS      = print_hits 
+	EVENTS_ON       = events_flag 
+	PROFILE_ON      = profile_flag 
+	FILE_LIMITS     = file_limits 
+	initResultCache( cache_path )
+
+
+def initPoolWorker(log_config, *worker_args):
+	'''
+	pool initializer ... joins the log pipeline of the parent, see log_pipeline.getWorkerConfig, turns on the time and memory 
+	limits, which only a worker process enforces, then sets the run options 
+	'''
+	log_pipeline.joinLogPipeline( log_config )
+	resource_guard.enableProcessLimits()
+	initWorkerState( *worker_args )
+
+
+def warnIgnoredLimits(file_limits):
+	'''
+	a serial run analyzes files in the calling process, where resource_guard leaves the time and memory limits off 
+	'''
+	ignored_list = resource_guard.getIgnoredLimits( file_limits )
+	if ignored_list:
+		FAMEML_LOGGER.warning( constants.LIMITS_IGNORED_LOG_KW, constants.LIMIT_NAME_SEPARATOR.join( ignored_list ) )
+
+
+def getFileTaskCounts(task_):
+	repo_index, file_index, TEST_ML_SCRIPT = task_ 
+	result_tup, file_seconds = getTimedFileResult( TEST_ML_SCRIPT )
+	return ( repo_index, file_index, result_tup, file_seconds )
+
+
+def iterTaskFiles(repo_file_list, repo_array, index_array, order_array):
+	for task_position in order_array:
+		repo_index, file_index = repo_array[task_position], index_array[task_position]
+		yield repo_index, file_index, repo_file_list[repo_index][1][file_index]
+
+
+def getScheduledTasks(repo_file_list, dedup_state = None):
+	'''
+	iterator of one ( repo index, file index, file ) task per file of the corpus, largest file first ... repo_file_list is a 
+	list of ( repo, file list ). the schedule is kept as arrays of positions, not as a tuple and a path per file, and each path 
+	is read back from its file list only when the pool takes the task, so the file lists stay in their path_store.PathStore. 
+	with dedup_state, only the first file of every blob is a task, see content_dedup.addBlobFile 
+	'''
+	repo_array  = array.array( constants.TASK_INDEX_TYPECODE )
+	index_array = array.array( constants.TASK_INDEX_TYPECODE )
+	size_array  = array.array( constants.TASK_SIZE_TYPECODE )
+	for repo_index, ( repo_, file_list ) in enumerate( repo_file_list ):
+		key_list = content_dedup.getBlobKeys( dedup_state, file_list ) if dedup_state is not None else None 
+		for file_index, TEST_ML_SCRIPT in enumerate( file_list ):
+			if ( key_list is not None ) and not content_dedup.addBlobFile( dedup_state, key_list[file_index], ( repo_index, file_index, TEST_ML_SCRIPT ) ):
+				continue 
+			repo_array.append( repo_index )
+			index_array.append( file_index )
+			size_array.append( os.path.getsize( TEST_ML_SCRIPT ) )
+	# sorted is stable, files of the same size keep their serial order 
+	order_array = array.array( constants.TASK_INDEX_TYPECODE, sorted( range( len( size_array ) ), key = size_array.__getitem__, reverse = True ) )
+	return iterTaskFiles( repo_file_list, repo_array, index_array, order_array )
+
+
+def iterScheduledCSVData(repo_file_list, pool_, dedup_state = None, total_list = None):
+	'''
+	analyzes every file of every repo on one shared pool queue ... chunksize 1 lets an idle worker take the next 
+	largest pending file, so one giant repo no longer leaves the other workers idle at the end of a run. 
+	yields ( repo index, rows, parse failures, events, file profiles ) in serial order, each repo as soon as it and all repos before it are done. 
+	with dedup_state, a result is also filled in for every copy of the file. category totals go to total_list, see collectRepoResults 
+	'''
+	result_list_per_repo = [ [None] * len( file_list ) for _, file_list in repo_file_list ]
+	pending_list = [ len( file_list ) for _, file_list in repo_file_list ]
+	next_repo = 0 
+	task_list = getScheduledTasks( repo_file_list, dedup_state )
+	for repo_index, file_index, result_tup, file_seconds in pool_.imap_unordered( getFileTaskCounts, task_list, chunksize = 1 ):
+		result_list_per_repo[repo_index][file_index] = result_tup 
+		pending_list[repo_index] -= 1 
+		if dedup_state is not None:
+			for copy_repo, copy_index, copy_file in content_dedup.popCopies( dedup_state, repo_index, file_index, file_seconds ):
+				result_list_per_repo[copy_repo][copy_index] = content_dedup.getCopyResult( result_tup, copy_file )
+				pending_list[copy_repo] -= 1 
+		while ( next_repo < len( repo_file_list ) ) and ( pending_list[next_repo] == 0 ):
+			repo_, file_list = repo_file_list[next_repo]
+			failure_list, event_list, profile_list = [], [], []
+			temp_list = collectRepoResults( repo_, file_list, result_list_per_repo[next_repo], failure_list, event_list, profile_list, total_list )
+			yield next_repo, temp_list, failure_list, event_list, profile_list 
+			result_list_per_repo[next_repo] = None 
+			next_repo += 1 
+	while next_repo < len( repo_file_list ):
+		# trailing repos without any file 
+		yield next_repo, [], [], [], [] 
+		next_repo += 1 
+
+
+def getScheduledCSVData(repo_file_list, pool_):
+	'''
+	rows of iterScheduledCSVData, one list per repo 
+	'''
+	return [ temp_list for _, temp_list, _, _, _ in iterScheduledCSVData( repo_file_list, pool_ ) ]
+
+
+def countLimitSkips(failure_list):
+	'''
+	failures that are files skipped by a resource limit rather than files that do not parse 
+	'''
+	return sum( 1 for _, _, error_ in failure_list if error_ in constants.LIMIT_REASON_LIST )
+
+
+def runFameML(inp_dir, csv_fil, workers = 1, cache_path = None, resume = False, logging_flag = False, 
+              console_mode = constants.CONSOLE_SUMMARY_KW, events_path = None, profile_path = None, profile_top = constants.PROFILE_TOP_DEFAULT, 
+              file_limits = None, dedup = False, columnar_path = None):
+	'''
+	rows are streamed to csv_fil as each repo finishes ... with resume, repos listed in the manifest of csv_fil 
+	are skipped and left out of the returned dict. logging_flag adds the LOGGING_PRESENT column. 
+	console_mode is one of constants.CONSOLE_MODE_LIST, events_path gets one JSON line per detection. 
+	profile_path gets the timing summary with the profile_top slowest files, see scan_profiler.writeScanProfile. 
+	files over file_limits are skipped and listed in the parse failure report with the limit as their error class. 
+	the time and memory limits are enforced only with workers above 1, see resource_guard.enableProcessLimits. 
+	with dedup, byte-identical files are analyzed once and the deduplication summary is printed, see content_dedup. 
+	columnar_path gets the rows of csv_fil as Parquet or Arrow once the scan is done, see result_table.writeResultTable 
+	'''
+	if columnar_path is not None:
+		# fail before the scan, not after it 
+		result_table.checkTableWriter( columnar_path )
+	scan_start = time.perf_counter()
+	scan_profile = scan_profiler.newScanProfile() if profile_path is not None else None 
+	dedup_state = content_dedup.newDedupState() if dedup else None 
 	output_event_dict = {}
-	df_list = [] 
 	list_subfolders_with_paths = [f.path for f in os.scandir(inp_dir) if f.is_dir()]
-	for subfolder in list_subfolders_with_paths: 
-		events_with_dic =  getAllPythonFilesinRepo(subfolder)  
-		if subfolder not in output_event_dict:
-			output_event_dict[subfolder] = events_with_dic
-		temp_list  = getCSVData(events_with_dic, subfolder)
-		df_list    = df_list + temp_list 
-		print(constants.ANALYZING_KW, subfolder)
-		print('-'*50)
-	full_df = pd.DataFrame( df_list ) 
-	# print(full_df.head())
-	full_df.to_csv(csv_fil, header= constants.CSV_HEADER, index=False, encoding= constants.UTF_ENCODING)     
+	csv_header = constants.CSV_LOGGING_HEADER if logging_flag else constants.CSV_HEADER 
+	writer_, completed_set = result_writer.openResultWriter( csv_fil, resume, csv_header, events_path )
+	worker_args = ( cache_path, logging_flag, console_mode == constants.CONSOLE_HITS_KW, events_path is not None, scan_profile is not None, file_limits )
+	failure_count, skip_count = 0, 0 
+	total_list = [ 0 ] * ( len( csv_header ) - 2 )
+	list_subfolders_with_paths = [ subfolder for subfolder in list_subfolders_with_paths if subfolder not in completed_set ]
+	if cache_path is not None:
+		stale_count = result_cache.purgeStaleEntries( cache_path )
+		FAMEML_LOGGER.info( constants.CACHE_PURGED_LOG_KW, stale_count )
+	if workers > 1:
+		discover_start = time.perf_counter()
+		for subfolder in list_subfolders_with_paths: 
+			if subfolder not in output_event_dict:
+				output_event_dict[subfolder] = getAllPythonFilesinRepo(subfolder)  
+		repo_file_list = list( output_event_dict.items() )
+		if scan_profile is not None:
+			scan_profiler.addStageTime( scan_profile, constants.PROFILE_DISCOVER_KW, time.perf_counter() - discover_start )
+		pool_args = ( log_pipeline.getWorkerConfig(), ) + worker_args 
+		with multiprocessing.Pool( workers, initializer = initPoolWorker, initargs = pool_args ) as pool_:
+			for repo_index, temp_list, failure_list, event_list, profile_list in iterScheduledCSVData( repo_file_list, pool_, dedup_state, total_list ):
+				subfolder = repo_file_list[repo_index][0]
+				write_start = time.perf_counter()
+				result_writer.writeRepoRows( writer_, subfolder, temp_list, failure_list, event_list )
+				if scan_profile is not None:
+					scan_profiler.addStageTime( scan_profile, constants.PROFILE_WRITE_KW, time.perf_counter() - write_start )
+					for file_profile in profile_list:
+						scan_profiler.addFileProfile( scan_profile, file_profile )
+				failure_count += len( failure_list )
+				skip_count += countLimitSkips( failure_list )
+				FAMEML_LOGGER.info( constants.ANALYZING_LOG_KW, subfolder )
+	else:
+		initWorkerState( *worker_args )
+		warnIgnoredLimits( file_limits )
+		for subfolder in list_subfolders_with_paths: 
+			discover_start = time.perf_counter()
+			events_with_dic =  getAllPythonFilesinRepo(subfolder)  
+			discover_seconds = time.perf_counter() - discover_start 
+			if subfolder not in output_event_dict:
+				output_event_dict[subfolder] = events_with_dic
+			failure_list, event_list, profile_list = [], [], []
+			temp_list  = getCSVData(events_with_dic, subfolder, failure_list = failure_list, event_list = event_list, profile_list = profile_list, dedup_state = dedup_state, total_list = total_list)
+			write_start = time.perf_counter()
+			result_writer.writeRepoRows( writer_, subfolder, temp_list, failure_list, event_list )
+			if scan_profile is not None:
+				scan_profiler.addStageTime( scan_profile, constants.PROFILE_DISCOVER_KW, discover_seconds )
+				scan_profiler.addStageTime( scan_profile, constants.PROFILE_WRITE_KW, time.perf_counter() - write_start )
+				for file_profile in profile_list:
+					scan_profiler.addFileProfile( scan_profile, file_profile )
+			failure_count += len( failure_list )
+			skip_count += countLimitSkips( failure_list )
+			FAMEML_LOGGER.info( constants.ANALYZING_LOG_KW, subfolder )
+		initWorkerState( None )
+	result_writer.closeResultWriter( writer_ )
+	if columnar_path is not None:
+		write_start = time.perf_counter()
+		result_table.writeResultTable( csv_fil, columnar_path, csv_header )
+		if scan_profile is not None:
+			scan_profiler.addStageTime( scan_profile, constants.PROFILE_WRITE_KW, time.perf_counter() - write_start )
+	if console_mode == constants.CONSOLE_SUMMARY_KW:
+		print( constants.DETECTION_SUMMARY_KW, dict( zip( csv_header[2:], total_list ) ) )
+	if failure_count > skip_count:
+		print( constants.PARSE_FAILURES_KW.format( result_writer.getParseFailurePath( csv_fil ) ), failure_count - skip_count )
+	if skip_count > 0:
+		print( constants.FILE_SKIPS_KW.format( result_writer.getParseFailurePath( csv_fil ) ), skip_count )
+	if columnar_path is not None:
+		print( constants.COLUMNAR_WRITTEN_KW, columnar_path )
+	if dedup_state is not None:
+		print( constants.DEDUP_SUMMARY_KW, content_dedup.getDedupSummary( dedup_state ) )
+	if scan_profile is not None:
+		if dedup_state is not None:
+			# files are hashed while they are listed 
+			scan_profiler.addStageTime( scan_profile, constants.PROFILE_DISCOVER_KW, dedup_state[constants.DEDUP_HASH_SECONDS_KW] )
+		scan_profiler.writeScanProfile( profile_path, scan_profile, time.perf_counter() - scan_start, profile_top )
+		print( constants.PROFILE_WRITTEN_KW, profile_path )
 	return output_event_dict
 
 
-if __name__=='__main__':
-	command_line_flag = False ## after acceptance   
-
-	t1 = time.time()
-	print('Started at:', giveTimeStamp() )
-	print('*'*100 )
-
-	if command_line_flag:
-		dir_path = input(constants.ASK_INPUT_FROM_USER)   
-		dir_path = dir_path.strip() 
-		if(os.path.exists( dir_path ) ):
-			repo_dir    = dir_path 
-			output_file = dir_path.split('/')[-2]
-			output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_' + output_file + '.csv'
-			full_dict  = runFameML(repo_dir, output_csv)
-	else: 
-		repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/GITHUB_REPOS/'
-		output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_GITHUB.csv'
-		full_dict  = runFameML(repo_dir, output_csv)
-
-		# repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/GITLAB_REPOS/'
-		# output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_GITLAB.csv'
-		# full_dict  = runFameML(repo_dir, output_csv)
-
-		# repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/MODELZOO/'
-		# output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_MODELZOO.csv'
-		# full_dict  = runFameML(repo_dir, output_csv)
-		
-		# repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/TEST/'
-		# output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_TEST.csv'
-		# full_dict = runFameML(repo_dir, output_csv)
-
-	print('*'*100 )
-	print('Ended at:', giveTimeStamp() )
-	print('*'*100 )
-	
-	t2 = time.time()
-	time_diff = round( (t2 - t1 ) / 60, 5) 
-	print('Duration: {} minutes'.format(time_diff) )
-	print('*'*100 )
+def runFameMLDelta(repo_dir, old_commit, new_commit, prior_csv, csv_fil, cache_path = None, file_limits = None, columnar_path = None):
+	'''
+	re-analyzes only the .py files changed between old_commit and new_commit and carries the prior_csv rows forward 
+	for everything else ... repo_dir must be checked out at new_commit and spelled as REPO_FULL_PATH in prior_csv. 
+	the LOGGING_PRESENT column is kept if prior_csv has it. files over file_limits are skipped and columnar_path is written, see runFameML 
+	'''
+	if columnar_path is not None:
+		result_table.checkTableWriter( columnar_path )
+	# pandas takes longer to import than a small delta takes to analyze, so only a delta run pays for it 
+	import pandas as pd 
+	if git_delta.getCommitHash( repo_dir, constants.GIT_HEAD_KW ) != git_delta.getCommitHash( repo_dir, new_commit ):
+		raise ValueError( constants.DELTA_CHECKOUT_ERROR.format( repo_dir, new_commit ) )
+	repo_key = os.path.normpath( repo_dir )
+	repo_name = repo_dir 
+	repo_row_dict = {}
+	other_list = []
+	repo_position = None 
+	prior_df = pd.read_csv( prior_csv )
+	logging_flag = constants.LOGGING_PRESENT_COLUMN in prior_df.columns 
+	csv_header = constants.CSV_LOGGING_HEADER if logging_flag else constants.CSV_HEADER 
+	for row_ in prior_df.itertuples( index = False, name = None ):
+		if os.path.normpath( row_[0] ) == repo_key:
+			if repo_position is None:
+				repo_position = len( other_list )
+				repo_name = row_[0]
+			repo_row_dict[ os.path.normpath( row_[1] ) ] = row_ 
+		else:
+			other_list.append( row_ )
+	if repo_position is None:
+		repo_position = len( other_list )
+
+	delta_dict = { constants.DELTA_ANALYZED_KW: 0, constants.DELTA_CARRIED_KW: 0, constants.DELTA_RENAMED_KW: 0, constants.DELTA_DELETED_KW: 0 }
+	analyze_list = []
+	for status_, old_path, new_path in git_delta.getChangedPythonFiles( repo_dir, old_commit, new_commit ):
+		carried_row = None 
+		if old_path is not None:
+			old_key = os.path.normpath( os.path.join( repo_name, old_path ) )
+			if status_.startswith( constants.GIT_COPIED_KW ):
+				carried_row = repo_row_dict.get( old_key )
+			else:
+				carried_row = repo_row_dict.pop( old_key, None )
+		if new_path is None:
+			delta_dict[constants.DELTA_DELETED_KW] += 1 
+			continue 
+		new_full_path = os.path.join( repo_name, new_path )
+		if ( status_ == constants.GIT_UNCHANGED_RENAME_KW ) and ( carried_row is not None ):
+			# pure rename, same content: keep the counts under the new path 
+			repo_row_dict[ os.path.normpath( new_full_path ) ] = ( repo_name, new_full_path ) + tuple( carried_row[2:] )
+			delta_dict[constants.DELTA_RENAMED_KW] += 1 
+		elif os.path.exists( new_full_path ):
+			analyze_list.append( new_full_path )
+	delta_dict[constants.DELTA_CARRIED_KW] = len( repo_row_dict ) - delta_dict[constants.DELTA_RENAMED_KW]
+
+	failure_list = []
+	initWorkerState( cache_path, logging_flag, file_limits = file_limits )
+	warnIgnoredLimits( file_limits )
+	for row_ in getCSVData( analyze_list, repo_name, failure_list = failure_list ):
+		repo_row_dict[ os.path.normpath( row_[1] ) ] = row_ 
+	initWorkerState( None )
+	result_writer.writeParseFailureReport( csv_fil, failure_list )
+	delta_dict[constants.DELTA_ANALYZED_KW] = len( analyze_list ) - len( failure_list )
+
+	repo_list = sorted( repo_row_dict.values(), key = lambda row_: row_[1] )
+	df_list = other_list[:repo_position] + repo_list + other_list[repo_position:]
+	full_df = pd.DataFrame( df_list ) 
+	full_df.to_csv(csv_fil, header= csv_header, index=False, encoding= constants.UTF_ENCODING)     
+	if columnar_path is not None:
+		result_table.writeResultTable( csv_fil, columnar_path, csv_header )
+		print( constants.COLUMNAR_WRITTEN_KW, columnar_path )
+	print( constants.DELTA_SUMMARY_KW, delta_dict )
+	return delta_dict 
 
 
+if __name__=='__main__':
+	# the command line lives in fame_ml.py, python main.py ARGS is the same as fame-ml scan ARGS 
+	import fame_ml 
+	sys.exit( fame_ml.main( [ constants.CLI_SCAN_KW ] + sys.argv[1:] ) )
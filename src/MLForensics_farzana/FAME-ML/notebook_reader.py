@@ -0,0 +1,130 @@
+'''
+Streaming code cell extraction for Jupyter notebooks
+The notebook JSON is walked token by token over source_reader.openSource, which memory-maps large files, so embedded
+outputs are stepped over without being loaded
+'''
+
+import re
+import os
+import sys
+import json
+import constants
+
+# source_reader.py is shared with the mining scripts and lives in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import source_reader 
+
+TOKEN_REGEX       = re.compile( constants.NOTEBOOK_TOKEN_PATTERN )
+STRING_TAIL_REGEX = re.compile( constants.NOTEBOOK_STRING_TAIL_PATTERN, re.DOTALL )
+OBJECT_KW, ARRAY_KW, CLOSE_KW, COMMA_KW = b'{', b'[', b'}]', b','
+
+
+class NotebookFormatError( ValueError ):
+    '''
+    the file is not notebook JSON ... a ValueError, so the notebook is recorded as a parse failure
+    '''
+
+
+def isCellStart( frame_list ):
+    '''
+    an object opening in the cells array, nbformat 4 keeps it at the top level and nbformat 3 in every worksheet
+    '''
+    depth_ = len( frame_list )
+    if ( depth_ < 2 ) or ( frame_list[-1][0] != ARRAY_KW ) or ( frame_list[-2][1] != constants.NOTEBOOK_CELL_LIST_KW ):
+        return False
+    return ( depth_ == 2 ) or ( ( depth_ == 4 ) and ( frame_list[0][1] == constants.NOTEBOOK_WORKSHEETS_KW ) )
+
+
+def iterNotebookCells( buffer_ ):
+    '''
+    yields ( cell number, cell type, source text ) for every cell of the notebook JSON in buffer_ ... only keys, cell types
+    and sources are decoded, every other string is skipped to its closing quote
+    '''
+    frame_list = []   # [ b'{', current key ] or [ b'[', None ] per open container
+    cell_depth, cell_number = None, 0
+    cell_type, source_list = None, []
+    pos_, root_done = 0, False
+    while True:
+        match_ = TOKEN_REGEX.match( buffer_, pos_ )
+        if match_ is None:
+            break
+        if root_done or ( ( not frame_list ) and ( match_.group( 2 ) != OBJECT_KW ) ):
+            raise NotebookFormatError( constants.NOTEBOOK_FORMAT_ERROR.format( 'unexpected value', match_.start() ) )
+        pos_ = match_.end()
+        if match_.group( 1 ) is not None:
+            tail_ = STRING_TAIL_REGEX.match( buffer_, pos_ )
+            if tail_ is None:
+                raise NotebookFormatError( constants.NOTEBOOK_FORMAT_ERROR.format( 'unterminated string', pos_ ) )
+            string_start, pos_ = pos_ - 1, tail_.end()
+            frame_ = frame_list[-1]
+            if ( frame_[0] == OBJECT_KW ) and ( frame_[1] is None ):
+                frame_[1] = buffer_[string_start + 1:pos_ - 1]
+            elif cell_depth is not None:
+                depth_ = len( frame_list )
+                if ( depth_ == cell_depth ) and ( frame_[1] == constants.NOTEBOOK_CELL_TYPE_KW ):
+                    cell_type = json.loads( buffer_[string_start:pos_] )
+                elif ( ( depth_ == cell_depth ) and ( frame_[1] in constants.NOTEBOOK_SOURCE_KW_LIST ) ) or \
+                     ( ( depth_ == cell_depth + 1 ) and ( frame_list[-2][1] in constants.NOTEBOOK_SOURCE_KW_LIST ) ):
+                    source_list.append( json.loads( buffer_[string_start:pos_] ) )
+        elif match_.group( 2 ) is not None:
+            token_ = match_.group( 2 )
+            if token_ == OBJECT_KW:
+                if isCellStart( frame_list ):
+                    cell_number += 1
+                    cell_depth, cell_type, source_list = len( frame_list ) + 1, None, []
+                frame_list.append( [ OBJECT_KW, None ] )
+            elif token_ == ARRAY_KW:
+                frame_list.append( [ ARRAY_KW, None ] )
+            elif token_ in CLOSE_KW:
+                if ( token_ == b'}' ) != ( frame_list[-1][0] == OBJECT_KW ):
+                    raise NotebookFormatError( constants.NOTEBOOK_FORMAT_ERROR.format( 'mismatched bracket', match_.start() ) )
+                if len( frame_list ) == cell_depth:
+                    yield cell_number, cell_type, constants.EMPTY_STRING.join( source_list )
+                    cell_depth = None
+                frame_list.pop()
+                root_done = len( frame_list ) == 0
+            elif ( token_ == COMMA_KW ) and ( frame_list[-1][0] == OBJECT_KW ):
+                frame_list[-1][1] = None
+    if frame_list or ( not root_done ) or buffer_[pos_:].strip():
+        raise NotebookFormatError( constants.NOTEBOOK_FORMAT_ERROR.format( 'unexpected end', pos_ ) )
+
+
+def getCellLines( source_text ):
+    '''
+    lines of a code cell as Python ... IPython line magics and shell escapes become pass at the same indent so line
+    numbers hold, a cell magic like %%bash leaves the whole cell out
+    '''
+    line_list = source_text.split( constants.NEWLINE_KW )
+    if line_list and ( len( line_list[-1] ) == 0 ):
+        line_list.pop()
+    for line_ in line_list:
+        if line_.strip():
+            if line_.lstrip().startswith( constants.NOTEBOOK_CELL_MAGIC_KW ):
+                return []
+            break
+    cell_lines = []
+    for line_ in line_list:
+        code_ = line_.lstrip()
+        if code_.startswith( constants.NOTEBOOK_MAGIC_PREFIXES ):
+            line_ = line_[:len( line_ ) - len( code_ )] + constants.NOTEBOOK_MAGIC_STAND_IN
+        cell_lines.append( line_ )
+    return cell_lines
+
+
+def readNotebookSource( nb_path ):
+    '''
+    returns ( Python source of the code cells as bytes, [ first line, cell number ] per code cell ) ... the source is
+    what lint_engine parses, the cell list maps its line numbers back, see lint_engine.getCellLine
+    '''
+    code_lines, cell_list = [], []
+    # an empty file ends before the notebook object and is rejected by iterNotebookCells 
+    with source_reader.openSource( nb_path ) as buffer_:
+        for cell_number, cell_type, source_text in iterNotebookCells( buffer_ ):
+            if cell_type != constants.NOTEBOOK_CODE_CELL_KW:
+                continue
+            cell_lines = getCellLines( source_text )
+            if cell_lines:
+                cell_list.append( [ len( code_lines ) + 1, cell_number ] )
+                code_lines.extend( cell_lines )
+    source_text = constants.NEWLINE_KW.join( code_lines ) + constants.NEWLINE_KW
+    return source_text.encode( constants.UTF_ENCODING ), cell_list
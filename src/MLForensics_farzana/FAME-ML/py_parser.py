@@ -7,37 +7,45 @@ Parser needed to implement FAME-ML
 
 import ast 
 import os 
+import sys 
 import constants 
 
+# source_reader.py is shared with the mining scripts and lives in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import source_reader 
 
-def checkLoggingPerData(tree_object, name2track):
+
+def getLoggingLines(tree_object, name2track):
     '''
-    Check if data used in any load/write methods is logged ... called once for one load/write operation 
+    line numbers of logging calls that take name2track as an argument, empty when logging is not imported ... 
+    one walk collects both the imports and the attribute calls 
     '''
-    LOGGING_EXISTS_FLAG = False 
-    IMPORT_FLAG, FUNC_FLAG, ARG_FLAG  = False, False , False 
+    IMPORT_FLAG = False 
+    line_list = []
     for stmt_ in tree_object.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Import) :
                 funcDict = node_.__dict__     
-                # print(funcDict) 
                 import_name_objects = funcDict[constants.NAMES_KW]
                 for obj in import_name_objects:
                     if ( constants.LOGGING_KW in  obj.__dict__[constants.NAME_KW]): 
                         IMPORT_FLAG = True 
-    func_decl_list = getPythonAtrributeFuncs(tree_object)
-    for func_decl_ in func_decl_list:
-        func_parent_id, func_name , funcLineNo, call_arg_list = func_decl_ # the class in which the method belongs, func_name, line no, arg_list 
-        
-        if ( constants.LOGGING_KW in func_parent_id ) or ( constants.LOGGING_KW in func_name) : 
-            # print(func_parent_id, func_name, call_arg_list)  
-            FUNC_FLAG = True 
-            for arg_ in call_arg_list:
-                if name2track in arg_:
-                    ARG_FLAG = True 
-    if (IMPORT_FLAG) and (FUNC_FLAG) and (ARG_FLAG):
-        LOGGING_EXISTS_FLAG = True 
-    return LOGGING_EXISTS_FLAG 
+            elif isinstance(node_, ast.Call):
+                for func_decl_ in commonAttribCallBody( node_ ):
+                    func_parent_id, func_name , funcLineNo, call_arg_list = func_decl_ # the class in which the method belongs, func_name, line no, arg_list 
+                    if ( constants.LOGGING_KW in func_parent_id ) or ( constants.LOGGING_KW in func_name) : 
+                        if any( name2track in arg_ for arg_ in call_arg_list ):
+                            line_list.append( funcLineNo )
+    if not IMPORT_FLAG:
+        line_list = []
+    return line_list 
+
+
+def checkLoggingPerData(tree_object, name2track):
+    '''
+    Check if data used in any load/write methods is logged ... called once for one load/write operation 
+    '''
+    return len( getLoggingLines( tree_object, name2track ) ) > 0 
 
 
 def func_def_log_check(func_decl_list):
@@ -74,13 +82,12 @@ def checkAttribFuncsInExcept(expr_obj):
         if constants.VALUE_KW in expr_dict:
             func_node = expr_dict[constants.VALUE_KW] 
             if isinstance( func_node, ast.Call ):
-                attrib_list = attrib_list + commonAttribCallBody( func_node )
+                attrib_list.extend( commonAttribCallBody( func_node ) )
     return attrib_list 
 
 def getPythonParseObject( pyFile ): 
-	try:
-		full_tree = ast.parse( open( pyFile ).read())    
-	except SyntaxError:
+	full_tree, parse_error = source_reader.parseSourceFile( pyFile )
+	if parse_error is not None:
 		# print(constants.PARSING_ERROR_KW, pyFile )
 		full_tree = ast.parse(constants.EMPTY_STRING) 
 	return full_tree 
@@ -170,184 +177,449 @@ def commonAttribCallBody(node_):
     return full_list             
 
 
-def getPythonAtrributeFuncs(pyTree):
+def iterPythonAtrributeFuncs(pyTree):
     '''
-    detects func like class.funcName() 
+    detects func like class.funcName() ... yields one ( receiver, func_name, line no, arg_list ) at a time 
     '''
-    attrib_call_list  = [] 
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Call):
-                attrib_call_list =  attrib_call_list + commonAttribCallBody( node_ )
+                yield from commonAttribCallBody( node_ )
 
-    return attrib_call_list 
+
+def getPythonAtrributeFuncs(pyTree):
+    return list( iterPythonAtrributeFuncs( pyTree ) )
     
     
-def getFunctionAssignments(pyTree):
+def commonAssignBody(node_):
+    '''
+    extracts ( lhs, func_name, line no, arg_list ) from one `lhs = func()` or `lhs = class.func()` assignment 
+    '''
     call_list = []
+    if isinstance(node_, ast.Assign):
+        lhs = ''
+        assign_dict = node_.__dict__
+        targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[ constants.VALUE_KW ]
+        if isinstance(value, ast.Call):
+            funcDict = value.__dict__ 
+            funcName, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW]  
+            for target in targets:
+                if( isinstance(target, ast.Name) ):
+                    lhs = target.id 
+            if( isinstance(funcName, ast.Name ) ): 
+                call_arg_list = [] 
+                index = 0   
+                for x_ in range(len(funcArgs)):
+                    index = x_ + 1
+                    funcArg = funcArgs[x_] 
+                    if( isinstance(funcArg, ast.Name ) ):
+                        call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif(isinstance( funcArg, ast.Str ) ):
+                        call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                for x_ in range(len(funcKeys)):
+                    funcKey = funcKeys[x_] 
+                    if( isinstance(funcKey, ast.keyword ) )  :
+                        call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
+                call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
+            elif( isinstance( funcName, ast.Attribute ) ):
+                call_arg_list = []   
+                index = 0       
+                func_name_dict  = funcName.__dict__
+                func_name = func_name_dict[constants.ATTRIB_KW] 
+                for x_ in range(len(funcArgs)):
+                    index = x_ + 1
+                    funcArg = funcArgs[x_] 
+                    if( isinstance( funcArg, ast.Call ) ):
+                        func_arg_dict  = funcArg.__dict__
+                        func_arg = func_arg_dict[constants.FUNC_KW] 
+                        call_arg_list.append( ( func_arg,  constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif( isinstance(funcArg, ast.Attribute) ): 
+                        func_arg_dic  = funcArg.__dict__
+                        func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif(isinstance( funcArg, ast.Str ) ):
+                        call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif isinstance(funcArg, ast.Subscript):
+                        func_arg =  funcArg.value
+                        if isinstance(func_arg, ast.Name):
+                            func_arg = func_arg.id 
+                        elif isinstance(func_arg, ast.Subscript):
+                            func_arg = func_arg.value 
+                            call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                for x_ in range(len(funcKeys)):
+                    funcKey = funcKeys[x_] 
+                    if( isinstance(funcKey, ast.keyword ) )  :
+                        call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
+                call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+    return call_list 
+
+
+def iterFunctionAssignments(pyTree):
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = ''
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[ constants.VALUE_KW ]
-            	if isinstance(value, ast.Call):
-                    funcDict = value.__dict__ 
-                    funcName, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW]  
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs = target.id 
-                    if( isinstance(funcName, ast.Name ) ): 
-                    	call_arg_list = [] 
-                    	index = 0   
-                    	      
-                    	for x_ in range(len(funcArgs)):
-                    		index = x_ + 1
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                        		call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                        		
-                    	for x_ in range(len(funcKeys)):
-                    		funcKey = funcKeys[x_] 
-                    		if( isinstance(funcKey, ast.keyword ) )  :
-                    			call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
-        					
-                    	call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
-                    	
-                    elif( isinstance( funcName, ast.Attribute ) ):
-                    	call_arg_list = []   
-                    	index = 0       
-                    	func_name_dict  = funcName.__dict__
-                    	func_name = func_name_dict[constants.ATTRIB_KW] 
-                    	for x_ in range(len(funcArgs)):
-                    		index = x_ + 1
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance( funcArg, ast.Call ) ):
-                        		func_arg_dict  = funcArg.__dict__
-                        		func_arg = func_arg_dict[constants.FUNC_KW] 
-                        		call_arg_list.append( ( func_arg,  constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance(funcArg, ast.Attribute) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif isinstance(funcArg, ast.Subscript):
-                    			func_arg =  funcArg.value
-                    			if isinstance(func_arg, ast.Name):
-                    				func_arg = func_arg.id 
-                    			elif isinstance(func_arg, ast.Subscript):
-                    				func_arg = func_arg.value 
-                    				call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    				
-                    	for x_ in range(len(funcKeys)):
-                    		funcKey = funcKeys[x_] 
-                    		if( isinstance(funcKey, ast.keyword ) )  :
-                    			call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
-        						
-                    	call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+                yield from commonAssignBody( node_ )
 
-    return call_list 
+
+def getFunctionAssignments(pyTree):
+    return list( iterFunctionAssignments( pyTree ) )
     
     
-def getFunctionDefinitions(pyTree):
+def commonFuncCallBody(node_):
+    '''
+    extracts ( func_name, line no, arg_list ) from one plain `func()` call 
+    '''
     func_list = []
-    func_var_list = []
+    if isinstance(node_, ast.Call):
+        funcDict = node_.__dict__ 
+        func_, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[constants.ARGS_KW], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW] 
+        if( isinstance(func_, ast.Name ) ):  
+            func_name = func_.id 
+            call_arg_list = []
+            index = 0                
+            for x_ in range(len(funcArgs)):
+                index = x_ + 1
+                funcArg = funcArgs[x_] 
+                if( isinstance(funcArg, ast.Name ) )  :
+                    call_arg_list.append( (  funcArg.id, constants.INDEX_KW + str(x_ + 1) )  ) 
+                elif( isinstance(funcArg, ast.Attribute) ): 
+                    arg_dic  = funcArg.__dict__
+                    arg_name = arg_dic[constants.ATTRIB_KW] 
+                    call_arg_list.append( (  arg_name, constants.INDEX_KW + str(x_ + 1) )  ) 
+                elif( isinstance( funcArg, ast.Call ) ):
+                    func_arg_dict  = funcArg.__dict__
+                    func_arg = func_arg_dict[constants.FUNC_KW] 
+                    call_arg_list.append( ( func_arg, constants.INDEX_KW + str( x_ + 1 )  ) )
+                elif( isinstance( funcArg, ast.Str ) ):
+                    call_arg_list.append( ( funcArg.s, constants.INDEX_KW + str( x_ + 1 )  ) )
+            for x_ in range(len(funcKeys)):
+                funcKey = funcKeys[x_] 
+                if( isinstance(funcKey, ast.keyword ) )  :
+                    call_arg_list.append( (  funcKey.arg, constants.INDEX_KW + str(x_ + index + 1) )  ) 
+            func_list.append( ( func_name , funcLineNo, call_arg_list  ) )        
+    return func_list 
+
+
+def iterFunctionDefinitions(pyTree):
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
-        	if isinstance(node_, ast.Call):
-        		funcDict = node_.__dict__ 
-        		func_, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[constants.ARGS_KW], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW] 
-        		if( isinstance(func_, ast.Name ) ):  
-        			func_name = func_.id 
-        			call_arg_list = []
-        			index = 0                
-        			for x_ in range(len(funcArgs)):
-        				index = x_ + 1
-        				funcArg = funcArgs[x_] 
-        				if( isinstance(funcArg, ast.Name ) )  :
-        					call_arg_list.append( (  funcArg.id, constants.INDEX_KW + str(x_ + 1) )  ) 
-        				elif( isinstance(funcArg, ast.Attribute) ): 
-        					arg_dic  = funcArg.__dict__
-        					arg_name = arg_dic[constants.ATTRIB_KW] 
-        					call_arg_list.append( (  arg_name, constants.INDEX_KW + str(x_ + 1) )  ) 
-        				elif( isinstance( funcArg, ast.Call ) ):
-        					func_arg_dict  = funcArg.__dict__
-        					func_arg = func_arg_dict[constants.FUNC_KW] 
-        					call_arg_list.append( ( func_arg, constants.INDEX_KW + str( x_ + 1 )  ) )
-        				elif( isinstance( funcArg, ast.Str ) ):
-        					call_arg_list.append( ( funcArg.s, constants.INDEX_KW + str( x_ + 1 )  ) )
-        					
-        			for x_ in range(len(funcKeys)):
-        				funcKey = funcKeys[x_] 
-        				if( isinstance(funcKey, ast.keyword ) )  :
-        					call_arg_list.append( (  funcKey.arg, constants.INDEX_KW + str(x_ + index + 1) )  ) 
-        			func_list.append( ( func_name , funcLineNo, call_arg_list  ) )        
-        			         
-    return func_list
+            if isinstance(node_, ast.Call):
+                yield from commonFuncCallBody( node_ )
+
+
+def getFunctionDefinitions(pyTree):
+    return list( iterFunctionDefinitions( pyTree ) )
 
     
-    
-def getFunctionAssignmentsWithMultipleLHS(pyTree):
+def commonMultiLHSAssignBody(node_):
+    '''
+    extracts ( lhs_list, func_name, line no, arg_list ) from one `a, b = func()` assignment 
+    '''
     call_list = []
+    if isinstance(node_, ast.Assign):
+        lhs = []
+        assign_dict = node_.__dict__
+        targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
+        if isinstance(value, ast.Call):
+            funcDict = value.__dict__ 
+            funcName, funcArgs, funcLineNo =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW] 
+            for target in targets:
+                if( isinstance(target, ast.Name) ):
+                    lhs.append(target.id) 
+                elif( isinstance(target, ast.Tuple) ):
+                    for item in target.elts:
+                        if isinstance(item, ast.Name):
+                            lhs.append(item.id)
+            if( isinstance(funcName, ast.Name ) ): 
+                call_arg_list = []       
+                for x_ in range(len(funcArgs)):
+                    funcArg = funcArgs[x_] 
+                    if( isinstance(funcArg, ast.Name ) ):
+                        call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )             
+                    elif( isinstance( funcArg, ast.Str ) ):
+                        call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif( isinstance( funcArg, ast.Call ) ):
+                        func_arg_dict  = funcArg.__dict__
+                        func_arg = func_arg_dict[constants.FUNC_KW] 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif( isinstance( funcArg, ast.Attribute ) ): 
+                        func_arg_dic  = funcArg.__dict__
+                        func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) ) 
+                call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
+            elif( isinstance( funcName, ast.Attribute ) ):
+                call_arg_list = []       
+                func_name_dict  = funcName.__dict__
+                func_name = func_name_dict[constants.ATTRIB_KW] 
+                for x_ in range(len(funcArgs)):
+                    funcArg = funcArgs[x_] 
+                    if( isinstance(funcArg, ast.Name ) ):
+                        call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif(isinstance( funcArg, ast.Str ) ):
+                        call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif( isinstance( funcArg, ast.Call ) ):
+                        func_arg_dict  = funcArg.__dict__
+                        func_arg = func_arg_dict[constants.FUNC_KW] 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    elif( isinstance(funcArg, ast.Attribute) ): 
+                        func_arg_dic  = funcArg.__dict__
+                        func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) )   ) 
+                call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+    return call_list 
+
+
+def iterFunctionAssignmentsWithMultipleLHS(pyTree):
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = []
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
-            	if isinstance(value, ast.Call):
-                    funcDict = value.__dict__ 
-                    funcName, funcArgs, funcLineNo =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW] 
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs.append(target.id) 
-                    	elif( isinstance(target, ast.Tuple) ):
-                    		for item in target.elts:
-                    			if isinstance(item, ast.Name):
-                    				lhs.append(item.id)
-                    if( isinstance(funcName, ast.Name ) ): 
-                    	call_arg_list = []       
-                    	for x_ in range(len(funcArgs)):
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                    			call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )             
-                    		elif( isinstance( funcArg, ast.Str ) ):
-                    			call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Call ) ):
-                    			func_arg_dict  = funcArg.__dict__
-                    			func_arg = func_arg_dict[constants.FUNC_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Attribute ) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) ) 
-                    	call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
-                    elif( isinstance( funcName, ast.Attribute ) ):
-                    	call_arg_list = []       
-                    	func_name_dict  = funcName.__dict__
-                    	func_name = func_name_dict[constants.ATTRIB_KW] 
-                    	for x_ in range(len(funcArgs)):
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                        		call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Call ) ):
-                        		func_arg_dict  = funcArg.__dict__
-                        		func_arg = func_arg_dict[constants.FUNC_KW] 
-                        		call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance(funcArg, ast.Attribute) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) )   ) 
-                    	call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+                yield from commonMultiLHSAssignBody( node_ )
 
-    return call_list 
+
+def getFunctionAssignmentsWithMultipleLHS(pyTree):
+    return list( iterFunctionAssignmentsWithMultipleLHS( pyTree ) )
+
+
+def commonLabelAssignBody(multi_lhs_list):
+    '''
+    splits multi LHS assignments into one ( lhs, func_name, line no, arg_list ) entry per LHS variable that names a label 
+    '''
+    label_list = []
+    for lhs, func_name, funcLineNo, call_arg_list in multi_lhs_list:
+        for var_name in lhs:
+            if ( constants.LABEL_KW in var_name ):
+                label_list.append( ( var_name, func_name, funcLineNo, call_arg_list ) )
+    return label_list 
+
+
+def iterLabelAssignments(pyTree):
+    for stmt_ in pyTree.body:
+        for node_ in ast.walk(stmt_):
+            if isinstance(node_, ast.Assign):
+                yield from commonLabelAssignBody( commonMultiLHSAssignBody( node_ ) )
+
+
+def getLabelAssignments(pyTree):
+    return list( iterLabelAssignments( pyTree ) )
+
+
+def iterPythonCallSites(pyTree, extractor_list = constants.EXTRACTOR_LIST):
+    '''
+    single walk over the tree that serves every requested extractor at once ... 
+    yields ( extractor kind, call site ) pairs, call sites look like the entries of the matching get* function above 
+    '''
+    want_attrib        = constants.ATTRIB_FUNCS_KW in extractor_list 
+    want_assign        = constants.FUNC_ASSIGNMENTS_KW in extractor_list 
+    want_def           = constants.FUNC_DEFINITIONS_KW in extractor_list 
+    want_multi_assign  = constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW in extractor_list 
+    want_label_assign  = constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW in extractor_list 
+    for stmt_ in pyTree.body:
+        for node_ in ast.walk(stmt_):
+            if isinstance(node_, ast.Call):
+                if want_attrib:
+                    for call_site in commonAttribCallBody( node_ ):
+                        yield constants.ATTRIB_FUNCS_KW, call_site 
+                if want_def:
+                    for call_site in commonFuncCallBody( node_ ):
+                        yield constants.FUNC_DEFINITIONS_KW, call_site 
+            elif isinstance(node_, ast.Assign):
+                if want_assign:
+                    for call_site in commonAssignBody( node_ ):
+                        yield constants.FUNC_ASSIGNMENTS_KW, call_site 
+                if want_multi_assign or want_label_assign:
+                    multi_lhs_list = commonMultiLHSAssignBody( node_ ) 
+                    if want_multi_assign:
+                        for call_site in multi_lhs_list:
+                            yield constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW, call_site 
+                    if want_label_assign:
+                        for call_site in commonLabelAssignBody( multi_lhs_list ):
+                            yield constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW, call_site 
+
+
+def getPythonCallSites(pyTree, extractor_list = constants.EXTRACTOR_LIST):
+    '''
+    returns a dict of extractor kind -> same list the matching get* function above would return 
+    '''
+    call_site_dict = { extractor_: [] for extractor_ in extractor_list }
+    for extractor_, call_site in iterPythonCallSites( pyTree, extractor_list ):
+        call_site_dict[extractor_].append( call_site )
+    return call_site_dict 
+    
     
+class CallSite( object ):
+    '''
+    compact call site for the rule engine: names, line and argument count only ... 
+    the ( name, index ) argument list of the get* extractors is rebuilt from the node when asked for 
+    '''
+    __slots__ = ( 'kind', 'receiver', 'lhs', 'func_name', 'line', 'arg_count', 'node_' )
+
+    def __init__( self, kind, receiver, lhs, func_name, line, arg_count, node_ ):
+        self.kind      = kind 
+        self.receiver  = receiver 
+        self.lhs       = lhs 
+        self.func_name = func_name 
+        self.line      = line 
+        self.arg_count = arg_count 
+        self.node_     = node_ 
+
+    def getArgs( self ):
+        # every extractor gives at most one entry per node, and label entries share the multi LHS one 
+        return ARG_BODY_DICT[self.kind]( self.node_ )[0][-1]
+
+    def toTuple( self ):
+        '''
+        same entry as the matching get* extractor 
+        '''
+        if self.kind == constants.ATTRIB_FUNCS_KW:
+            return ( self.receiver, self.func_name, self.line, self.getArgs() )
+        if self.kind == constants.FUNC_DEFINITIONS_KW:
+            return ( self.func_name, self.line, self.getArgs() )
+        return ( self.lhs, self.func_name, self.line, self.getArgs() )
 
+
+def countArgs( funcArgs, arg_types ):
+    '''
+    arguments the common*Body functions would keep ... string constants always count, checked directly because 
+    isinstance( x, ast.Str ) goes through a slow compatibility hook 
+    '''
+    arg_count = 0 
+    for funcArg in funcArgs:
+        if isinstance( funcArg, arg_types ):
+            arg_count += 1 
+        elif isinstance( funcArg, ast.Constant ) and isinstance( funcArg.value, str ):
+            arg_count += 1 
+    return arg_count 
+
+
+def countAssignAttribArgs( funcArgs ):
+    '''
+    commonAssignBody only keeps a subscript argument when it subscripts another subscript 
+    '''
+    arg_count = countArgs( funcArgs, ( ast.Call, ast.Attribute ) )
+    for funcArg in funcArgs:
+        if isinstance( funcArg, ast.Subscript ) and isinstance( funcArg.value, ast.Subscript ):
+            arg_count += 1 
+    return arg_count 
+
+
+def compactAttribCall( node_ ):
+    '''
+    CallSite for one class.funcName() call, None if commonAttribCallBody would skip it 
+    '''
+    func_ = node_.func 
+    if not isinstance( func_, ast.Attribute ):
+        return None 
+    func_parent = func_.value 
+    if isinstance( func_parent, ast.Name ):
+        receiver_ = func_parent.id 
+    elif isinstance( func_parent, ast.Attribute ):
+        receiver_ = func_parent.attr 
+    elif isinstance( func_parent, ast.Call ) and isinstance( func_parent.func, ast.Name ):
+        receiver_ = func_parent.func.id 
+    else:
+        return None 
+    arg_count = countArgs( node_.args, ( ast.Name, ast.Attribute ) ) + len( node_.keywords )
+    return CallSite( constants.ATTRIB_FUNCS_KW, receiver_, None, func_.attr, node_.lineno, arg_count, node_ )
+
+
+def compactFuncCall( node_ ):
+    func_ = node_.func 
+    if not isinstance( func_, ast.Name ):
+        return None 
+    arg_count = countArgs( node_.args, ( ast.Name, ast.Attribute, ast.Call ) ) + len( node_.keywords )
+    return CallSite( constants.FUNC_DEFINITIONS_KW, None, None, func_.id, node_.lineno, arg_count, node_ )
+
+
+def compactAssign( node_ ):
+    value = node_.value 
+    if not isinstance( value, ast.Call ):
+        return None 
+    lhs = ''
+    for target in node_.targets:
+        if isinstance( target, ast.Name ):
+            lhs = target.id 
+    funcName = value.func 
+    if isinstance( funcName, ast.Name ):
+        arg_count = countArgs( value.args, ( ast.Name, ) ) + len( value.keywords )
+        return CallSite( constants.FUNC_ASSIGNMENTS_KW, None, lhs, funcName.id, value.lineno, arg_count, node_ )
+    if isinstance( funcName, ast.Attribute ):
+        arg_count = countAssignAttribArgs( value.args ) + len( value.keywords )
+        return CallSite( constants.FUNC_ASSIGNMENTS_KW, None, lhs, funcName.attr, value.lineno, arg_count, node_ )
+    return None 
+
+
+def compactMultiLHSAssign( node_ ):
+    value = node_.value 
+    if not isinstance( value, ast.Call ):
+        return None 
+    funcName = value.func 
+    if isinstance( funcName, ast.Name ):
+        func_name = funcName.id 
+    elif isinstance( funcName, ast.Attribute ):
+        func_name = funcName.attr 
+    else:
+        return None 
+    lhs = []
+    for target in node_.targets:
+        if isinstance( target, ast.Name ):
+            lhs.append( target.id )
+        elif isinstance( target, ast.Tuple ):
+            for item in target.elts:
+                if isinstance( item, ast.Name ):
+                    lhs.append( item.id )
+    arg_count = countArgs( value.args, ( ast.Name, ast.Call, ast.Attribute ) )
+    return CallSite( constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW, None, lhs, func_name, value.lineno, arg_count, node_ )
+
+
+def iterCompactCallSites(pyTree, extractor_list = constants.EXTRACTOR_LIST):
+    '''
+    iterPythonCallSites with CallSite records ... no argument strings are built unless CallSite.getArgs() is called 
+    '''
+    want_attrib        = constants.ATTRIB_FUNCS_KW in extractor_list 
+    want_assign        = constants.FUNC_ASSIGNMENTS_KW in extractor_list 
+    want_def           = constants.FUNC_DEFINITIONS_KW in extractor_list 
+    want_multi_assign  = constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW in extractor_list 
+    want_label_assign  = constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW in extractor_list 
+    for stmt_ in pyTree.body:
+        for node_ in ast.walk(stmt_):
+            if isinstance(node_, ast.Call):
+                if want_attrib:
+                    call_site = compactAttribCall( node_ )
+                    if call_site is not None:
+                        yield constants.ATTRIB_FUNCS_KW, call_site 
+                if want_def:
+                    call_site = compactFuncCall( node_ )
+                    if call_site is not None:
+                        yield constants.FUNC_DEFINITIONS_KW, call_site 
+            elif isinstance(node_, ast.Assign):
+                if want_assign:
+                    call_site = compactAssign( node_ )
+                    if call_site is not None:
+                        yield constants.FUNC_ASSIGNMENTS_KW, call_site 
+                if want_multi_assign or want_label_assign:
+                    call_site = compactMultiLHSAssign( node_ )
+                    if call_site is None:
+                        continue 
+                    if want_multi_assign:
+                        yield constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW, call_site 
+                    if want_label_assign:
+                        for var_name in call_site.lhs:
+                            if ( constants.LABEL_KW in var_name ):
+                                yield constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW, CallSite( constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW, None, var_name, call_site.func_name, call_site.line, call_site.arg_count, node_ )
+
+
+'''
+extractor kind -> per-node body that builds the full argument list, see CallSite.getArgs 
+'''
+ARG_BODY_DICT = {
+    constants.ATTRIB_FUNCS_KW: commonAttribCallBody,
+    constants.FUNC_ASSIGNMENTS_KW: commonAssignBody,
+    constants.FUNC_DEFINITIONS_KW: commonFuncCallBody,
+    constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW: commonMultiLHSAssignBody,
+    constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW: commonMultiLHSAssignBody,
+}
+    
+    
 def getModelFeature(pyTree):
     feature_list = []
     for stmt_ in pyTree.body:
@@ -428,9 +700,6 @@ def getImport(pyTree):
     return import_list 
 
 def checkIfParsablePython( pyFile ):
-	flag = True 
-	try:
-		full_tree = ast.parse( open( pyFile ).read())    
-	except (SyntaxError, UnicodeDecodeError) as err_ :
-		flag = False 
+	_, parse_error = source_reader.parseSourceFile( pyFile )
+	flag = parse_error is None 
 	return flag 	
\ No newline at end of file
@@ -0,0 +1,164 @@
+'''
+Per-file resource guards for FAME-ML
+A file over one of the limits is skipped with a reason instead of holding up the whole run, see main.getFileResult.
+The size and node limits hold everywhere. The time and memory limits use SIGALRM and RLIMIT_AS, which act on the whole
+process, so they are enforced only in pool worker processes, see enableProcessLimits ... a serial run ignores them
+'''
+
+import os
+import ast
+import errno
+import signal
+import threading
+import contextlib
+import constants
+
+try:
+    import resource
+except ImportError:
+    # no address space limits on this platform, the memory limit is not enforced
+    resource = None
+
+
+'''
+set by enableProcessLimits in a pool worker, the time and memory limits are left off while False
+'''
+PROCESS_LIMITS_ON = False
+
+
+class FileLimitError( Exception ):
+    '''
+    raised while analyzing a file that goes over a limit ... reason is the class recorded in the failure report
+    '''
+    def __init__( self, limit_kw, limit_value ):
+        self.reason = constants.LIMIT_REASON_DICT[limit_kw]
+        Exception.__init__( self, constants.LIMIT_MESSAGE_TEMPLATE.format( limit_kw, limit_value ) )
+
+
+def getFileLimits( max_bytes = None, max_nodes = None, max_seconds = None, max_memory_mb = None ):
+    '''
+    limit dict for lint_engine.getDetectorHits( file_limits = ... ), None when no limit is set
+    '''
+    limit_dict = { constants.LIMIT_BYTES_KW: max_bytes, constants.LIMIT_NODES_KW: max_nodes,
+                   constants.LIMIT_SECONDS_KW: max_seconds, constants.LIMIT_MEMORY_KW: max_memory_mb }
+    limit_dict = { limit_kw: limit_value for limit_kw, limit_value in limit_dict.items() if limit_value is not None }
+    return limit_dict or None
+
+
+def enableProcessLimits():
+    '''
+    called by the pool initializer ... a worker runs one file at a time and nothing else, so an alarm or an address space
+    limit there can not hit the log listener thread or the caller of main.runFameML
+    '''
+    global PROCESS_LIMITS_ON
+    PROCESS_LIMITS_ON = True
+
+
+def getIgnoredLimits( file_limits ):
+    '''
+    names of the limits in file_limits that guardFile leaves off in this process
+    '''
+    if ( file_limits is None ) or PROCESS_LIMITS_ON:
+        return []
+    return [ limit_kw for limit_kw in constants.PROCESS_LIMIT_KW_LIST if limit_kw in file_limits ]
+
+
+def checkNodeCount( py_tree, file_limits ):
+    '''
+    stops counting as soon as the tree is over the limit
+    '''
+    if ( file_limits is None ) or ( constants.LIMIT_NODES_KW not in file_limits ):
+        return
+    max_nodes = file_limits[constants.LIMIT_NODES_KW]
+    for node_count, _ in enumerate( ast.walk( py_tree ), 1 ):
+        if node_count > max_nodes:
+            raise FileLimitError( constants.LIMIT_NODES_KW, max_nodes )
+
+
+def getAddressSpace():
+    with open( constants.PROC_STATM_PATH, 'r' ) as statm_:
+        return int( statm_.read().split()[0] ) * os.sysconf( constants.PAGE_SIZE_KW )
+
+
+def setWallTimeHandler( max_seconds ):
+    '''
+    SIGALRM needs the main thread, which every pool worker uses ... returns the handler to restore, or None
+    '''
+    if ( not hasattr( signal, 'setitimer' ) ) or ( threading.current_thread() is not threading.main_thread() ):
+        return None
+    def raiseWallTime( signum, frame ):
+        raise FileLimitError( constants.LIMIT_SECONDS_KW, max_seconds )
+    old_handler = signal.signal( signal.SIGALRM, raiseWallTime )
+    # None means a handler that was not set from Python, the default is the closest to put back
+    return signal.SIG_DFL if old_handler is None else old_handler
+
+
+def stopWallTimer( old_handler ):
+    '''
+    an alarm that went off just before the timer stopped still raises, but the old handler is back either way
+    '''
+    if old_handler is None:
+        return
+    try:
+        signal.setitimer( signal.ITIMER_REAL, 0 )
+    finally:
+        signal.signal( signal.SIGALRM, old_handler )
+
+
+def startMemoryLimit( max_memory_mb ):
+    '''
+    caps the address space at its current size plus max_memory_mb, so an allocation past that raises MemoryError ...
+    Linux does not enforce RLIMIT_RSS, so growth of the address space stands in for RSS. returns the limits to restore, or None
+    '''
+    if ( resource is None ) or ( not os.path.exists( constants.PROC_STATM_PATH ) ):
+        return None
+    old_limits = resource.getrlimit( resource.RLIMIT_AS )
+    new_soft = getAddressSpace() + int( max_memory_mb * constants.MEGA_BYTES )
+    if ( old_limits[1] != resource.RLIM_INFINITY ) and ( new_soft > old_limits[1] ):
+        new_soft = old_limits[1]
+    resource.setrlimit( resource.RLIMIT_AS, ( new_soft, old_limits[1] ) )
+    return old_limits
+
+
+def stopMemoryLimit( old_limits ):
+    if old_limits is not None:
+        resource.setrlimit( resource.RLIMIT_AS, old_limits )
+
+
+@contextlib.contextmanager
+def guardFile( py_file, file_limits ):
+    '''
+    enforces the size limit up front and, in a pool worker, the time and memory limits around the body ... the alarm
+    is handled between Python steps, so it can not stop ast.parse while the parser runs in C. a pathological parse is
+    bounded by the size limit and by the memory limit, whose failed allocation the parser raises right away
+    '''
+    if file_limits is None:
+        yield
+        return
+    max_bytes = file_limits.get( constants.LIMIT_BYTES_KW )
+    if ( max_bytes is not None ) and ( os.path.getsize( py_file ) > max_bytes ):
+        raise FileLimitError( constants.LIMIT_BYTES_KW, max_bytes )
+    if not PROCESS_LIMITS_ON:
+        yield
+        return
+    max_seconds   = file_limits.get( constants.LIMIT_SECONDS_KW )
+    max_memory_mb = file_limits.get( constants.LIMIT_MEMORY_KW )
+    # the memory limit goes first and comes off last, so an alarm can not leave it behind
+    old_limits = startMemoryLimit( max_memory_mb ) if max_memory_mb is not None else None
+    try:
+        old_handler = setWallTimeHandler( max_seconds ) if max_seconds is not None else None
+        try:
+            if old_handler is not None:
+                signal.setitimer( signal.ITIMER_REAL, max_seconds )
+            yield
+        finally:
+            stopWallTimer( old_handler )
+    except MemoryError:
+        raise FileLimitError( constants.LIMIT_MEMORY_KW, max_memory_mb ) from None
+    except OSError as err_:
+        # a memory map of a large file over the limit fails with ENOMEM instead of MemoryError
+        if ( max_memory_mb is None ) or ( err_.errno != errno.ENOMEM ):
+            raise
+        raise FileLimitError( constants.LIMIT_MEMORY_KW, max_memory_mb ) from None
+    finally:
+        stopMemoryLimit( old_limits )
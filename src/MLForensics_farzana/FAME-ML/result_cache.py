@@ -0,0 +1,100 @@
+'''
+Persistent per-file result cache for FAME-ML 
+Entries are keyed by the SHA-256 of the file content and of the active rule set 
+'''
+
+import hashlib
+import json
+import logging
+import sqlite3
+import constants
+import lint_engine
+import scan_profiler
+# lint_engine puts the package root on the path through py_parser
+import source_reader
+
+
+CACHE_LOGGER = logging.getLogger( constants.CACHE_LOGGER_KW )
+
+
+def getRuleSetHash( detector_list = constants.DETECTOR_LIST, logging_flag = False ):
+    '''
+    hash of everything that decides a file's result: enabled detectors, their rules, the extraction schema version 
+    and whether logging presence is computed 
+    '''
+    enabled_detectors = set( detector_list )
+    rule_list = [ list( rule_ ) for rule_ in constants.RULE_LIST if rule_[0] in enabled_detectors ]
+    blob_list = [ constants.CACHE_SCHEMA_VERSION, list( detector_list ), rule_list ]
+    if logging_flag:
+        blob_list.append( constants.LOGGING_PRESENT_KW )
+    rule_blob = json.dumps( blob_list )
+    return hashlib.sha256( rule_blob.encode( constants.UTF_ENCODING ) ).hexdigest()
+
+
+def getContentHash( py_file ):
+    with source_reader.openSource( py_file ) as source_:
+        return hashlib.sha256( source_ ).hexdigest()
+
+
+def openResultCache( db_path ):
+    '''
+    opens ( and creates if needed ) the cache database ... WAL mode lets pool workers share the file
+    '''
+    connection_ = sqlite3.connect( db_path, timeout = constants.CACHE_TIMEOUT_SECONDS )
+    connection_.execute( constants.CACHE_PRAGMA_WAL_SQL )
+    connection_.execute( constants.CACHE_CREATE_TABLE_SQL )
+    connection_.commit()
+    return connection_
+
+
+def purgeStaleEntries( db_path, detector_list = constants.DETECTOR_LIST ):
+    '''
+    deletes entries built with a rule set that no longer exists ... entries of the current rules are kept whether or not
+    they were built with logging presence, both stay valid. returns how many were dropped
+    '''
+    connection_ = openResultCache( db_path )
+    valid_hashes = ( getRuleSetHash( detector_list, logging_flag = False ), getRuleSetHash( detector_list, logging_flag = True ) )
+    cursor_ = connection_.execute( constants.CACHE_PURGE_SQL, valid_hashes )
+    connection_.commit()
+    connection_.close()
+    return cursor_.rowcount
+
+
+def getCachedHits( connection_, content_hash, rule_hash ):
+    row_ = connection_.execute( constants.CACHE_SELECT_SQL, ( content_hash, rule_hash ) ).fetchone()
+    if row_ is None:
+        return None
+    return json.loads( row_[0] )
+
+
+def putCachedHits( connection_, content_hash, rule_hash, hit_dict ):
+    count_dict = { detector_name: len( line_list ) for detector_name, line_list in hit_dict.items() }
+    connection_.execute( constants.CACHE_INSERT_SQL, ( content_hash, rule_hash, json.dumps( count_dict ), json.dumps( hit_dict ) ) )
+    connection_.commit()
+
+
+def getCachedDetectorHits( connection_, py_file, rule_hash, detector_list = constants.DETECTOR_LIST, logging_flag = False, file_limits = None, file_profile = None ):
+    '''
+    same result as lint_engine.getDetectorHits, but unchanged files are answered from the cache ... 
+    a file skipped by file_limits is not cached, so it is tried again under other limits. with a file_profile, 
+    hashing, lookup and storing count as its cache stage
+    '''
+    mark_stage = scan_profiler.getStageClock( file_profile )
+    content_hash = getContentHash( py_file )
+    hit_dict = getCachedHits( connection_, content_hash, rule_hash )
+    mark_stage( constants.PROFILE_CACHE_KW )
+    if hit_dict is None:
+        CACHE_LOGGER.debug( constants.CACHE_MISS_LOG_KW, py_file )
+        hit_dict = lint_engine.getDetectorHits( py_file, detector_list, logging_flag, file_limits, file_profile )
+        mark_stage = scan_profiler.getStageClock( file_profile )
+        putCachedHits( connection_, content_hash, rule_hash, hit_dict )
+        mark_stage( constants.PROFILE_CACHE_KW )
+    return hit_dict 
+
+
+def getCachedDetectorCounts( connection_, py_file, rule_hash, detector_list = constants.DETECTOR_LIST, logging_flag = False, print_flag = False ):
+    '''
+    same result as lint_engine.getDetectorCounts, but unchanged files are answered from the cache
+    '''
+    hit_dict = getCachedDetectorHits( connection_, py_file, rule_hash, detector_list, logging_flag )
+    return lint_engine.reportDetectorHits( py_file, hit_dict, detector_list, print_flag )
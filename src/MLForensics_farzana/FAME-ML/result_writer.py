@@ -0,0 +1,163 @@
+'''
+Streaming CSV output for FAME-ML 
+Rows are appended as each repo finishes, and a manifest next to the CSV records the completed repos 
+'''
+
+import csv
+import json
+import os
+import constants
+
+
+def getManifestPath( csv_fil ):
+    return csv_fil + constants.MANIFEST_EXTENSION
+
+
+def getParseFailurePath( csv_fil ):
+    return csv_fil + constants.PARSE_FAILURE_EXTENSION
+
+
+def readManifest( manifest_path ):
+    '''
+    returns ( completed repos, ( CSV size, failure report size, event file size ) after the last completed repo ) ... 
+    sizes are None for an empty or missing manifest
+    '''
+    completed_set, size_tup = set(), None
+    if not os.path.exists( manifest_path ):
+        return completed_set, size_tup
+    with open( manifest_path, 'r', encoding = constants.UTF_ENCODING ) as manifest_:
+        for line_ in manifest_:
+            field_list = line_.rstrip( constants.NEWLINE_KW ).split( constants.TAB_KW, 3 )
+            if len( field_list ) != 4:
+                continue   # torn last line from a crash, the repo was not completed
+            csv_size, failure_size, event_size, repo_ = field_list
+            completed_set.add( repo_ )
+            size_tup = ( int( csv_size ), int( failure_size ), int( event_size ) )
+    return completed_set, size_tup
+
+
+def syncFile( file_ ):
+    file_.flush()
+    os.fsync( file_.fileno() )
+
+
+def openNewCSV( csv_fil, csv_header ):
+    csv_file = open( csv_fil, 'w', newline = '', encoding = constants.UTF_ENCODING )
+    csv.writer( csv_file, lineterminator = constants.NEWLINE_KW ).writerow( csv_header )
+    syncFile( csv_file )
+    return csv_file
+
+
+def openTruncatedCSV( csv_fil, csv_size ):
+    csv_file = open( csv_fil, 'r+', newline = '', encoding = constants.UTF_ENCODING )
+    csv_file.truncate( csv_size )
+    csv_file.seek( csv_size )
+    return csv_file
+
+
+def openEventFile( events_path, event_size ):
+    '''
+    JSONL detection events, buffered so that a repo's events reach the disk in a few large writes 
+    '''
+    if event_size is None:
+        return open( events_path, 'w', encoding = constants.UTF_ENCODING, buffering = constants.EVENT_BUFFER_BYTES )
+    event_file = open( events_path, 'r+', encoding = constants.UTF_ENCODING, buffering = constants.EVENT_BUFFER_BYTES )
+    event_file.truncate( event_size )
+    event_file.seek( event_size )
+    return event_file 
+
+
+def readCSVHeader( csv_fil ):
+    with open( csv_fil, 'r', newline = '', encoding = constants.UTF_ENCODING ) as csv_file:
+        return next( csv.reader( csv_file ), [] )
+
+
+def hasDataRows( csv_fil ):
+    '''
+    True if csv_fil exists and has a row after its header
+    '''
+    if not os.path.exists( csv_fil ):
+        return False
+    with open( csv_fil, 'r', newline = '', encoding = constants.UTF_ENCODING ) as csv_file:
+        csv_reader = csv.reader( csv_file )
+        next( csv_reader, None )
+        return next( csv_reader, None ) is not None
+
+
+def checkResumable( csv_fil, csv_header, events_path = None ):
+    '''
+    raises ValueError unless the output of the interrupted run can be appended to: the CSV, its parse failure report 
+    and the event file of events_path must all exist, and the CSV must have the columns of csv_header 
+    '''
+    for path_ in [ csv_fil, getParseFailurePath( csv_fil ) ] + ( [] if events_path is None else [ events_path ] ):
+        if not os.path.exists( path_ ):
+            raise ValueError( constants.RESUME_MISSING_ERROR.format( csv_fil, path_ ) )
+    existing_header = readCSVHeader( csv_fil )
+    if existing_header != list( csv_header ):
+        raise ValueError( constants.RESUME_HEADER_ERROR.format( csv_fil, existing_header, list( csv_header ) ) )
+
+
+def openResultWriter( csv_fil, resume = False, csv_header = constants.CSV_HEADER, events_path = None ):
+    '''
+    opens the CSV, its parse failure report, the optional event file and the manifest ... 
+    returns ( ( csv file, failure file, manifest file, event file or None ), completed repos ). 
+    with resume, output written after the last completed repo is cut off and every file is appended to, see checkResumable; 
+    otherwise, or when the manifest lists no completed repo and the CSV has no rows yet, all files start over. 
+    resuming a CSV that has rows but no manifest entry raises ValueError 
+    '''
+    manifest_path = getManifestPath( csv_fil )
+    failure_path  = getParseFailurePath( csv_fil )
+    completed_set, size_tup = set(), None
+    if resume:
+        completed_set, size_tup = readManifest( manifest_path )
+        if ( size_tup is None ) and hasDataRows( csv_fil ):
+            # rows without a manifest entry can not be told complete or cut off, and starting over would erase them 
+            raise ValueError( constants.RESUME_MISSING_ERROR.format( csv_fil, manifest_path ) )
+    if size_tup is None:
+        completed_set = set()
+        csv_file      = openNewCSV( csv_fil, csv_header )
+        failure_file  = openNewCSV( failure_path, constants.PARSE_FAILURE_HEADER )
+        manifest_file = open( manifest_path, 'w', encoding = constants.UTF_ENCODING )
+        event_size    = None 
+    else:
+        checkResumable( csv_fil, csv_header, events_path )
+        csv_file      = openTruncatedCSV( csv_fil, size_tup[0] )
+        failure_file  = openTruncatedCSV( failure_path, size_tup[1] )
+        manifest_file = open( manifest_path, 'a', encoding = constants.UTF_ENCODING )
+        event_size    = size_tup[2]
+    event_file = None if events_path is None else openEventFile( events_path, event_size )
+    return ( csv_file, failure_file, manifest_file, event_file ), completed_set
+
+
+def writeRepoRows( writer_, repo_, row_list, failure_list = (), event_list = () ):
+    '''
+    the repo is added to the manifest only after its rows, parse failures and events are on disk 
+    '''
+    csv_file, failure_file, manifest_file, event_file = writer_
+    csv.writer( csv_file, lineterminator = constants.NEWLINE_KW ).writerows( row_list )
+    csv.writer( failure_file, lineterminator = constants.NEWLINE_KW ).writerows( failure_list )
+    syncFile( csv_file )
+    syncFile( failure_file )
+    event_size = 0 
+    if event_file is not None:
+        event_file.writelines( json.dumps( event_ ) + constants.NEWLINE_KW for event_ in event_list )
+        syncFile( event_file )
+        event_size = event_file.tell()
+    size_list = [ str( csv_file.tell() ), str( failure_file.tell() ), str( event_size ) ]
+    manifest_file.write( constants.TAB_KW.join( size_list + [ repo_ ] ) + constants.NEWLINE_KW )
+    syncFile( manifest_file )
+
+
+def writeParseFailureReport( csv_fil, failure_list ):
+    '''
+    parse failure report of a run that does not stream, see runFameMLDelta 
+    '''
+    failure_file = openNewCSV( getParseFailurePath( csv_fil ), constants.PARSE_FAILURE_HEADER )
+    csv.writer( failure_file, lineterminator = constants.NEWLINE_KW ).writerows( failure_list )
+    failure_file.close()
+
+
+def closeResultWriter( writer_ ):
+    for file_ in writer_:
+        if file_ is not None:
+            file_.close()
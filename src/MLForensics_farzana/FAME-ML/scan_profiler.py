@@ -0,0 +1,114 @@
+'''
+Profiling support for FAME-ML scans
+Times the stages of every file, every extractor and every detector, see main.runFameML( profile_path = ... ). The scan
+code takes a file profile and times itself with getStageClock, see lint_engine.getDetectorHits
+'''
+
+import csv
+import json
+import time
+import heapq
+import constants
+
+
+def newFileProfile( py_file ):
+    return { constants.PROFILE_FILE_KW: py_file, constants.PROFILE_BYTES_KW: 0, constants.PROFILE_SECONDS_KW: 0.0,
+             constants.PROFILE_STAGES_KW: dict.fromkeys( constants.PROFILE_STAGE_LIST, 0.0 ),
+             constants.PROFILE_EXTRACTORS_KW: {}, constants.PROFILE_DETECTORS_KW: {} }
+
+
+def skipStage( stage_ ):
+    return 0.0
+
+
+def getStageClock( file_profile ):
+    '''
+    function that adds the seconds since its last call, or since getStageClock, to a stage of file_profile and returns
+    them ... so back to back stages are timed with one clock read each. without a profile it is skipStage and times nothing
+    '''
+    if file_profile is None:
+        return skipStage
+    stage_dict = file_profile[constants.PROFILE_STAGES_KW]
+    last_time = [ time.perf_counter() ]
+
+    def markStage( stage_ ):
+        now_ = time.perf_counter()
+        seconds_ = now_ - last_time[0]
+        stage_dict[stage_] += seconds_
+        last_time[0] = now_
+        return seconds_
+    return markStage
+
+
+def addNamedTime( file_profile, group_, name_, seconds_ ):
+    '''
+    seconds of one extractor or detector, group_ is PROFILE_EXTRACTORS_KW or PROFILE_DETECTORS_KW
+    '''
+    name_dict = file_profile[group_]
+    name_dict[name_] = name_dict.get( name_, 0.0 ) + seconds_
+
+
+def closeFileProfile( file_profile, start_time ):
+    '''
+    file_profile with the seconds since start_time as the time of the file, None without a profile
+    '''
+    if file_profile is not None:
+        file_profile[constants.PROFILE_SECONDS_KW] = time.perf_counter() - start_time
+    return file_profile
+
+
+def newScanProfile():
+    return { constants.PROFILE_STAGES_KW: dict.fromkeys( constants.PROFILE_STAGE_LIST, 0.0 ), constants.PROFILE_EXTRACTORS_KW: {},
+             constants.PROFILE_DETECTORS_KW: {}, constants.PROFILE_FILE_LIST_KW: [] }
+
+
+def addStageTime( scan_profile, stage_, seconds_ ):
+    scan_profile[constants.PROFILE_STAGES_KW][stage_] += seconds_
+
+
+def addFileProfile( scan_profile, file_profile ):
+    for group_ in [ constants.PROFILE_STAGES_KW, constants.PROFILE_EXTRACTORS_KW, constants.PROFILE_DETECTORS_KW ]:
+        total_dict = scan_profile[group_]
+        for name_, seconds_ in file_profile[group_].items():
+            total_dict[name_] = total_dict.get( name_, 0.0 ) + seconds_
+    stage_dict = file_profile[constants.PROFILE_STAGES_KW]
+    scan_profile[constants.PROFILE_FILE_LIST_KW].append( ( file_profile[constants.PROFILE_FILE_KW], file_profile[constants.PROFILE_BYTES_KW],
+                                                           file_profile[constants.PROFILE_SECONDS_KW] ) + tuple( stage_dict[stage_] for stage_ in constants.PROFILE_STAGE_LIST ) )
+
+
+def getProfileSummary( scan_profile, wall_seconds, top_n = constants.PROFILE_TOP_DEFAULT ):
+    '''
+    per-stage breakdown with shares, per-extractor and per-detector seconds, and the top_n slowest files
+    '''
+    file_list  = scan_profile[constants.PROFILE_FILE_LIST_KW]
+    stage_dict = scan_profile[constants.PROFILE_STAGES_KW]
+    stage_total = sum( stage_dict.values() ) or 1.0
+    top_list = heapq.nlargest( top_n, file_list, key = lambda file_row: file_row[2] )
+    return {
+        constants.PROFILE_WALL_KW: wall_seconds,
+        constants.PROFILE_FILE_COUNT_KW: len( file_list ),
+        constants.PROFILE_BYTES_KW: sum( file_row[1] for file_row in file_list ),
+        constants.PROFILE_STAGES_KW: { stage_: { constants.PROFILE_SECONDS_KW: seconds_, constants.PROFILE_SHARE_KW: seconds_ / stage_total }
+                                       for stage_, seconds_ in stage_dict.items() },
+        constants.PROFILE_EXTRACTORS_KW: { extractor_: { constants.PROFILE_FUNCTION_KW: constants.EXTRACTOR_FUNCTION_DICT.get( extractor_ ), constants.PROFILE_SECONDS_KW: seconds_ }
+                                           for extractor_, seconds_ in sorted( scan_profile[constants.PROFILE_EXTRACTORS_KW].items(), key = lambda item_: -item_[1] ) },
+        constants.PROFILE_DETECTORS_KW: { detector_name: { constants.PROFILE_FUNCTION_KW: constants.DETECTOR_FUNCTION_DICT.get( detector_name ), constants.PROFILE_SECONDS_KW: seconds_ }
+                                          for detector_name, seconds_ in sorted( scan_profile[constants.PROFILE_DETECTORS_KW].items(), key = lambda item_: -item_[1] ) },
+        constants.PROFILE_TOP_FILES_KW: [ { constants.PROFILE_FILE_KW: file_row[0], constants.PROFILE_BYTES_KW: file_row[1], constants.PROFILE_SECONDS_KW: file_row[2],
+                                            constants.PROFILE_STAGES_KW: dict( zip( constants.PROFILE_STAGE_LIST, file_row[3:] ) ) } for file_row in top_list ],
+        constants.PROFILE_NOTE_KW: constants.PROFILE_NOTE,
+    }
+
+
+def writeScanProfile( profile_path, scan_profile, wall_seconds, top_n = constants.PROFILE_TOP_DEFAULT ):
+    '''
+    writes the summary as JSON to profile_path and one row per file to profile_path + PROFILE_FILES_EXTENSION ... returns the summary
+    '''
+    summary_dict = getProfileSummary( scan_profile, wall_seconds, top_n )
+    with open( profile_path, 'w', encoding = constants.UTF_ENCODING ) as profile_file:
+        json.dump( summary_dict, profile_file, indent = 2 )
+    with open( profile_path + constants.PROFILE_FILES_EXTENSION, 'w', newline = '', encoding = constants.UTF_ENCODING ) as files_file:
+        csv_writer = csv.writer( files_file )
+        csv_writer.writerow( constants.PROFILE_FILES_HEADER )
+        csv_writer.writerows( scan_profile[constants.PROFILE_FILE_LIST_KW] )
+    return summary_dict
@@ -0,0 +1,104 @@
+'''
+Corpus report and dataset statistics from the CSV of a scan, see fame_ml.py report and stats
+Same numbers as empirical/frequency.py and empirical/dataset.stats.py, read with the csv module so that the command line
+does not wait for pandas
+'''
+
+import csv
+import os
+import sys
+import constants
+import result_writer
+
+# source_reader.py is shared with the mining scripts and lives in the package root
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import source_reader
+
+
+def iterResultRows( csv_path ):
+    '''
+    yields ( repo, file, { category column: count } ) per row of csv_path ... the category columns are those of
+    constants.CSV_HEADER, an optional LOGGING_PRESENT column is left out
+    '''
+    category_list = constants.CSV_HEADER[2:]
+    with open( csv_path, 'r', newline = '', encoding = constants.UTF_ENCODING ) as csv_file:
+        for row_ in csv.DictReader( csv_file ):
+            yield row_[constants.CSV_HEADER[0]], row_[constants.CSV_HEADER[1]], \
+                  { category_: int( row_[category_] ) for category_ in category_list }
+
+
+def getProportion( file_count, total_files ):
+    # same rounding as frequency.reportProportion
+    return round( float( file_count ) / float( total_files ), 5 ) * 100
+
+
+def getCategoryReport( csv_path ):
+    '''
+    ( corpus rows, repo rows ) ... a corpus row is ( category, detections, files with at least one, share of files in % ),
+    a repo row is ( repo, files, category, files with at least one, share in % ) as frequency.reportProportion writes it
+    '''
+    category_list = constants.CSV_HEADER[2:]
+    repo_dict = {}
+    for repo_, file_, count_dict in iterResultRows( csv_path ):
+        file_dict = repo_dict.setdefault( repo_, {} )
+        # a file listed twice counts once, as np.unique did in frequency.py
+        file_dict[file_] = count_dict
+    corpus_files = 0
+    event_dict = dict.fromkeys( category_list, 0 )
+    atleast_dict = dict.fromkeys( category_list, 0 )
+    repo_list = []
+    for repo_ in sorted( repo_dict ):
+        file_dict = repo_dict[repo_]
+        corpus_files += len( file_dict )
+        for category_ in category_list:
+            atleast_one = sum( 1 for count_dict in file_dict.values() if count_dict[category_] > 0 )
+            event_dict[category_] += sum( count_dict[category_] for count_dict in file_dict.values() )
+            atleast_dict[category_] += atleast_one
+            repo_list.append( ( repo_, len( file_dict ), category_, atleast_one, getProportion( atleast_one, len( file_dict ) ) ) )
+    corpus_list = [ ( category_, event_dict[category_], atleast_dict[category_],
+                      getProportion( atleast_dict[category_], corpus_files ) if corpus_files > 0 else 0.0 ) for category_ in category_list ]
+    return corpus_list, repo_list
+
+
+def writeCategoryReport( report_path, repo_list ):
+    with open( report_path, 'w', newline = '', encoding = constants.UTF_ENCODING ) as report_file:
+        writer_ = csv.writer( report_file )
+        writer_.writerow( constants.REPORT_HEADER )
+        writer_.writerows( repo_list )
+
+
+def getLineCount( py_file ):
+    '''
+    lines as dataset.stats.getFileLength counts them, with \\n, \\r\\n and \\r all ending a line
+    '''
+    with source_reader.openSource( py_file ) as source_:
+        return len( bytes( source_ ).splitlines() )
+
+
+def getDatasetStats( csv_path ):
+    '''
+    dict of constants.STATS_KW_LIST ... file size is the line count of every file that is still on disk, parse failures
+    and limit skips come from the failure report next to csv_path, if there is one
+    '''
+    repo_set, file_set = set(), set()
+    for repo_, file_, _ in iterResultRows( csv_path ):
+        repo_set.add( repo_ )
+        file_set.add( file_ )
+    line_count, missing_count = 0, 0
+    for file_ in file_set:
+        if os.path.isfile( file_ ):
+            line_count += getLineCount( file_ )
+        else:
+            missing_count += 1
+    failure_count, skip_count = 0, 0
+    failure_path = result_writer.getParseFailurePath( csv_path )
+    if os.path.exists( failure_path ):
+        with open( failure_path, 'r', newline = '', encoding = constants.UTF_ENCODING ) as failure_file:
+            for row_ in csv.DictReader( failure_file ):
+                if row_[constants.PARSE_FAILURE_HEADER[2]] in constants.LIMIT_REASON_LIST:
+                    skip_count += 1
+                else:
+                    failure_count += 1
+    return { constants.STATS_REPO_COUNT_KW: len( repo_set ), constants.STATS_FILE_COUNT_KW: len( file_set ),
+             constants.STATS_FILE_SIZE_KW: line_count, constants.STATS_MISSING_KW: missing_count,
+             constants.STATS_PARSE_FAILURE_KW: failure_count, constants.STATS_LIMIT_SKIP_KW: skip_count }
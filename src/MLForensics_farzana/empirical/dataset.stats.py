@@ -12,6 +12,11 @@ from datetime import datetime
 import subprocess
 from collections import Counter 
 import shutil 
+import sys 
+
+# result_table.py is shared with FAME-ML and lives in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import result_table 
 
 def getBranch(path):
     dict_ = { 
@@ -150,7 +155,7 @@ def getGeneralStats(all_dataset_list):
         print('='*50)
         print(result_file)
         print('='*50)
-        res_df    = pd.read_csv( result_file ) 
+        res_df    = result_table.readResultTable( result_file ) 
         if 'ZOO' in result_file:
             temp_dirs = np.unique( res_df['REPO_FULL_PATH'].tolist() ) 
             for temp_dir in temp_dirs:
@@ -178,7 +183,7 @@ def getDevEmails(ds_list):
         print('='*50)
         if 'ZOO' in result_file:
             all_repos = [] 
-            res_df    = pd.read_csv( result_file ) 
+            res_df    = result_table.readResultTable( result_file ) 
             temp_dirs = np.unique( res_df['REPO_FULL_PATH'].tolist() ) 
             for temp_dir in temp_dirs:
                 list_subfolders_with_paths = [f.path for f in os.scandir(temp_dir) if f.is_dir()]
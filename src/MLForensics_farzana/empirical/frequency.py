@@ -8,6 +8,11 @@ import os
 import pandas as pd 
 import time 
 import datetime 
+import sys 
+
+# result_table.py is shared with FAME-ML and lives in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import result_table 
 
 def giveTimeStamp():
   tsObj = time.time()
@@ -23,7 +28,7 @@ def getAllSLOC(df_param, csv_encoding='latin-1' ):
     return total_sloc
 
 def reportProportion( res_file, output_file ):
-    res_df = pd.read_csv( res_file )
+    res_df = result_table.readResultTable( res_file )
     repo_names   = np.unique( res_df['REPO_FULL_PATH'].tolist() )
     
     fields2explore = ['DATA_LOAD_COUNT', 'MODEL_LOAD_COUNT', 'DATA_DOWNLOAD_COUNT',	'MODEL_LABEL_COUNT', 'MODEL_OUTPUT_COUNT',	
@@ -52,7 +57,7 @@ def reportProportion( res_file, output_file ):
 
 
 def reportEventDensity(res_file, output_file): 
-    res_df = pd.read_csv(res_file) 
+    res_df = result_table.readResultTable(res_file) 
     repo_names   = np.unique( res_df['REPO_FULL_PATH'].tolist() )
     fields2explore = ['DATA_LOAD_COUNT', 'MODEL_LOAD_COUNT', 'DATA_DOWNLOAD_COUNT',	'MODEL_LABEL_COUNT', 'MODEL_OUTPUT_COUNT',	
                       'DATA_PIPELINE_COUNT', 'ENVIRONMENT_COUNT', 'STATE_OBSERVE_COUNT',  'TOTAL_EVENT_COUNT'
@@ -9,6 +9,11 @@ import pandas as pd
 import time 
 import datetime 
 import statistics
+import sys 
+
+# result_table.py is shared with FAME-ML and lives in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import result_table 
 
 
 def giveTimeStamp():
@@ -23,7 +28,7 @@ def Median(Mylist):
     return statistics.median(Mylist)
     
 def reportProp( res_file ):
-    res_df = pd.read_csv(res_file) 
+    res_df = result_table.readResultTable(res_file) 
     fields2explore = ['DATA_LOAD_COUNT', 'MODEL_LOAD_COUNT', 'DATA_DOWNLOAD_COUNT',	'MODEL_LABEL_COUNT', 'MODEL_OUTPUT_COUNT',	
                       'DATA_PIPELINE_COUNT', 'ENVIRONMENT_COUNT', 'STATE_OBSERVE_COUNT',  'TOTAL_EVENT_COUNT'
                      ]
@@ -41,7 +46,7 @@ def reportProp( res_file ):
     
     
 def reportDensity( res_file ):
-    res_df = pd.read_csv(res_file) 
+    res_df = result_table.readResultTable(res_file) 
     fields2explore = ['DATA_LOAD_COUNT', 'MODEL_LOAD_COUNT', 'DATA_DOWNLOAD_COUNT',	'MODEL_LABEL_COUNT', 'MODEL_OUTPUT_COUNT',	
                       'DATA_PIPELINE_COUNT', 'ENVIRONMENT_COUNT', 'STATE_OBSERVE_COUNT',  'TOTAL_EVENT_COUNT'
                      ]
@@ -0,0 +1,228 @@
+'''
+Shared logging pipeline for FAME-ML and the mining scripts
+Subsystems log through named loggers; records go through a queue to one listener thread that does the I/O,
+so a hot loop pays for a level check, plus a queue put when the level is on
+'''
+
+import os
+import sys
+import queue
+import logging
+import importlib.util
+import logging.handlers
+import multiprocessing
+
+
+CONSTANTS_MODULE_KW = 'constants'
+FAMEML_CONSTANTS_PATH = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), 'FAME-ML', CONSTANTS_MODULE_KW + '.py' )
+
+
+def loadFameConstants():
+    '''
+    FAME-ML/constants.py, the module FAME-ML itself uses when it is already imported ... loaded by path otherwise,
+    since the bare name constants can also be the mining module of that name
+    '''
+    loaded_ = sys.modules.get( CONSTANTS_MODULE_KW )
+    if ( loaded_ is not None ) and ( os.path.realpath( getattr( loaded_, '__file__', None ) or '' ) == os.path.realpath( FAMEML_CONSTANTS_PATH ) ):
+        return loaded_
+    spec_ = importlib.util.spec_from_file_location( CONSTANTS_MODULE_KW, FAMEML_CONSTANTS_PATH )
+    module_ = importlib.util.module_from_spec( spec_ )
+    spec_.loader.exec_module( module_ )
+    return module_
+
+
+'''
+logger names of FAME-ML come from its constants, the mining scripts log under MINING_LOGGER_KW
+'''
+FAMEML_CONSTANTS = loadFameConstants()
+FAMEML_LOGGER_KW = FAMEML_CONSTANTS.FAMEML_LOGGER_KW
+ENGINE_LOGGER_KW = FAMEML_CONSTANTS.ENGINE_LOGGER_KW
+CACHE_LOGGER_KW  = FAMEML_CONSTANTS.CACHE_LOGGER_KW
+MINING_LOGGER_KW = 'mining'
+
+'''
+top-level subsystem loggers ... the queue handler sits on these, children like fameml.engine propagate to them
+'''
+SUBSYSTEM_LOGGER_LIST = [ FAMEML_LOGGER_KW, MINING_LOGGER_KW ]
+
+'''
+progress lines of a scan stay visible, everything per-file is off unless asked for
+'''
+DEFAULT_LEVEL_DICT = { FAMEML_LOGGER_KW: logging.INFO, ENGINE_LOGGER_KW: logging.WARNING,
+                       CACHE_LOGGER_KW: logging.WARNING, MINING_LOGGER_KW: logging.WARNING }
+
+LEVEL_SPEC_ENV    = 'FAME_LOG_LEVELS'
+LEVEL_SEP_KW      = ','
+LEVEL_ASSIGN_KW   = '='
+LEVEL_ERROR       = 'Unknown log level in "{}"'
+LOG_FORMAT        = '[%(asctime)s] [%(processName)s] [%(name)s] [%(levelname)s] %(message)s'
+DEFAULT_FORMAT    = '%(message)s'
+LOG_DATE_FORMAT   = '%Y-%m-%d %H:%M:%S'
+LOG_FILE_ENCODING = 'utf-8'
+
+'''
+( queue, listener, level dict, process safe ) of the running pipeline, or None
+'''
+LOG_PIPELINE = None
+
+
+class RecordQueueHandler( logging.handlers.QueueHandler ):
+    '''
+    queues the record as is ... message formatting moves to the listener thread. only for in-process queues,
+    a multiprocessing queue needs the stock prepare() so that records pickle
+    '''
+    def prepare( self, record ):
+        return record
+
+
+class DefaultProgressHandler( logging.StreamHandler ):
+    '''
+    progress lines of FAME-ML for a caller that never starts the pipeline, such as a library call of main.runFameML ...
+    like logging.lastResort it writes to the current sys.stderr and stays quiet once the root logger has a handler,
+    so a caller with logging of its own gets each line once
+    '''
+    def __init__( self ):
+        logging.Handler.__init__( self )
+        self.setFormatter( logging.Formatter( DEFAULT_FORMAT ) )
+
+    @property
+    def stream( self ):
+        return sys.stderr
+
+    def handle( self, record ):
+        if logging.getLogger().handlers:
+            return False
+        return logging.StreamHandler.handle( self, record )
+
+
+DEFAULT_HANDLER = DefaultProgressHandler()
+
+
+def setDefaultHandler( on_flag ):
+    '''
+    puts DEFAULT_HANDLER on the fameml logger, at the INFO level of DEFAULT_LEVEL_DICT unless a level is already set,
+    or takes it off while the pipeline runs
+    '''
+    logger_ = logging.getLogger( FAMEML_LOGGER_KW )
+    if not on_flag:
+        logger_.removeHandler( DEFAULT_HANDLER )
+        return
+    logger_.addHandler( DEFAULT_HANDLER )
+    if logger_.level == logging.NOTSET:
+        logger_.setLevel( DEFAULT_LEVEL_DICT[FAMEML_LOGGER_KW] )
+
+
+def parseLevelSpec( spec_str ):
+    '''
+    'fameml.engine=DEBUG,mining=INFO' -> level dict on top of DEFAULT_LEVEL_DICT ... a bare level such as 'DEBUG'
+    applies to every subsystem
+    '''
+    level_dict = dict( DEFAULT_LEVEL_DICT )
+    for item_ in spec_str.split( LEVEL_SEP_KW ):
+        item_ = item_.strip()
+        if len( item_ ) == 0:
+            continue
+        if LEVEL_ASSIGN_KW in item_:
+            name_, level_name = item_.split( LEVEL_ASSIGN_KW, 1 )
+            name_list = [ name_.strip() ]
+        else:
+            level_name, name_list = item_, list( level_dict )
+        level_ = logging.getLevelName( level_name.strip().upper() )
+        if not isinstance( level_, int ):
+            raise ValueError( LEVEL_ERROR.format( item_ ) )
+        for name_ in name_list:
+            level_dict[name_] = level_
+    return level_dict
+
+
+def applyLevels( level_dict ):
+    for name_, level_ in level_dict.items():
+        logging.getLogger( name_ ).setLevel( level_ )
+
+
+def detachQueue():
+    for name_ in SUBSYSTEM_LOGGER_LIST:
+        logger_ = logging.getLogger( name_ )
+        for handler_ in [ handler_ for handler_ in logger_.handlers if isinstance( handler_, logging.handlers.QueueHandler ) ]:
+            logger_.removeHandler( handler_ )
+        logger_.propagate = True
+
+
+def attachQueue( queue_, level_dict, process_safe = True ):
+    '''
+    routes the subsystem loggers of this process into queue_ ... safe to call more than once
+    '''
+    detachQueue()
+    setDefaultHandler( False )
+    for name_ in SUBSYSTEM_LOGGER_LIST:
+        logger_ = logging.getLogger( name_ )
+        logger_.addHandler( logging.handlers.QueueHandler( queue_ ) if process_safe else RecordQueueHandler( queue_ ) )
+        logger_.propagate = False
+    applyLevels( level_dict )
+
+
+def startLogPipeline( level_dict = None, log_path = None, process_safe = False ):
+    '''
+    starts the listener thread, writing to log_path or stderr, and routes the subsystem loggers into its queue ...
+    process_safe uses a multiprocessing queue so that pool workers can join through getWorkerConfig
+    '''
+    global LOG_PIPELINE
+    stopLogPipeline()
+    if level_dict is None:
+        level_dict = dict( DEFAULT_LEVEL_DICT )
+    if log_path is None:
+        handler_ = logging.StreamHandler( sys.stderr )
+    else:
+        handler_ = logging.FileHandler( log_path, encoding = LOG_FILE_ENCODING )
+    handler_.setFormatter( logging.Formatter( LOG_FORMAT, datefmt = LOG_DATE_FORMAT ) )
+    queue_ = multiprocessing.Queue() if process_safe else queue.SimpleQueue()
+    listener_ = logging.handlers.QueueListener( queue_, handler_ )
+    listener_.start()
+    attachQueue( queue_, level_dict, process_safe )
+    LOG_PIPELINE = ( queue_, listener_, level_dict, process_safe )
+    return queue_
+
+
+def getWorkerConfig():
+    '''
+    ( queue, level dict ) for joinLogPipeline in a pool worker ... None unless the pipeline is process safe
+    '''
+    if ( LOG_PIPELINE is None ) or ( not LOG_PIPELINE[3] ):
+        return None
+    return ( LOG_PIPELINE[0], LOG_PIPELINE[2] )
+
+
+def joinLogPipeline( worker_config ):
+    '''
+    worker side of the pipeline ... with None, drops any queue handler inherited from the parent,
+    since nothing drains that queue in this process, and logs through DEFAULT_HANDLER instead
+    '''
+    if worker_config is None:
+        detachQueue()
+        setDefaultHandler( True )
+    else:
+        attachQueue( worker_config[0], worker_config[1] )
+
+
+def stopLogPipeline():
+    '''
+    detaches the loggers, drains the queue and closes the output ... subsystem levels go back to NOTSET and
+    DEFAULT_HANDLER takes over the progress lines again
+    '''
+    global LOG_PIPELINE
+    if LOG_PIPELINE is None:
+        return
+    queue_, listener_, level_dict, process_safe = LOG_PIPELINE
+    detachQueue()
+    listener_.stop()
+    for handler_ in listener_.handlers:
+        handler_.close()
+    if process_safe:
+        queue_.close()
+        queue_.join_thread()
+    applyLevels( { name_: logging.NOTSET for name_ in level_dict } )
+    setDefaultHandler( True )
+    LOG_PIPELINE = None
+
+
+setDefaultHandler( True )
@@ -4,21 +4,23 @@ Nov 20, 2020
 Friday 
 '''
 import os 
-import numpy as np 
+import sys 
 import ast 
 import constants 
 
+# source_reader.py and path_store.py are shared with FAME-ML and live in the package root 
+sys.path.append( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+import source_reader 
+import path_store 
+
 PY_FILE_EXTENSION = '.py'
 NAME_KW = 'name'
 NAMES_KW = 'names' 
 LOGGING_KW = 'logging'
 
 def checkIfParsablePython( pyFile ):
-	flag = True 
-	try:
-		full_tree = ast.parse( open( pyFile ).read())    
-	except (SyntaxError, UnicodeDecodeError) as err_ :
-		flag = False 
+	full_tree, parse_error = source_reader.parseSourceFile( pyFile )
+	flag = parse_error is None 
 	return flag 	
 
 def getAllPythonFilesinRepo(path2dir):
@@ -29,12 +31,12 @@ def getAllPythonFilesinRepo(path2dir):
 			if( os.path.exists( full_path_file ) ):
 				if (file_.endswith( PY_FILE_EXTENSION ) and (checkIfParsablePython( full_path_file ) )   ):
 					valid_list.append(full_path_file) 
-	valid_list = np.unique(  valid_list )
+	valid_list = path_store.PathStore( sorted( set( valid_list ) ) )
 	return valid_list
 
 def hasLogImport( file_ ):
     IMPORT_FLAG = False 
-    tree_object = ast.parse( open( file_ ).read())    
+    tree_object = ast.parse( source_reader.readSource( file_ ) )    
     for stmt_ in tree_object.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Import) :
@@ -144,7 +146,7 @@ def getPythonAtrributeFuncs(pyTree):
     return attrib_call_list 
 
 def getLogStatements( pyFile ): 
-    tree_object = ast.parse( open( pyFile ).read())    
+    tree_object = ast.parse( source_reader.readSource( pyFile ) )    
     func_decl_list = getPythonAtrributeFuncs(tree_object)
     for func_decl_ in func_decl_list:
         func_parent_id, func_name , funcLineNo, call_arg_list = func_decl_ # the class in which the method belongs, func_name, line no, arg_list 
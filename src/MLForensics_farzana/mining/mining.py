@@ -1,4 +1,5 @@
 import os
+import sys
 import pandas as pd 
 import numpy as np
 import csv 
@@ -17,6 +18,10 @@ import logging
 END MODIFICATIONS BY CHRIS HINKSON @CMH02
 '''
 
+# log_pipeline.py is shared with FAME-ML and lives in the package root 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import log_pipeline
+
 
 def giveTimeStamp():
   tsObj = time.time()
@@ -40,7 +45,7 @@ def dumpContentIntoFile(strP, fileP):
     '''
 
     # Log the call
-    logger = logging.getLogger()
+    logger = logging.getLogger(log_pipeline.MINING_LOGGER_KW)
     logger.info(f"Call was made to dump content into file: {str(fileP)}")
 
     # Validate the content string
@@ -98,7 +103,7 @@ def makeChunks(the_list, size_):
     '''
 
     # Log the call
-    logger = logging.getLogger()
+    logger = logging.getLogger(log_pipeline.MINING_LOGGER_KW)
     logger.info(f"Call was made to make chunks for a list!")
 
     # Validate the list
@@ -156,7 +161,7 @@ def checkPythonFile(path2dir):
     '''
 
     # Log the call
-    logger = logging.getLogger()
+    logger = logging.getLogger(log_pipeline.MINING_LOGGER_KW)
     logger.info(f"Call was made to check for patterns in python files!")
 
     # Validate the directory path
@@ -187,9 +192,12 @@ def checkPythonFile(path2dir):
     '''
     BEGIN MODIFICATIONS BY CHRIS HINKSON @CMH02
     '''
-    logger.debug(f"Beginning walk to file looking for patterns!")
-    logger.debug(f"-> Pattern Dictionary: {str(patternDict)}")
-    logger.debug(f"-> OS Walk: {str([i for i in os.walk(path2dir)])}")
+    # the walk dump below costs a second walk of the repo, so it only runs when someone reads it 
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("Beginning walk to file looking for patterns!")
+    logger.debug("-> Pattern Dictionary: %s", patternDict)
+    if debug_on:
+        logger.debug(f"-> OS Walk: {str([i for i in os.walk(path2dir)])}")
     '''
     END MODIFICATIONS BY CHRIS HINKSON @CMH02
     '''
@@ -199,13 +207,14 @@ def checkPythonFile(path2dir):
         '''
         BEGIN MODIFICATIONS BY CHRIS HINKSON @CMH02
         '''
-        logger.debug(f"Checking directory: {str(root_)} with {str(len(filenames))} files!")
-        logger.debug(f"-> Dirnames ({str(len(dirnames))}): ")
-        for dirname in dirnames:
-            logger.debug(f"   --> {str(dirname)}")
-        logger.debug(f"-> Filenames ({str(len(filenames))}): ")
-        for filename in filenames:
-            logger.debug(f"   --> {str(filename)}")
+        if debug_on:
+            logger.debug(f"Checking directory: {str(root_)} with {str(len(filenames))} files!")
+            logger.debug(f"-> Dirnames ({str(len(dirnames))}): ")
+            for dirname in dirnames:
+                logger.debug(f"   --> {str(dirname)}")
+            logger.debug(f"-> Filenames ({str(len(filenames))}): ")
+            for filename in filenames:
+                logger.debug(f"   --> {str(filename)}")
         '''
         END MODIFICATIONS BY CHRIS HINKSON @CMH02
         '''
@@ -217,7 +226,7 @@ def checkPythonFile(path2dir):
                 '''
                 BEGIN MODIFICATIONS BY CHRIS HINKSON @CMH02
                 '''
-                logger.debug(f"--> Checking file: {str(full_path_file)}")
+                logger.debug("--> Checking file: %s", full_path_file)
                 '''
                 END MODIFICATIONS BY CHRIS HINKSON @CMH02
                 '''
@@ -227,7 +236,7 @@ def checkPythonFile(path2dir):
                     '''
                     BEGIN MODIFICATIONS BY CHRIS HINKSON @CMH02
                     '''
-                    logger.debug(f"--> File is a Python file: {str(full_path_file)}")
+                    logger.debug("--> File is a Python file: %s", full_path_file)
                     '''
                     END MODIFICATIONS BY CHRIS HINKSON @CMH02
                     '''
@@ -245,7 +254,7 @@ def checkPythonFile(path2dir):
                                 '''
                                 BEGIN MODIFICATIONS BY CHRIS HINKSON @CMH02
                                 ''' 
-                                logger.debug(f"----> Pattern found: {str(item_)} in file: {str(full_path_file)}")
+                                logger.debug("----> Pattern found: %s in file: %s", item_, full_path_file)
                                 '''
                                 END MODIFICATIONS BY CHRIS HINKSON @CMH02
                                 '''
@@ -262,7 +271,7 @@ def days_between(d1_, d2_): ## pass in date time objects, if string see commente
     '''
 
     # Log the call
-    logger = logging.getLogger()
+    logger = logging.getLogger(log_pipeline.MINING_LOGGER_KW)
     logger.info(f"Call was made to calculate the days between two dates!")
 
     # Validate the date inputs
@@ -357,7 +366,7 @@ def getPythonFileCount(path2dir):
     '''
 
     # Log the call
-    logger = logging.getLogger()
+    logger = logging.getLogger(log_pipeline.MINING_LOGGER_KW)
     logger.info(f"Call was made to get python file count!")
 
     # Validate the directory path
@@ -443,6 +452,7 @@ def cloneRepos(repo_list, dev_threshold=3, python_threshold=0.10, commit_thresho
    
 
 if __name__=='__main__':
+    log_pipeline.startLogPipeline(log_pipeline.parseLevelSpec(os.environ.get(log_pipeline.LEVEL_SPEC_ENV, '')))
     repos_df = pd.read_csv('PARTIAL_REMAINING_GITHUB.csv', sep='delimiter')
     print(repos_df.head())
     list_    = repos_df['url'].tolist()
@@ -465,4 +475,5 @@ if __name__=='__main__':
     t2 = time.time()
     time_diff = round( (t2 - t1 ) / 60, 5) 
     print('Duration: {} minutes'.format(time_diff) )
-    print( '*'*100  )  
\ No newline at end of file
+    print( '*'*100  )
+    log_pipeline.stopLogPipeline()  
\ No newline at end of file
@@ -0,0 +1,88 @@
+'''
+Compact file path store for FAME-ML and the mining scripts
+A file list is kept as a table of distinct directories plus, per file, the index of its directory and its basename in
+one byte buffer. Paths are rebuilt one at a time as they are read, so the file lists of a whole corpus cost a few bytes
+per file and each directory once, instead of a str object ( or a fixed-width numpy unicode slot ) per file
+'''
+
+import os
+import array
+from collections.abc import Sequence
+
+
+PATH_ENCODING_KW = 'utf-8'
+# os.walk hands names that are not valid in the file system encoding back as lone surrogates
+PATH_ERRORS_KW   = 'surrogateescape'
+DIR_TYPECODE     = 'I'
+OFFSET_TYPECODE  = 'Q'
+
+
+class PathStore( Sequence ):
+    '''
+    read-only sequence of paths in the order they were added ... supports len, indexing, iteration and in like the
+    list it replaces. every path comes back exactly as it went in
+    '''
+
+    def __init__( self, path_iter = () ):
+        self.dir_list, self.dir_index = [], {}
+        self.dir_array   = array.array( DIR_TYPECODE )
+        self.name_ends   = array.array( OFFSET_TYPECODE )
+        self.name_buffer = bytearray()
+        self.extendPaths( path_iter )
+
+    def extendPaths( self, path_iter ):
+        '''
+        adds the paths of path_iter in order ... one loop with its lookups bound up front, it runs once per file of the corpus
+        '''
+        dir_index, dir_list = self.dir_index, self.dir_list
+        dir_append, end_append = self.dir_array.append, self.name_ends.append
+        name_buffer = self.name_buffer
+        for path_ in path_iter:
+            # split by hand rather than with os.path.split, which drops repeated separators
+            name_start = path_.rfind( os.sep ) + 1
+            dir_ = path_[:name_start]
+            dir_pos = dir_index.get( dir_ )
+            if dir_pos is None:
+                dir_pos = len( dir_list )
+                dir_index[dir_] = dir_pos
+                dir_list.append( dir_ )
+            dir_append( dir_pos )
+            name_buffer += path_[name_start:].encode( PATH_ENCODING_KW, PATH_ERRORS_KW )
+            end_append( len( name_buffer ) )
+
+    def appendPath( self, path_ ):
+        self.extendPaths( ( path_, ) )
+
+    def __len__( self ):
+        return len( self.dir_array )
+
+    def getPath( self, index_ ):
+        name_start = self.name_ends[index_ - 1] if index_ > 0 else 0
+        name_ = self.name_buffer[name_start:self.name_ends[index_]].decode( PATH_ENCODING_KW, PATH_ERRORS_KW )
+        return self.dir_list[self.dir_array[index_]] + name_
+
+    def __getitem__( self, index_ ):
+        if isinstance( index_, slice ):
+            return [ self.getPath( pos_ ) for pos_ in range( *index_.indices( len( self ) ) ) ]
+        if index_ < 0:
+            index_ += len( self )
+        if not 0 <= index_ < len( self ):
+            raise IndexError( index_ )
+        return self.getPath( index_ )
+
+    def __iter__( self ):
+        '''
+        streams the paths, one str alive at a time
+        '''
+        name_start = 0
+        for dir_pos, name_end in zip( self.dir_array, self.name_ends ):
+            yield self.dir_list[dir_pos] + self.name_buffer[name_start:name_end].decode( PATH_ENCODING_KW, PATH_ERRORS_KW )
+            name_start = name_end
+
+    def __eq__( self, other_ ):
+        if not isinstance( other_, Sequence ):
+            return NotImplemented
+        return len( self ) == len( other_ ) and all( path_ == other_path for path_, other_path in zip( self, other_ ) )
+
+    def __repr__( self ):
+        return '{}({!r})'.format( type( self ).__name__, list( self ) )
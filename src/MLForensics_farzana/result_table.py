@@ -0,0 +1,137 @@
+'''
+Columnar scan results for FAME-ML and the empirical scripts
+A scan can write its results as Parquet or Arrow IPC next to the CSV: repo paths are dictionary-encoded, counts are
+uint32 and the file is compressed. pyarrow is only needed for those formats and is imported when one is used
+'''
+
+import os
+
+
+PARQUET_FORMAT_KW = 'parquet'
+ARROW_FORMAT_KW   = 'arrow'
+CSV_FORMAT_KW     = 'csv'
+TABLE_FORMAT_DICT = { '.parquet': PARQUET_FORMAT_KW, '.arrow': ARROW_FORMAT_KW, '.feather': ARROW_FORMAT_KW, '.csv': CSV_FORMAT_KW }
+COMPRESSION_KW    = 'zstd'
+CSV_ENCODING_KW   = 'utf-8'
+REPO_COLUMN       = 'REPO_FULL_PATH'
+FILE_COLUMN       = 'FILE_FULL_PATH'
+FLAG_COLUMN_LIST  = [ 'LOGGING_PRESENT' ]
+READ_BLOCK_BYTES  = 1 << 24
+FORMAT_ERROR      = 'Unknown result table format "{}", expected one of {}'
+PYARROW_ERROR     = 'pyarrow is needed to read or write {} results, pip install pyarrow'
+
+
+def getTableFormat( result_path ):
+    '''
+    one of the formats of TABLE_FORMAT_DICT, from the extension of result_path ... raises ValueError for any other
+    '''
+    path_ext = os.path.splitext( result_path )[1].lower()
+    if path_ext not in TABLE_FORMAT_DICT:
+        raise ValueError( FORMAT_ERROR.format( result_path, sorted( TABLE_FORMAT_DICT ) ) )
+    return TABLE_FORMAT_DICT[path_ext]
+
+
+def importArrow( table_format ):
+    try:
+        import pyarrow
+    except ImportError as err_:
+        raise ImportError( PYARROW_ERROR.format( table_format ) ) from err_
+    return pyarrow
+
+
+def checkTableWriter( result_path ):
+    '''
+    raises before a scan starts if result_path can not be written: ValueError for a CSV or unknown extension,
+    ImportError without pyarrow
+    '''
+    table_format = getTableFormat( result_path )
+    if table_format == CSV_FORMAT_KW:
+        raise ValueError( FORMAT_ERROR.format( result_path, [ PARQUET_FORMAT_KW, ARROW_FORMAT_KW ] ) )
+    importArrow( table_format )
+
+
+def getResultSchema( csv_header ):
+    '''
+    repo paths as a dictionary, file paths as strings, flags as uint8 and every other column as uint32
+    '''
+    pyarrow = importArrow( PARQUET_FORMAT_KW )
+    field_list = []
+    for column_ in csv_header:
+        if column_ == REPO_COLUMN:
+            field_list.append( pyarrow.field( column_, pyarrow.dictionary( pyarrow.int32(), pyarrow.string() ) ) )
+        elif column_ == FILE_COLUMN:
+            field_list.append( pyarrow.field( column_, pyarrow.string() ) )
+        elif column_ in FLAG_COLUMN_LIST:
+            field_list.append( pyarrow.field( column_, pyarrow.uint8() ) )
+        else:
+            field_list.append( pyarrow.field( column_, pyarrow.uint32() ) )
+    return pyarrow.schema( field_list )
+
+
+class RepoDictionary:
+    '''
+    one repo dictionary for all blocks of an Arrow IPC file ... every CSV block is dictionary-encoded on its own, an IPC
+    file only takes a dictionary that grows, which the writer then sends as deltas
+    '''
+
+    def __init__( self, pyarrow ):
+        self.pyarrow, self.repo_list, self.index_dict = pyarrow, [], {}
+
+    def unifyBatch( self, batch_ ):
+        repo_pos = batch_.schema.get_field_index( REPO_COLUMN )
+        repo_column = batch_.column( repo_pos )
+        index_list = []
+        for repo_ in repo_column.dictionary.to_pylist():
+            if repo_ not in self.index_dict:
+                self.index_dict[repo_] = len( self.repo_list )
+                self.repo_list.append( repo_ )
+            index_list.append( self.index_dict[repo_] )
+        index_array = self.pyarrow.array( index_list, self.pyarrow.int32() ).take( repo_column.indices )
+        repo_column = self.pyarrow.DictionaryArray.from_arrays( index_array, self.pyarrow.array( self.repo_list, self.pyarrow.string() ) )
+        return batch_.set_column( repo_pos, batch_.schema.field( repo_pos ), repo_column )
+
+
+def writeResultTable( csv_path, result_path, csv_header ):
+    '''
+    converts the CSV of a scan to result_path, in the format of its extension ... the CSV is read in blocks of
+    READ_BLOCK_BYTES, so memory does not grow with the corpus. returns the number of rows
+    '''
+    table_format = getTableFormat( result_path )
+    pyarrow = importArrow( table_format )
+    from pyarrow import csv as arrow_csv
+    schema_ = getResultSchema( csv_header )
+    read_options    = arrow_csv.ReadOptions( block_size = READ_BLOCK_BYTES, encoding = CSV_ENCODING_KW )
+    # the csv module quotes paths with commas or newlines in them
+    parse_options   = arrow_csv.ParseOptions( newlines_in_values = True )
+    convert_options = arrow_csv.ConvertOptions( column_types = schema_, strings_can_be_null = False )
+    reader_ = arrow_csv.open_csv( csv_path, read_options = read_options, parse_options = parse_options, convert_options = convert_options )
+    row_count, repo_dictionary = 0, None
+    if table_format == PARQUET_FORMAT_KW:
+        from pyarrow import parquet
+        writer_ = parquet.ParquetWriter( result_path, schema_, compression = COMPRESSION_KW, use_dictionary = [ REPO_COLUMN ] )
+    else:
+        repo_dictionary = RepoDictionary( pyarrow )
+        ipc_options = pyarrow.ipc.IpcWriteOptions( compression = COMPRESSION_KW, emit_dictionary_deltas = True )
+        writer_ = pyarrow.ipc.new_file( result_path, schema_, options = ipc_options )
+    with writer_:
+        for batch_ in reader_:
+            if repo_dictionary is not None:
+                batch_ = repo_dictionary.unifyBatch( batch_ )
+            writer_.write_batch( batch_ )
+            row_count += batch_.num_rows
+    return row_count
+
+
+def readResultTable( result_path, column_list = None ):
+    '''
+    pandas DataFrame of a result file in any format of TABLE_FORMAT_DICT ... from Parquet and Arrow the repo column is
+    categorical and the counts keep their unsigned dtypes. column_list reads only those columns
+    '''
+    import pandas as pd
+    table_format = getTableFormat( result_path )
+    if table_format == CSV_FORMAT_KW:
+        return pd.read_csv( result_path, usecols = column_list )
+    importArrow( table_format )
+    if table_format == PARQUET_FORMAT_KW:
+        return pd.read_parquet( result_path, columns = column_list )
+    return pd.read_feather( result_path, columns = column_list )
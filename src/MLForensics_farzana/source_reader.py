@@ -0,0 +1,114 @@
+'''
+Shared source file reader for FAME-ML and the mining scripts
+Every file is read once as bytes, or memory-mapped when it is large, and its handle is closed as soon as the caller is
+done with it. The encoding comes from the file itself ( BOM or PEP 263 coding cookie, see tokenize.detect_encoding ),
+and the parser gets the bytes as they are
+'''
+
+import os
+import re
+import ast
+import mmap
+import tokenize
+import contextlib
+
+
+MMAP_MIN_BYTES    = 1 << 20
+NEWLINE_BYTE      = b'\n'
+NON_ASCII_PATTERN = re.compile( rb'[^\x00-\x7f]' )
+DECODE_ERROR_KW   = 'strict'
+DEFAULT_ENCODING_KW = 'utf-8'
+UNDECODABLE_KW    = 'UnicodeDecodeError'
+
+'''
+what a file can fail to parse with, besides memory errors
+'''
+PARSE_ERROR_TUPLE = ( SyntaxError, UnicodeDecodeError, ValueError, RecursionError )
+
+
+@contextlib.contextmanager
+def openSource( py_file ):
+    '''
+    yields the content of py_file, read with one bounded read or memory-mapped from MMAP_MIN_BYTES on ... the content is
+    bytes or an mmap and is only valid inside the with block. either way it supports len, find, slicing, hashing,
+    re and ast.parse, but not the in operator for more than one byte
+    '''
+    with open( py_file, 'rb' ) as file_:
+        size_ = os.fstat( file_.fileno() ).st_size
+        if size_ < MMAP_MIN_BYTES:
+            yield file_.read( size_ )
+        else:
+            with mmap.mmap( file_.fileno(), 0, access = mmap.ACCESS_READ ) as buffer_:
+                yield buffer_
+
+
+def readSource( py_file ):
+    '''
+    content of py_file as bytes, with the handle closed
+    '''
+    with open( py_file, 'rb' ) as file_:
+        return file_.read( os.fstat( file_.fileno() ).st_size )
+
+
+def getSourceEncoding( source_ ):
+    '''
+    encoding Python would read source_ with ... raises SyntaxError for an unknown or conflicting coding cookie
+    '''
+    position_list = [ 0 ]
+    def readLine():
+        # detect_encoding reads at most two lines, so only those are copied out of source_
+        start_ = position_list[0]
+        end_ = source_.find( NEWLINE_BYTE, start_ )
+        end_ = len( source_ ) if end_ < 0 else end_ + 1
+        position_list[0] = end_
+        return source_[start_:end_]
+    return tokenize.detect_encoding( readLine )[0]
+
+
+def isAsciiSource( source_ ):
+    if isinstance( source_, bytes ):
+        return source_.isascii()
+    return NON_ASCII_PATTERN.search( source_ ) is None
+
+
+def decodeSource( source_, errors_ = DECODE_ERROR_KW ):
+    '''
+    source_ as text in its own encoding, without a BOM
+    '''
+    return str( source_, getSourceEncoding( source_ ), errors_ )
+
+
+def getParseErrorName( source_, err_ ):
+    '''
+    the parser reports bytes that do not decode as a SyntaxError ... those are named UnicodeDecodeError, as decoding
+    the file would name them
+    '''
+    if isinstance( err_, SyntaxError ):
+        try:
+            encoding_ = getSourceEncoding( source_ )
+        except SyntaxError:
+            # detect_encoding also gives up on a first line that does not decode, the parser then reads UTF-8
+            encoding_ = DEFAULT_ENCODING_KW
+        try:
+            str( source_, encoding_, DECODE_ERROR_KW )
+        except UnicodeDecodeError:
+            return UNDECODABLE_KW
+    return type( err_ ).__name__
+
+
+def parseSource( source_ ):
+    '''
+    returns ( tree, None ), or ( None, error class name ) when source_ is not valid Python
+    '''
+    try:
+        return ast.parse( source_ ), None
+    except PARSE_ERROR_TUPLE as err_:
+        return None, getParseErrorName( source_, err_ )
+
+
+def parseSourceFile( py_file ):
+    '''
+    parseSource on the content of py_file
+    '''
+    with openSource( py_file ) as source_:
+        return parseSource( source_ )
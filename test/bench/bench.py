@@ -0,0 +1,121 @@
+'''
+Name: bench.py
+Description: Main entry point for FAME-ML throughput benchmarks.
+
+Usage:
+	python -m test.bench.bench                      # run every scenario and compare with test/bench/baselines.json
+	python -m test.bench.bench --scenario sparse    # run one scenario
+	python -m test.bench.bench --update-baseline    # store this run as the new baseline
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import argparse
+import tempfile
+import textwrap
+
+# Bench Submodule Imports
+from .logging import BenchLogger
+from .benchmanager import BenchManager, BENCH_SCENARIOS
+
+'''
+DEFAULT PATHS
+'''
+
+FP_BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+FP_SUMMARY = "benchmarksummary.md"
+
+if __name__ == "__main__":
+
+	'''
+	ARGUMENT PARSING
+	'''
+
+	parser = argparse.ArgumentParser(description="Benchmark FAME-ML on deterministic synthetic corpora")
+	parser.add_argument("--scenario", choices=list(BENCH_SCENARIOS) + ["all"], default="all", help="scenario to run (default: all)")
+	parser.add_argument("--repeats", type=int, default=3, help="timings are the best of this many runs (default: 3)")
+	parser.add_argument("--workers", type=int, default=1, help="worker processes for the runFameML timing (default: 1)")
+	parser.add_argument("--seed", type=int, default=0, help="corpus generator seed, baselines assume 0")
+	parser.add_argument("--baseline", default=FP_BASELINES, help="baseline JSON file")
+	parser.add_argument("--update-baseline", action="store_true", help="write this run into the baseline file")
+	parser.add_argument("--tolerance", type=float, default=0.2, help="slowdown that counts as a regression (default: 0.2)")
+	parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 when any metric regressed")
+	parser.add_argument("--corpus-dir", default=None, help="keep the generated corpora here instead of a temporary directory")
+	parser.add_argument("--summary", default=FP_SUMMARY, help="markdown summary file")
+	benchArgs = parser.parse_args()
+
+	# Initialize logger
+	logger = BenchLogger()
+	logger.info("Benchmark Logger Initialized!")
+
+	'''
+	BENCHMARK EXECUTION
+	'''
+
+	scenarioNames = list(BENCH_SCENARIOS) if benchArgs.scenario == "all" else [benchArgs.scenario]
+	benchManager = BenchManager(repeats=benchArgs.repeats, workers=benchArgs.workers, seed=benchArgs.seed)
+	baselines = BenchManager.loadBaselines(benchArgs.baseline)
+	benchResults = {}
+	with tempfile.TemporaryDirectory() as temporaryDirectory:
+		workDir = benchArgs.corpus_dir or temporaryDirectory
+		os.makedirs(workDir, exist_ok=True)
+		for scenarioName in scenarioNames:
+			logger.info(f"=== Running scenario: {scenarioName} ===")
+			benchResults[scenarioName] = benchManager.runScenario(scenarioName, workDir)
+
+	'''
+	BASELINE COMPARISON
+	'''
+
+	# Baselines from another machine are still printed, but mostly tell relative changes between scenarios
+	if baselines["machine"] and baselines["machine"] != BenchManager.getMachineInfo():
+		logger.info(f"Baselines were recorded on another machine: {baselines['machine']}")
+
+	summary = textwrap.dedent(f"""
+			# FAME-ML Benchmark Summary
+
+			Machine: {BenchManager.getMachineInfo()}
+			Repeats: {benchArgs.repeats}, Workers: {benchArgs.workers}, Tolerance: {benchArgs.tolerance:.0%}
+			""")
+	regressionCount = 0
+	for scenarioName, scenarioResults in benchResults.items():
+		metricRows = BenchManager.compareToBaseline(scenarioResults, baselines["scenarios"].get(scenarioName), benchArgs.tolerance)
+		summary += textwrap.dedent(f"""
+				## Scenario: {scenarioName}
+
+				Files: {scenarioResults['files']}, Bytes: {scenarioResults['bytes']}, Planted rule lines: {scenarioResults['plantedRules']}
+
+				| Metric | Current | Baseline | Speedup |
+				| --- | --- | --- | --- |
+				""")
+		for metricRow in metricRows:
+			baselineText = "-" if metricRow["baseline"] is None else f"{metricRow['baseline']:.4f}"
+			speedupText = "-" if metricRow["speedup"] is None else f"{metricRow['speedup']:.2f}x"
+			if metricRow["regressed"]:
+				speedupText += " REGRESSED"
+				regressionCount += 1
+			summary += f"| {metricRow['metric']} | {metricRow['current']:.4f} | {baselineText} | {speedupText} |\n"
+	summary += f"\nRegressed metrics: {regressionCount}\n"
+	logger.info(summary)
+
+	# Write summary to md file for viewing
+	with open(benchArgs.summary, "w") as summaryFile:
+		summaryFile.write(summary)
+
+	'''
+	BASELINE UPDATE
+	'''
+
+	if benchArgs.update_baseline:
+		baselines["machine"] = BenchManager.getMachineInfo()
+		baselines["scenarios"].update(benchResults)
+		BenchManager.saveBaselines(benchArgs.baseline, baselines)
+		logger.info(f"Baselines written to {benchArgs.baseline}!")
+
+	if benchArgs.fail_on_regression and regressionCount > 0:
+		sys.exit(1)
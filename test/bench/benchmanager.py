@@ -0,0 +1,246 @@
+'''
+Name: benchmanager.py
+Description: Provides a benchmark manager that times FAME-ML on synthetic corpora and compares against stored baselines.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import json
+import time
+import platform
+from typing import Any, Dict, List
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import py_parser # type: ignore[reportMissingImports]
+# py_parser puts the package root, where source_reader lives, on the path
+import source_reader # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Bench Submodule Imports
+from .logging import BenchLogger
+from .corpusgenerator import CorpusGenerator
+
+'''
+SCENARIO DEFINITIONS
+
+Every scenario is a corpus shape, see CorpusGenerator.generateCorpus. Changing one invalidates its stored baseline.
+'''
+
+BENCH_SCENARIOS = {
+	"mixed": {"repoCount": 4, "filesPerRepo": 50, "linesPerFile": (80, 240), "defaultDensity": 0.01, "densityDict": {}},
+	"largeFiles": {"repoCount": 2, "filesPerRepo": 8, "linesPerFile": (3000, 5000), "defaultDensity": 0.005, "densityDict": {}},
+	"dense": {"repoCount": 4, "filesPerRepo": 25, "linesPerFile": (80, 240), "defaultDensity": 0.008, "densityDict": {}},
+	"sparse": {"repoCount": 4, "filesPerRepo": 50, "linesPerFile": (80, 240), "defaultDensity": 0.0, "densityDict": {}},
+	"torchHeavy": {"repoCount": 4, "filesPerRepo": 25, "linesPerFile": (80, 240), "defaultDensity": 0.0, "densityDict": {"torch.load": 0.05, "pickle.load": 0.05, "gym.make": 0.02}},
+}
+
+'''
+metric path -> True when higher is better
+'''
+BENCH_METRICS = {
+	"getCSVData.filesPerSec": True,
+	"getCSVData.mbPerSec": True,
+	"runFameML.filesPerSec": True,
+	"runFameML.mbPerSec": True,
+}
+
+'''
+CLASS DEFINITION
+'''
+
+class BenchManager():
+	'''
+	# Bench Manager Class
+
+	This class will time getCSVData, runFameML and every detector on a generated corpus.
+	Every timing is the best of several repeats.
+	'''
+
+	def __init__(self, repeats: int = 3, workers: int = 1, seed: int = 0):
+
+		# Get logger
+		self.logger = BenchLogger()
+
+		# Keep the run settings
+		self.repeats = repeats
+		self.workers = workers
+		self.generator = CorpusGenerator(seed)
+
+	def bestOf(self, timedFunction: callable) -> float:
+		'''
+		## Best Of
+
+		Run timedFunction self.repeats times and return the fastest wall time in seconds.
+		'''
+		bestSeconds = None
+		for _ in range(self.repeats):
+			startTime = time.perf_counter()
+			timedFunction()
+			elapsedSeconds = time.perf_counter() - startTime
+			if bestSeconds is None or elapsedSeconds < bestSeconds:
+				bestSeconds = elapsedSeconds
+		return bestSeconds
+
+	def timeGetCSVData(self, repoFileList: List[tuple]) -> float:
+		'''
+		## Time getCSVData
+
+		Time getCSVData over every repository, serially and without printing hits.
+		'''
+		def runAllRepos():
+			for repoPath, fileList in repoFileList:
+				fameml_main.getCSVData(fileList, repoPath)
+		fameml_main.initWorkerState(None)
+		return self.bestOf(runAllRepos)
+
+	def timeRunFameML(self, corpusDir: str, workDir: str) -> float:
+		'''
+		## Time runFameML
+
+		Time a full runFameML scan of corpusDir, CSV included, with self.workers workers.
+		'''
+		csvPath = os.path.join(workDir, "bench.csv")
+		return self.bestOf(lambda: fameml_main.runFameML(corpusDir, csvPath, self.workers, console_mode=constants.CONSOLE_NONE_KW))
+
+	def timeDetectors(self, fileList: List[str]) -> Dict[str, float]:
+		'''
+		## Time Detectors
+
+		Time the parse on its own, then the tree walk and matching of each detector on its own over the parsed trees.
+		'combined' is the single walk that serves every detector, as getDetectorHits runs it.
+		'''
+
+		# Read every file up front so that disk time stays out of the numbers
+		sourceList = []
+		for filePath in fileList:
+			with open(filePath, "rb") as sourceFile:
+				sourceList.append(sourceFile.read())
+
+		# Time the parse
+		treeList = []
+		def parseAll():
+			treeList.clear()
+			for sourceBytes in sourceList:
+				treeList.append(source_reader.parseSource(sourceBytes)[0])
+		detectorSeconds = {"parse": self.bestOf(parseAll)}
+
+		# Time the walk of each detector, then all of them together
+		for detectorName in constants.DETECTOR_LIST + ["combined"]:
+			detectorList = constants.DETECTOR_LIST if detectorName == "combined" else [detectorName]
+			ruleIndex = lint_engine.getRuleIndex(detectorList)
+			def walkAll():
+				for pyTree in treeList:
+					lint_engine.getStreamedCallSiteHits(py_parser.iterCompactCallSites(pyTree, list(ruleIndex)), ruleIndex, detectorList)
+			detectorSeconds[detectorName] = self.bestOf(walkAll)
+		return detectorSeconds
+
+	def runScenario(self, scenarioName: str, workDir: str) -> Dict[str, Any]:
+		'''
+		## Run Scenario
+
+		Generate the corpus of a scenario under workDir and benchmark it.
+
+		Returns:
+			out (Dict[str, Any]): Corpus size, getCSVData and runFameML throughput, and per-detector seconds.
+		'''
+
+		# Generate the corpus
+		scenario = BENCH_SCENARIOS[scenarioName]
+		corpusDir = os.path.join(workDir, scenarioName)
+		corpusStats = self.generator.generateCorpus(
+			corpusDir=corpusDir,
+			repoCount=scenario["repoCount"],
+			filesPerRepo=scenario["filesPerRepo"],
+			linesPerFile=scenario["linesPerFile"],
+			densityDict=scenario["densityDict"],
+			defaultDensity=scenario["defaultDensity"]
+		)
+		self.logger.info(f"Generated scenario '{scenarioName}': {corpusStats['files']} files, {corpusStats['bytes']} bytes, {sum(corpusStats['rules'].values())} planted rule lines")
+
+		# List the files like runFameML does
+		repoFileList = []
+		for repoEntry in sorted(os.scandir(corpusDir), key=lambda entry: entry.name):
+			repoFileList.append((repoEntry.path, fameml_main.getAllPythonFilesinRepo(repoEntry.path)))
+		fileList = [filePath for _, repoFiles in repoFileList for filePath in repoFiles]
+
+		# Time everything
+		megaBytes = corpusStats["bytes"] / 1e6
+		scenarioResults = {"files": corpusStats["files"], "bytes": corpusStats["bytes"], "plantedRules": sum(corpusStats["rules"].values())}
+		for stageName, stageSeconds in [("getCSVData", self.timeGetCSVData(repoFileList)), ("runFameML", self.timeRunFameML(corpusDir, workDir))]:
+			scenarioResults[stageName] = {
+				"seconds": stageSeconds,
+				"filesPerSec": corpusStats["files"] / stageSeconds,
+				"mbPerSec": megaBytes / stageSeconds
+			}
+			self.logger.info(f" -> {stageName}: {scenarioResults[stageName]['filesPerSec']:.1f} files/sec, {scenarioResults[stageName]['mbPerSec']:.2f} MB/sec")
+		scenarioResults["detectors"] = self.timeDetectors(fileList)
+		return scenarioResults
+
+	@staticmethod
+	def getMachineInfo() -> Dict[str, str]:
+		return {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.machine(), "cpus": str(os.cpu_count())}
+
+	@staticmethod
+	def loadBaselines(baselinePath: str) -> Dict[str, Any]:
+		if not os.path.exists(baselinePath):
+			return {"machine": {}, "scenarios": {}}
+		with open(baselinePath) as baselineFile:
+			return json.load(baselineFile)
+
+	@staticmethod
+	def saveBaselines(baselinePath: str, baselines: Dict[str, Any]) -> None:
+		with open(baselinePath, "w") as baselineFile:
+			json.dump(baselines, baselineFile, indent=2, sort_keys=True)
+			baselineFile.write("\n")
+
+	@staticmethod
+	def compareToBaseline(scenarioResults: Dict[str, Any], scenarioBaseline: Dict[str, Any] | None, tolerance: float) -> List[Dict[str, Any]]:
+		'''
+		## Compare To Baseline
+
+		Compare the throughput metrics and per-detector seconds of one scenario with its baseline.
+
+		Args:
+			scenarioResults (Dict[str, Any]): Output of runScenario.
+			scenarioBaseline (Dict[str, Any] | None): Stored output of runScenario, or None if there is none yet.
+			tolerance (float): Allowed slowdown, e.g. 0.2 flags anything more than 20% slower.
+
+		Returns:
+			out (List[Dict[str, Any]]): One row per metric with current, baseline, speedup (above 1 is faster) and regressed.
+		'''
+
+		# Gather the metrics of this run, throughput first and then detector seconds
+		metricRows = []
+		for metricPath, higherIsBetter in BENCH_METRICS.items():
+			stageName, metricName = metricPath.split(".")
+			metricRows.append({"metric": metricPath, "current": scenarioResults[stageName][metricName], "higherIsBetter": higherIsBetter})
+		for detectorName, detectorSeconds in scenarioResults["detectors"].items():
+			metricRows.append({"metric": f"detectors.{detectorName}", "current": detectorSeconds, "higherIsBetter": False})
+
+		# Fill in the baseline side
+		for metricRow in metricRows:
+			groupName, metricName = metricRow["metric"].split(".")
+			baselineValue = None
+			if scenarioBaseline is not None:
+				baselineValue = scenarioBaseline.get(groupName, {}).get(metricName)
+			metricRow["baseline"] = baselineValue
+			if not baselineValue or not metricRow["current"]:
+				metricRow["speedup"] = None
+				metricRow["regressed"] = False
+				continue
+			if metricRow["higherIsBetter"]:
+				metricRow["speedup"] = metricRow["current"] / baselineValue
+			else:
+				metricRow["speedup"] = baselineValue / metricRow["current"]
+			metricRow["regressed"] = metricRow["speedup"] < 1.0 - tolerance
+		return metricRows
@@ -0,0 +1,174 @@
+'''
+Name: corpusgenerator.py
+Description: Provides a deterministic synthetic corpus generator for benchmarking.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import random
+from typing import Dict, List, Tuple
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+
+'''
+CLASS DEFINITION
+'''
+
+class CorpusGenerator():
+	'''
+	# Corpus Generator Class
+
+	This class will write synthetic repositories made of filler code with rule patterns mixed in.
+	The same seed and settings always give byte-identical files.
+	'''
+
+	def __init__(self, seed: int = 0):
+
+		# Keep the seed so every corpus starts from the same state
+		self.seed = seed
+
+		# Build the snippet for every enabled rule once
+		self.ruleSnippets = CorpusGenerator.getRuleSnippets()
+
+	@staticmethod
+	def getRuleSnippets() -> Dict[str, str]:
+		'''
+		# Get Rule Snippets
+
+		Build one line of code per rule in constants.RULE_LIST that the rule's extractor picks up.
+
+		Returns:
+			out (Dict[str, str]): Rule id (see lint_engine.getRuleId) to a snippet with {v} and {w} variable slots.
+		'''
+
+		# Make a snippet for each rule, shaped after its extractor
+		ruleSnippets = {}
+		for detectorName, extractorKind, receiver, method, minArgs in constants.RULE_LIST:
+			callArgs = ", ".join(f"arg_{i}" for i in range(max(minArgs, 1)))
+			if extractorKind == constants.ATTRIB_FUNCS_KW:
+				snippet = f"{{v}} = {receiver}.{method}({callArgs})"
+			elif extractorKind == constants.FUNC_ASSIGNMENTS_KW:
+				snippet = f"{{v}} = {method}({callArgs})"
+			elif extractorKind == constants.FUNC_DEFINITIONS_KW:
+				snippet = f"{method}({callArgs})"
+			elif extractorKind == constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW:
+				snippet = f"{{v}}, {{w}} = {method}({callArgs})"
+			else:
+				snippet = f"{{v}}_{constants.LABEL_KW}, {{w}} = {method}({callArgs})"
+			ruleSnippets[lint_engine.getRuleId(detectorName, extractorKind, receiver, method)] = snippet
+		return ruleSnippets
+
+	def makeFilePatterns(self, rng: random.Random, lineCount: int, densityDict: Dict[str, float], defaultDensity: float) -> List[str]:
+		'''
+		# Make File Patterns
+
+		Draw the rule (or None for filler) of every line of one file.
+
+		Args:
+			rng (random.Random): Generator state of the corpus.
+			lineCount (int): Lines in the file.
+			densityDict (Dict[str, float]): Rule id or rule target (e.g. torch.load) to the chance that a line uses it.
+			defaultDensity (float): Chance for every rule not listed in densityDict.
+
+		Returns:
+			out (List[str]): One rule id or None per line.
+		'''
+
+		# Resolve the density of every rule, a rule id beats a rule target
+		ruleIds = list(self.ruleSnippets)
+		ruleDensities = []
+		for ruleId in ruleIds:
+			ruleTarget = ruleId.split("/")[-1]
+			ruleDensities.append(densityDict.get(ruleId, densityDict.get(ruleTarget, defaultDensity)))
+
+		# A line is filler with whatever chance is left
+		fillerDensity = max(0.0, 1.0 - sum(ruleDensities))
+		return rng.choices(ruleIds + [None], weights=ruleDensities + [fillerDensity], k=lineCount)
+
+	@staticmethod
+	def makeFillerLine(rng: random.Random, lineIndex: int) -> str:
+		'''
+		# Make Filler Line
+
+		Make one line of plain code that no rule matches.
+		'''
+		fillerKind = rng.randrange(4)
+		if fillerKind == 0:
+			return f"value_{lineIndex} = value_{rng.randrange(lineIndex + 1)} + {rng.randrange(1000)}"
+		elif fillerKind == 1:
+			return f"# stage {lineIndex}: scale by {rng.randrange(1000)}"
+		elif fillerKind == 2:
+			return f"items_{lineIndex} = [n * {rng.randrange(1000)} for n in range({rng.randrange(1, 64)})]"
+		return f"total_{lineIndex} = sum(items_{rng.randrange(lineIndex + 1)}) if flag_{lineIndex % 7} else {rng.randrange(1000)}"
+
+	def makeFileSource(self, rng: random.Random, lineCount: int, densityDict: Dict[str, float], defaultDensity: float) -> Tuple[str, Dict[str, int]]:
+		'''
+		# Make File Source
+
+		Make the source of one synthetic file.
+
+		Returns:
+			out (Tuple[str, Dict[str, int]]): Source text and how many lines use each rule id.
+		'''
+		sourceLines = []
+		ruleCounts = {}
+		for lineIndex, ruleId in enumerate(self.makeFilePatterns(rng, lineCount, densityDict, defaultDensity)):
+			if ruleId is None:
+				sourceLines.append(CorpusGenerator.makeFillerLine(rng, lineIndex))
+			else:
+				sourceLines.append(self.ruleSnippets[ruleId].format(v=f"out_{lineIndex}", w=f"aux_{lineIndex}"))
+				ruleCounts[ruleId] = ruleCounts.get(ruleId, 0) + 1
+		return "\n".join(sourceLines) + "\n", ruleCounts
+
+	def generateCorpus(self, corpusDir: str, repoCount: int, filesPerRepo: int, linesPerFile: Tuple[int, int], densityDict: Dict[str, float] | None = None, defaultDensity: float = 0.01) -> Dict[str, int]:
+		'''
+		# Generate Corpus
+
+		Write repoCount repositories of filesPerRepo files each under corpusDir.
+
+		Args:
+			corpusDir (str): Directory to write the repositories into, laid out like runFameML expects.
+			repoCount (int): Number of repositories.
+			filesPerRepo (int): Python files per repository.
+			linesPerFile (Tuple[int, int]): Smallest and largest line count of a file.
+			densityDict (Dict[str, float] | None): Per-rule line densities, see makeFilePatterns.
+			defaultDensity (float): Line density of every other rule.
+
+		Returns:
+			out (Dict[str, int]): Files, bytes and lines written, and the planted count of every rule id.
+		'''
+
+		# Start from the seed every time
+		rng = random.Random(self.seed)
+		densityDict = densityDict or {}
+		corpusStats = {"files": 0, "bytes": 0, "lines": 0, "rules": {}}
+
+		# Write the repositories
+		for repoIndex in range(repoCount):
+			repoPath = os.path.join(corpusDir, f"repo_{repoIndex:03d}")
+			os.makedirs(repoPath, exist_ok=True)
+			for fileIndex in range(filesPerRepo):
+				lineCount = rng.randint(linesPerFile[0], linesPerFile[1])
+				fileSource, ruleCounts = self.makeFileSource(rng, lineCount, densityDict, defaultDensity)
+				fileBytes = fileSource.encode("utf-8")
+				with open(os.path.join(repoPath, f"module_{fileIndex:04d}.py"), "wb") as sourceFile:
+					sourceFile.write(fileBytes)
+
+				# Track what was written
+				corpusStats["files"] += 1
+				corpusStats["bytes"] += len(fileBytes)
+				corpusStats["lines"] += lineCount
+				for ruleId, ruleCount in ruleCounts.items():
+					corpusStats["rules"][ruleId] = corpusStats["rules"].get(ruleId, 0) + ruleCount
+
+		return corpusStats
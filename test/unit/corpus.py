@@ -0,0 +1,34 @@
+'''
+Name: corpus.py
+Description: Sample corpora shared by the unit tests.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+
+'''
+SAMPLE CORPUS
+'''
+
+def writeSampleCorpus(corpusPath: str, repoSpecList: list, importLine: str = "import torch\n", loadLine: str = "x = torch.load(f)\n") -> list:
+    '''
+    Writes one repository per ( name, file count, loads in the first file ) of repoSpecList under corpusPath. File i of a
+    repository is script_i.py, importLine followed by loadLine repeated i more times than in the first file.
+    Returns the list of ( repository path, file paths ).
+    '''
+    repoFileList = []
+    for repoName, fileCount, firstLoads in repoSpecList:
+        repoPath = os.path.join(corpusPath, repoName)
+        os.makedirs(repoPath, exist_ok=True)
+        fileList = []
+        for i in range(fileCount):
+            scriptPath = os.path.join(repoPath, f"script_{i}.py")
+            with open(scriptPath, "w") as scriptFile:
+                scriptFile.write(importLine + loadLine * (firstLoads + i))
+            fileList.append(scriptPath)
+        repoFileList.append((repoPath, fileList))
+    return repoFileList
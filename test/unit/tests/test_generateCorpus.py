@@ -0,0 +1,102 @@
+'''
+Name: test_generateCorpus.py
+Description: Unit tests for the benchmark corpus generator.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+from test.bench.corpusgenerator import CorpusGenerator
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def readCorpus(corpusPath):
+	'''
+	Reads every file of a generated corpus into a dict of relative path -> bytes.
+	'''
+	corpusFiles = {}
+	for rootPath, _, fileNames in os.walk(corpusPath):
+		for fileName in fileNames:
+			with open(os.path.join(rootPath, fileName), "rb") as corpusFile:
+				corpusFiles[os.path.relpath(os.path.join(rootPath, fileName), corpusPath)] = corpusFile.read()
+	return corpusFiles
+
+def test_generateCorpus_sameSeedSameBytes(tmp_path):
+	'''
+	## Unit Test: test_generateCorpus_sameSeedSameBytes
+
+	Test that two corpora generated with the same seed and settings are byte-identical, and that another seed differs.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_generateCorpus_sameSeedSameBytes!")
+
+	# Generate three corpora
+	for corpusName, seed in [("first", 7), ("second", 7), ("other", 8)]:
+		CorpusGenerator(seed).generateCorpus(str(tmp_path / corpusName), 2, 3, (20, 40), defaultDensity=0.02)
+
+	# Assert that only the seed changes the output
+	assert readCorpus(tmp_path / "first") == readCorpus(tmp_path / "second")
+	assert readCorpus(tmp_path / "first") != readCorpus(tmp_path / "other")
+
+@pytest.mark.parametrize("densityDict,defaultDensity", [
+	({"torch.load": 0.1, "gym.make": 0.05}, 0.0),
+	({}, 0.01),
+])
+def test_generateCorpus_plantedRulesAreDetected(tmp_path, densityDict: dict, defaultDensity: float):
+	'''
+	## Unit Test: test_generateCorpus_plantedRulesAreDetected
+
+	Test that every planted rule line is found by the engine under its own rule id, and that nothing but planted call targets is found.
+	Rules that share a call target (e.g. env.step) both fire on one planted line.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_generateCorpus_plantedRulesAreDetected!")
+
+	# Generate the corpus
+	corpusStats = CorpusGenerator(1).generateCorpus(str(tmp_path), 2, 4, (50, 100), densityDict, defaultDensity)
+	assert corpusStats["files"] == 8
+
+	# Count the hits of every rule id
+	foundRules = {}
+	for relativePath in readCorpus(tmp_path):
+		hitDict = lint_engine.getDetectorHits(str(tmp_path / relativePath))
+		for detectorName in constants.DETECTOR_LIST:
+			for _, ruleId in hitDict[detectorName]:
+				foundRules[ruleId] = foundRules.get(ruleId, 0) + 1
+
+	# Assert the engine found every planted line and nothing beyond the planted call targets
+	for ruleId, plantedCount in corpusStats["rules"].items():
+		assert foundRules.get(ruleId, 0) >= plantedCount
+	plantedTargets = {ruleId.split("/")[-1].split(".")[-1] for ruleId in corpusStats["rules"]}
+	assert all(ruleId.split("/")[-1].split(".")[-1] in plantedTargets for ruleId in foundRules)
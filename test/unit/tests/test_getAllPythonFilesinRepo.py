@@ -0,0 +1,89 @@
+'''
+Name: test_getAllPythonFilesinRepo.py
+Description: Unit tests for getAllPythonFilesinRepo and the path store it returns.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import tracemalloc
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import main as fameml_main # type: ignore[reportMissingImports]
+import path_store # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+def test_getAllPythonFilesinRepo_sortedStore(tmp_path):
+	'''
+	## Unit Test: test_getAllPythonFilesinRepo_sortedStore
+
+	Test that the analyzed files of a repo come back sorted, as the list they used to be, from a path store.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getAllPythonFilesinRepo_sortedStore!")
+
+	# Write files in nested directories, including names that sort across directories
+	repoPath = str(tmp_path / "repo")
+	for relPath in ["a/x.py", "a-b/x.py", "a/y.ipynb", "a/z.txt", "b.py", "a/deep/w.py", "ü/ß.py"]:
+		filePath = os.path.join(repoPath, relPath)
+		os.makedirs(os.path.dirname(filePath), exist_ok=True)
+		with open(filePath, "w") as scriptFile:
+			scriptFile.write("pass\n")
+
+	# Assert on the store
+	expectedList = sorted(os.path.join(root, name) for root, _, names in os.walk(repoPath) for name in names if not name.endswith(".txt"))
+	fileStore = fameml_main.getAllPythonFilesinRepo(repoPath)
+	assert isinstance(fileStore, path_store.PathStore)
+	assert list(fileStore) == expectedList and fileStore == expectedList
+	assert [fileStore[i] for i in range(-len(fileStore), len(fileStore))] == expectedList * 2
+	assert fileStore[1:3] == expectedList[1:3]
+	assert expectedList[2] in fileStore and os.path.join(repoPath, "a", "z.txt") not in fileStore
+
+def test_PathStore_roundTripAndSize():
+	'''
+	## Unit Test: test_PathStore_roundTripAndSize
+
+	Test that paths with repeated separators, undecodable bytes and no directory come back exactly,
+	and that a large file list takes a fraction of the memory of a list of str.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_PathStore_roundTripAndSize!")
+
+	# Assert on the round trip
+	oddList = ["corpus//repo/x.py", "/abs/dir/", "plain.py", os.fsdecode(b"/repo/\xff\xfe.py"), "/repo/café.py", ""]
+	oddStore = path_store.PathStore(oddList)
+	oddStore.appendPath("/repo/last.py")
+	assert list(oddStore) == oddList + ["/repo/last.py"]
+
+	# Assert on the memory of a large corpus
+	pathList = [f"/corpus/owner{i // 500}@project{i // 500}/src/pkg{i // 50}/module_{i}.py" for i in range(100000)]
+	tracemalloc.start()
+	pathStore = path_store.PathStore(pathList)
+	storeBytes = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	listBytes = sys.getsizeof(pathList) + sum(sys.getsizeof(path) for path in pathList)
+	logger.info(f"store {storeBytes} bytes, list {listBytes} bytes")
+	assert storeBytes * 3 < listBytes
+	assert list(pathStore) == pathList
@@ -0,0 +1,93 @@
+'''
+Name: test_getBlobKey.py
+Description: Unit tests for getBlobKey and iterDedupResults functions.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import content_dedup # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+SCRIPT_TEXT = "import torch\nx = torch.load(f)\n"
+
+def test_getBlobKey_contentAndKind(tmp_path):
+	'''
+	## Unit Test: test_getBlobKey_contentAndKind
+
+	Test that files with the same bytes share a key unless one of them is a notebook, and that a missing file has none.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getBlobKey_contentAndKind!")
+
+	# Write the same bytes under three names
+	pathList = [str(tmp_path / fileName) for fileName in ["a.py", "b.py", "c.ipynb"]]
+	for filePath in pathList:
+		with open(filePath, "w") as scriptFile:
+			scriptFile.write(SCRIPT_TEXT)
+
+	# Assert on the keys
+	keyList = [content_dedup.getBlobKey(filePath) for filePath in pathList]
+	assert keyList[0] == keyList[1]
+	assert keyList[0][0] == keyList[2][0] and keyList[0] != keyList[2]
+	assert content_dedup.getBlobKey(str(tmp_path / "missing.py")) is None
+
+def test_iterDedupResults_analyzesBlobsOnce(tmp_path):
+	'''
+	## Unit Test: test_iterDedupResults_analyzesBlobsOnce
+
+	Test that every file gets a result, that each blob is analyzed once across calls, and that copies count the time they saved.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_iterDedupResults_analyzesBlobsOnce!")
+
+	# Write two copies of one script and one other script
+	pathList = [str(tmp_path / fileName) for fileName in ["a.py", "b.py", "other.py"]]
+	for filePath, fileText in zip(pathList, [SCRIPT_TEXT, SCRIPT_TEXT, "pass\n"]):
+		with open(filePath, "w") as scriptFile:
+			scriptFile.write(fileText)
+	analyzedList = []
+	def getTimedResult(filePath):
+		analyzedList.append(filePath)
+		return ((len(analyzedList),), None, [{constants.EVENT_FILE_KW: filePath}], {}), 0.5
+
+	# Run two repos through the same state
+	dedupState = content_dedup.newDedupState()
+	resultList = list(content_dedup.iterDedupResults(dedupState, pathList, getTimedResult))
+	resultList += list(content_dedup.iterDedupResults(dedupState, pathList[:1], getTimedResult))
+
+	# Assert that copies reuse the counts under their own path
+	assert analyzedList == [pathList[0], pathList[2]]
+	assert [result[0] for result in resultList] == [(1,), (1,), (2,), (1,)]
+	assert resultList[1][2] == [{constants.EVENT_FILE_KW: pathList[1]}] and resultList[1][3] is None
+	summaryDict = content_dedup.getDedupSummary(dedupState)
+	assert (summaryDict[constants.DEDUP_FILES_KW], summaryDict[constants.DEDUP_UNIQUE_KW], summaryDict[constants.DEDUP_RATIO_KW]) == (4, 2, 2.0)
+	assert summaryDict[constants.DEDUP_SAVED_SECONDS_KW] == 1.0
@@ -0,0 +1,73 @@
+'''
+Name: test_getCSVData.py
+Description: Unit tests for getCSVData function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import multiprocessing
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def writeSampleRepo(repoPath):
+	'''
+	Writes a small repository where every file has a different number of detections.
+	'''
+	os.makedirs(repoPath, exist_ok=True)
+	scriptList = []
+	for i in range(12):
+		scriptPath = os.path.join(repoPath, f"script_{i:02d}.py")
+		with open(scriptPath, "w") as scriptFile:
+			scriptFile.write("import torch\n" + "x = torch.load(f)\n" * i)
+		scriptList.append(scriptPath)
+	return scriptList
+
+@pytest.mark.parametrize("workers", [
+	2,
+	3,
+])
+def test_getCSVData_poolMatchesSerialOrder(tmp_path, workers: int):
+	'''
+	## Unit Test: test_getCSVData_poolMatchesSerialOrder
+
+	Test that rows computed by a process pool come back in the same order and with the same counts as a serial run.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getCSVData_poolMatchesSerialOrder!")
+
+	# Build the sample repository
+	repoPath = str(tmp_path / "repo")
+	scriptList = writeSampleRepo(repoPath)
+
+	# Run serially and with a pool
+	serialRows = fameml_main.getCSVData(scriptList, repoPath)
+	with multiprocessing.Pool(workers) as pool:
+		poolRows = fameml_main.getCSVData(scriptList, repoPath, pool)
+
+	# Assert that the rows are identical, in order
+	assert poolRows == serialRows
+	assert [row[1] for row in poolRows] == scriptList
+	assert [row[2] for row in poolRows] == list(range(12))
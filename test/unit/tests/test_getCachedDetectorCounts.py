@@ -0,0 +1,132 @@
+'''
+Name: test_getCachedDetectorCounts.py
+Description: Unit tests for the FAME-ML result cache.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import result_cache # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def test_getCachedDetectorCounts_servesUnchangedFiles(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_getCachedDetectorCounts_servesUnchangedFiles
+
+	Test that a second lookup of an unchanged file is answered from the cache with the same counts.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getCachedDetectorCounts_servesUnchangedFiles!")
+
+	# Write a script and open the cache
+	scriptPath = tmp_path / "train.py"
+	scriptPath.write_text("import torch\nx = torch.load(f)\nenv = gym.make('Pong')\n")
+	connection = result_cache.openResultCache(str(tmp_path / "cache.db"))
+	ruleHash = result_cache.getRuleSetHash()
+
+	# First lookup analyzes the file
+	firstCounts = result_cache.getCachedDetectorCounts(connection, str(scriptPath), ruleHash)
+	assert firstCounts == lint_engine.getDetectorCounts(str(scriptPath))
+
+	# Second lookup must not analyze again
+	def failAnalysis(*args, **kwargs):
+		raise AssertionError("file was analyzed again")
+	monkeypatch.setattr(lint_engine, "getDetectorHits", failAnalysis)
+	secondCounts = result_cache.getCachedDetectorCounts(connection, str(scriptPath), ruleHash)
+
+	# Assert that the cached counts are the same
+	assert secondCounts == firstCounts
+	connection.close()
+
+def test_getCachedDetectorCounts_ruleChangeInvalidates(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_getCachedDetectorCounts_ruleChangeInvalidates
+
+	Test that changing the rule table changes the rule set hash and purges entries built with the old rules.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getCachedDetectorCounts_ruleChangeInvalidates!")
+
+	# Fill the cache with the current rules
+	scriptPath = tmp_path / "train.py"
+	scriptPath.write_text("x = torch.load(f)\n")
+	cachePath = str(tmp_path / "cache.db")
+	connection = result_cache.openResultCache(cachePath)
+	oldHash = result_cache.getRuleSetHash()
+	result_cache.getCachedDetectorCounts(connection, str(scriptPath), oldHash)
+	connection.close()
+
+	# Change one rule
+	newRule = (constants.MODEL_LOAD_COUNTA_KW, constants.ATTRIB_FUNCS_KW, "joblib", constants.LOAD_KW, 0)
+	monkeypatch.setattr(constants, "RULE_LIST", constants.RULE_LIST + [newRule])
+
+	# Assert that the hash changed and the old entry is dropped
+	assert result_cache.getRuleSetHash() != oldHash
+	assert result_cache.purgeStaleEntries(cachePath) == 1
+	assert result_cache.purgeStaleEntries(cachePath) == 0
+
+def test_getCachedDetectorCounts_loggingRunsKeepEntries(tmp_path):
+	'''
+	## Unit Test: test_getCachedDetectorCounts_loggingRunsKeepEntries
+
+	Test that entries built with and without logging presence both survive a purge, so alternating --logging runs keep their cache.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getCachedDetectorCounts_loggingRunsKeepEntries!")
+
+	# Fill the cache under both logging settings
+	scriptPath = tmp_path / "train.py"
+	scriptPath.write_text("x = torch.load(f)\n")
+	cachePath = str(tmp_path / "cache.db")
+	connection = result_cache.openResultCache(cachePath)
+	for loggingFlag in [False, True]:
+		result_cache.getCachedDetectorCounts(connection, str(scriptPath), result_cache.getRuleSetHash(logging_flag=loggingFlag), logging_flag=loggingFlag)
+	connection.close()
+
+	# Assert that neither entry is purged
+	assert result_cache.purgeStaleEntries(cachePath) == 0
+	connection = result_cache.openResultCache(cachePath)
+	assert connection.execute("SELECT COUNT(*) FROM file_results").fetchone()[0] == 2
+	connection.close()
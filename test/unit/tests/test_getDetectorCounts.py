@@ -0,0 +1,191 @@
+'''
+Name: test_getDetectorCounts.py
+Description: Unit tests for getDetectorCounts function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import textwrap
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SAMPLE_SCRIPT = textwrap.dedent('''
+	import torch, pickle, gym, argparse
+	x = torch.load(f)
+	y = pickle.load(open(p, 'rb'))
+	env = gym.make('CartPole-v0')
+	obs = env.step(action)
+	parser = argparse.ArgumentParser(description='x')
+	loader = get_loader(cfg, split='train')
+	net, ck = load_checkpoint(path)
+	train_labels, other = read_h5file(path)
+	r = model.eval()
+''')
+
+def test_getDetectorCounts_matchesPerDetectorFunctions(tmp_path):
+	'''
+	## Unit Test: test_getDetectorCounts_matchesPerDetectorFunctions
+
+	Test that the single-parse engine returns the same count as calling every detector function on its own.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorCounts_matchesPerDetectorFunctions!")
+
+	# Write the sample script
+	scriptPath = tmp_path / "sample.py"
+	scriptPath.write_text(SAMPLE_SCRIPT)
+
+	# Run the engine once
+	countDict = lint_engine.getDetectorCounts(str(scriptPath))
+
+	# Assert that every detector was run and agrees with the standalone detector
+	assert len(countDict) == len(constants.DETECTOR_LIST)
+	for detectorName in constants.DETECTOR_LIST:
+		assert countDict[detectorName] == lint_engine.getDetectorCount(str(scriptPath), detectorName)
+	assert countDict[constants.DATA_LOAD_COUNTA_KW] == lint_engine.getDataLoadCount(str(scriptPath))
+
+	# Assert a few known detections
+	assert countDict[constants.DATA_LOAD_COUNTA_KW] == 2
+	assert countDict[constants.ENVIRONMENT_COUNTA_KW] == 2
+	assert countDict[constants.STATE_OBSERVE_COUNT_KW] == 1
+	assert countDict[constants.MODEL_LABEL_COUNTA_KW] == 1
+
+@pytest.mark.parametrize("scriptContent", [
+	"",
+	"# nothing but a comment\n",
+])
+def test_getDetectorCounts_zeroWhenNothingToDetect(tmp_path, scriptContent: str):
+	'''
+	## Unit Test: test_getDetectorCounts_zeroWhenNothingToDetect
+
+	Test that files without code give a zero count for every detector.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorCounts_zeroWhenNothingToDetect!")
+
+	# Write the script
+	scriptPath = tmp_path / "empty.py"
+	scriptPath.write_text(scriptContent)
+
+	# Assert that all counts are zero
+	countDict = lint_engine.getDetectorCounts(str(scriptPath))
+	assert all(count == 0 for count in countDict.values())
+
+def test_getDetectorCounts_ruleAddedWithoutCodeChange(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_getDetectorCounts_ruleAddedWithoutCodeChange
+
+	Test that a rule appended to the rule table is picked up by the engine without touching detector code.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorCounts_ruleAddedWithoutCodeChange!")
+
+	# Write a script that no existing rule matches
+	scriptPath = tmp_path / "custom.py"
+	scriptPath.write_text("weights = joblib.load(path)\n")
+	assert lint_engine.getDetectorCounts(str(scriptPath))[constants.MODEL_LOAD_COUNTA_KW] == 0
+
+	# Add a rule and drop the compiled index
+	newRule = (constants.MODEL_LOAD_COUNTA_KW, constants.ATTRIB_FUNCS_KW, "joblib", constants.LOAD_KW, 0)
+	monkeypatch.setattr(constants, "RULE_LIST", constants.RULE_LIST + [newRule])
+	monkeypatch.setattr(lint_engine, "RULE_INDEX_CACHE", {})
+
+	# Assert that the new rule is matched
+	assert lint_engine.getDetectorCounts(str(scriptPath))[constants.MODEL_LOAD_COUNTA_KW] == 1
+
+@pytest.mark.parametrize("scriptBytes,errorClass", [
+	(b"def broken(:\n", "SyntaxError"),
+	(b"x = '\xff\xfe'\n", "UnicodeDecodeError"),
+])
+def test_getDetectorCounts_reportsParseError(tmp_path, scriptBytes: bytes, errorClass: str):
+	'''
+	## Unit Test: test_getDetectorCounts_reportsParseError
+
+	Test that a file that does not parse is reported with its error class instead of being analyzed as an empty file.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorCounts_reportsParseError!")
+
+	# Write the broken script
+	scriptPath = tmp_path / "broken.py"
+	scriptPath.write_bytes(scriptBytes)
+
+	# Assert that the error class is reported next to zero counts
+	countDict = lint_engine.getDetectorCounts(str(scriptPath))
+	assert countDict[constants.PARSE_ERROR_KW] == errorClass
+	assert all(countDict[detectorName] == 0 for detectorName in constants.DETECTOR_LIST)
+
+def test_getDetectorCounts_printsOnlyOnRequest(tmp_path, capsys):
+	'''
+	## Unit Test: test_getDetectorCounts_printsOnlyOnRequest
+
+	Test that per-detection console lines are opt-in, through print_flag.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		capsys: pytest output capture fixture - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorCounts_printsOnlyOnRequest!")
+
+	# Count with and without the flag
+	scriptPath = tmp_path / "sample.py"
+	scriptPath.write_text(SAMPLE_SCRIPT)
+	quietCounts = lint_engine.getDetectorCounts(str(scriptPath))
+	assert capsys.readouterr().out == ""
+	assert lint_engine.getDetectorCounts(str(scriptPath), print_flag=True) == quietCounts
+	assert len(capsys.readouterr().out.splitlines()) == sum(quietCounts[detector] for detector in constants.DETECTOR_LIST)
@@ -0,0 +1,173 @@
+'''
+Name: test_getDetectorHits.py
+Description: Unit tests for the profiled scan of lint_engine.getDetectorHits and the --profile mode of FAME-ML.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import csv
+import json
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import result_cache # type: ignore[reportMissingImports]
+import scan_profiler # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+from test.unit.corpus import writeSampleCorpus
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SAMPLE_SOURCE = """import logging
+import torch
+import gym
+data = torch.load(path)
+env = gym.make(name)
+state, reward, done, info = env.step(action)
+logging.info(state)
+"""
+
+@pytest.mark.parametrize("source,loggingFlag", [
+	(SAMPLE_SOURCE, False),
+	(SAMPLE_SOURCE, True),
+	("x = 1\n", True),
+	("def broken(:\n", False),
+])
+def test_getDetectorHits_profiledSameHits(tmp_path, source: str, loggingFlag: bool):
+	'''
+	## Unit Test: test_getDetectorHits_profiledSameHits
+
+	Test that getDetectorHits with a file profile finds exactly what it finds without one, in the same order, and that every timing is non-negative.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getDetectorHits_profiledSameHits!")
+
+	# Write the script
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write(source)
+
+	# Scan it with and without profiling
+	fileProfile = scan_profiler.newFileProfile(scriptPath)
+	profiledHits = lint_engine.getDetectorHits(scriptPath, logging_flag=loggingFlag, file_profile=fileProfile)
+
+	# Assert that the hits agree and the timings make sense
+	assert profiledHits == lint_engine.getDetectorHits(scriptPath, logging_flag=loggingFlag)
+	assert fileProfile[constants.PROFILE_BYTES_KW] == len(source.encode())
+	for groupName in [constants.PROFILE_STAGES_KW, constants.PROFILE_EXTRACTORS_KW, constants.PROFILE_DETECTORS_KW]:
+		assert all(seconds >= 0.0 for seconds in fileProfile[groupName].values())
+
+def test_getCachedDetectorHits_profiledCacheStage(tmp_path):
+	'''
+	## Unit Test: test_getCachedDetectorHits_profiledCacheStage
+
+	Test that a profiled cache miss times the cache and the analysis stages, and that a profiled cache hit only times the cache stage.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getCachedDetectorHits_profiledCacheStage!")
+
+	# Write the script and open a cache
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write(SAMPLE_SOURCE)
+	connection = result_cache.openResultCache(str(tmp_path / "cache.db"))
+	ruleHash = result_cache.getRuleSetHash()
+
+	# Scan it twice with profiling
+	missProfile = scan_profiler.newFileProfile(scriptPath)
+	missHits = result_cache.getCachedDetectorHits(connection, scriptPath, ruleHash, file_profile=missProfile)
+	hitProfile = scan_profiler.newFileProfile(scriptPath)
+	cachedHits = result_cache.getCachedDetectorHits(connection, scriptPath, ruleHash, file_profile=hitProfile)
+	connection.close()
+
+	# Assert on the hits and the stages that were timed
+	assert missHits == lint_engine.getDetectorHits(scriptPath)
+	assert cachedHits == {detectorName: [list(hit) for hit in hitList] for detectorName, hitList in missHits.items()}
+	assert missProfile[constants.PROFILE_STAGES_KW][constants.PROFILE_CACHE_KW] > 0.0
+	assert missProfile[constants.PROFILE_STAGES_KW][constants.PROFILE_PARSE_KW] > 0.0
+	assert set(missProfile[constants.PROFILE_DETECTORS_KW]) <= set(constants.DETECTOR_LIST)
+	assert missProfile[constants.PROFILE_EXTRACTORS_KW]
+	assert hitProfile[constants.PROFILE_STAGES_KW][constants.PROFILE_CACHE_KW] > 0.0
+	assert hitProfile[constants.PROFILE_STAGES_KW][constants.PROFILE_PARSE_KW] == 0.0
+	assert hitProfile[constants.PROFILE_EXTRACTORS_KW] == {}
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_profileSummary(tmp_path, workers: int):
+	'''
+	## Unit Test: test_runFameML_profileSummary
+
+	Test that runFameML with a profile path writes a summary with every stage and the slowest files, and one CSV row per file,
+	without changing the result CSV.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_profileSummary!")
+
+	# Write two repos of three files each
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, [("repo_a", 3, 1), ("repo_b", 3, 1)], "", SAMPLE_SOURCE)
+
+	# Run with and without profiling
+	plainPath = str(tmp_path / "plain.csv")
+	profiledPath = str(tmp_path / "profiled.csv")
+	profilePath = str(tmp_path / "profile.json")
+	fameml_main.runFameML(corpusPath, plainPath, workers)
+	fameml_main.runFameML(corpusPath, profiledPath, workers, profile_path=profilePath, profile_top=2)
+
+	# Assert that profiling leaves the results alone
+	with open(plainPath) as plainFile, open(profiledPath) as profiledFile:
+		assert plainFile.read() == profiledFile.read()
+
+	# Assert on the summary
+	with open(profilePath) as profileFile:
+		profileSummary = json.load(profileFile)
+	assert profileSummary[constants.PROFILE_FILE_COUNT_KW] == 6
+	assert set(profileSummary[constants.PROFILE_STAGES_KW]) == set(constants.PROFILE_STAGE_LIST)
+	assert len(profileSummary[constants.PROFILE_TOP_FILES_KW]) == 2
+	assert profileSummary[constants.PROFILE_TOP_FILES_KW][0][constants.PROFILE_SECONDS_KW] >= profileSummary[constants.PROFILE_TOP_FILES_KW][1][constants.PROFILE_SECONDS_KW]
+	assert set(profileSummary[constants.PROFILE_DETECTORS_KW]) <= set(constants.DETECTOR_LIST)
+	assert profileSummary[constants.PROFILE_WALL_KW] > 0.0
+
+	# Assert on the per-file rows
+	with open(profilePath + constants.PROFILE_FILES_EXTENSION, newline="") as filesFile:
+		fileRows = list(csv.reader(filesFile))
+	assert fileRows[0] == list(constants.PROFILE_FILES_HEADER)
+	assert len(fileRows) == 7
@@ -0,0 +1,93 @@
+'''
+Name: test_getLoggingLines.py
+Description: Unit tests for getLoggingLines function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import ast
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import py_parser # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Third Party
+import pandas as pd # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+@pytest.mark.parametrize("scriptContent,expectedLines", [
+	("import logging\nx = torch.load(f)\nlogging.info(pytorch)\nlogger.debug(other)\n", [3]),
+	("x = torch.load(f)\nlogging.info(pytorch)\n", []),
+	("import logging\nlogging.info(other)\n", []),
+])
+def test_getLoggingLines_needsImportAndTrackedArgument(scriptContent: str, expectedLines: list):
+	'''
+	## Unit Test: test_getLoggingLines_needsImportAndTrackedArgument
+
+	Test that only logging calls passing the tracked name count, and only when logging is imported.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getLoggingLines_needsImportAndTrackedArgument!")
+
+	# Parse the script
+	pyTree = ast.parse(scriptContent)
+
+	# Assert the lines and the legacy flag agree
+	assert py_parser.getLoggingLines(pyTree, constants.DUMMY_LOG_KW) == expectedLines
+	assert py_parser.checkLoggingPerData(pyTree, constants.DUMMY_LOG_KW) == (len(expectedLines) > 0)
+
+def test_getLoggingLines_optionalCSVColumn(tmp_path):
+	'''
+	## Unit Test: test_getLoggingLines_optionalCSVColumn
+
+	Test that the LOGGING_PRESENT column is only written when asked for, and that the other columns do not change.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getLoggingLines_optionalCSVColumn!")
+
+	# Write a repository with one logged and one silent script
+	repoPath = tmp_path / "corpus" / "repo"
+	os.makedirs(repoPath)
+	(repoPath / "logged.py").write_text("import logging\nx = torch.load(f)\nlogging.info(pytorch)\n")
+	(repoPath / "silent.py").write_text("x = torch.load(f)\n")
+
+	# Run with and without the column
+	plainCSV = str(tmp_path / "plain.csv")
+	loggingCSV = str(tmp_path / "logging.csv")
+	fameml_main.runFameML(str(tmp_path / "corpus"), plainCSV)
+	fameml_main.runFameML(str(tmp_path / "corpus"), loggingCSV, logging_flag=True)
+	plainDF = pd.read_csv(plainCSV)
+	loggingDF = pd.read_csv(loggingCSV)
+
+	# Assert that the column is optional and correct
+	assert list(plainDF.columns) == constants.CSV_HEADER
+	assert list(loggingDF.columns) == constants.CSV_LOGGING_HEADER
+	assert loggingDF[constants.CSV_HEADER].equals(plainDF)
+	assert list(loggingDF[constants.LOGGING_PRESENT_COLUMN]) == [1, 0]
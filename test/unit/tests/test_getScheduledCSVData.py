@@ -0,0 +1,90 @@
+'''
+Name: test_getScheduledCSVData.py
+Description: Unit tests for getScheduledTasks and getScheduledCSVData functions.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import multiprocessing
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+from test.unit.corpus import writeSampleCorpus
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+# one large repository and two small ones
+SAMPLE_REPOS = [("big", 3, 200), ("small_a", 4, 1), ("small_b", 2, 3)]
+IMPORT_LINE = "import pickle\n"
+LOAD_LINE = "y = pickle.load(f)\n"
+
+def test_getScheduledTasks_largestFirst(tmp_path):
+	'''
+	## Unit Test: test_getScheduledTasks_largestFirst
+
+	Test that the scheduler emits one task per file across all repositories, ordered by decreasing file size.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getScheduledTasks_largestFirst!")
+
+	# Build the tasks over the file lists of discovery
+	writeSampleCorpus(str(tmp_path), SAMPLE_REPOS, IMPORT_LINE, LOAD_LINE)
+	repoFileList = [(repoPath, fameml_main.getAllPythonFilesinRepo(repoPath)) for repoPath in sorted(entry.path for entry in os.scandir(tmp_path))]
+	taskIter = fameml_main.getScheduledTasks(repoFileList)
+	taskList = list(taskIter)
+
+	# Assert that tasks are handed out one at a time, every file is scheduled once and sizes never increase
+	assert iter(taskIter) is taskIter
+	assert len(taskList) == sum(len(fileList) for _, fileList in repoFileList)
+	assert {(repoIndex, fileIndex) for repoIndex, fileIndex, _ in taskList} == {(repoIndex, fileIndex) for repoIndex, (_, fileList) in enumerate(repoFileList) for fileIndex in range(len(fileList))}
+	assert all(repoFileList[repoIndex][1][fileIndex] == scriptPath for repoIndex, fileIndex, scriptPath in taskList)
+	sizeList = [os.path.getsize(task[2]) for task in taskList]
+	assert sizeList == sorted(sizeList, reverse=True)
+	assert os.path.basename(os.path.dirname(taskList[0][2])) == "big"
+
+def test_getScheduledCSVData_matchesSerial(tmp_path):
+	'''
+	## Unit Test: test_getScheduledCSVData_matchesSerial
+
+	Test that scheduled analysis returns, per repository, the same rows in the same order as getCSVData.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_getScheduledCSVData_matchesSerial!")
+
+	# Run the scheduler on a pool
+	repoFileList = writeSampleCorpus(str(tmp_path), SAMPLE_REPOS, IMPORT_LINE, LOAD_LINE)
+	with multiprocessing.Pool(2) as pool:
+		scheduledRows = fameml_main.getScheduledCSVData(repoFileList, pool)
+
+	# Assert that each repository matches a serial run
+	assert len(scheduledRows) == len(repoFileList)
+	for (repoPath, fileList), repoRows in zip(repoFileList, scheduledRows):
+		assert repoRows == fameml_main.getCSVData(fileList, repoPath)
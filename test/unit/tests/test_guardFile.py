@@ -0,0 +1,205 @@
+'''
+Name: test_guardFile.py
+Description: Unit tests for the per-file resource guards.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import signal
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import resource_guard # type: ignore[reportMissingImports]
+import result_writer # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Third Party
+import pandas as pd # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def writeScript(scriptPath, lineCount):
+	'''
+	Writes a script with one detection per line.
+	'''
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write("import torch\n" + "".join(f"x_{i} = torch.load(f_{i})\n" for i in range(lineCount)))
+
+@pytest.mark.parametrize("limitArgs,reason,lineCount", [
+	({"max_bytes": 1000}, "FileSizeLimit", 20000),
+	({"max_nodes": 500}, "NodeCountLimit", 20000),
+	({"max_seconds": 1e-6}, "WallTimeLimit", 20000),
+	# memory freed by earlier tests is reused without growing the address space, so this file is larger
+	pytest.param({"max_memory_mb": 0}, "MemoryLimit", 60000, marks=pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="address space limits need /proc")),
+])
+def test_guardFile_limitsRaise(tmp_path, monkeypatch, limitArgs: dict, reason: str, lineCount: int):
+	'''
+	## Unit Test: test_guardFile_limitsRaise
+
+	Test that, with the limits of a worker process, a file over each limit raises FileLimitError with the reason of that
+	limit, that the same file passes without limits, and that the alarm handler is put back afterwards.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+		limitArgs: keyword arguments of resource_guard.getFileLimits
+		reason: expected error class in the failure report
+		lineCount: lines of the script, each with one detection
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_guardFile_limitsRaise!")
+
+	# Write a script big enough to go over every limit
+	scriptPath = str(tmp_path / "big.py")
+	writeScript(scriptPath, lineCount)
+	alarmHandler = signal.getsignal(signal.SIGALRM)
+	monkeypatch.setattr(resource_guard, "PROCESS_LIMITS_ON", True)
+
+	# Assert that the limit is enforced and nothing is left behind
+	with pytest.raises(resource_guard.FileLimitError) as limitError:
+		lint_engine.getDetectorHits(scriptPath, file_limits=resource_guard.getFileLimits(**limitArgs))
+	assert limitError.value.reason == reason
+	assert signal.getsignal(signal.SIGALRM) == alarmHandler
+	assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+	hitDict = lint_engine.getDetectorHits(scriptPath)
+	assert sum(len(hitDict[detectorName]) for detectorName in constants.DETECTOR_LIST) >= lineCount
+
+def test_guardFile_withinLimits(tmp_path):
+	'''
+	## Unit Test: test_guardFile_withinLimits
+
+	Test that a file within every limit gets the same hits as an unguarded scan.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_guardFile_withinLimits!")
+
+	# Scan a small script under generous limits
+	scriptPath = str(tmp_path / "small.py")
+	writeScript(scriptPath, 10)
+	fileLimits = resource_guard.getFileLimits(max_bytes=10**6, max_nodes=10**6, max_seconds=60, max_memory_mb=512)
+
+	# Assert that the guards change nothing
+	assert resource_guard.getFileLimits() is None
+	assert lint_engine.getDetectorHits(scriptPath, file_limits=fileLimits) == lint_engine.getDetectorHits(scriptPath)
+
+def test_guardFile_serialIgnoresProcessLimits(tmp_path, caplog):
+	'''
+	## Unit Test: test_guardFile_serialIgnoresProcessLimits
+
+	Test that the time and memory limits, which act on the whole process, are left off outside a worker process: a
+	serial run analyzes every file and warns, while workers skip every file over the time limit.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		caplog: pytest fixture - see https://docs.pytest.org/en/stable/how-to/logging.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_guardFile_serialIgnoresProcessLimits!")
+
+	# Write one repo of two scripts and limits no file can meet
+	repoPath = tmp_path / "corpus" / "repo_a"
+	os.makedirs(repoPath)
+	writeScript(str(repoPath / "script_0.py"), 200)
+	writeScript(str(repoPath / "script_1.py"), 300)
+	csvPath = str(tmp_path / "out.csv")
+	fileLimits = resource_guard.getFileLimits(max_seconds=1e-6, max_memory_mb=0)
+	rlimitAS = resource_guard.resource.getrlimit(resource_guard.resource.RLIMIT_AS) if resource_guard.resource else None
+
+	# Assert that this process does not enforce them
+	assert not resource_guard.PROCESS_LIMITS_ON
+	assert resource_guard.getIgnoredLimits(fileLimits) == ["max_seconds", "max_memory_mb"]
+	hitDict = lint_engine.getDetectorHits(str(repoPath / "script_0.py"), file_limits=fileLimits)
+	assert hitDict == lint_engine.getDetectorHits(str(repoPath / "script_0.py"))
+
+	# Assert that a serial run analyzes every file, leaves the process limits alone and says why
+	with caplog.at_level("WARNING", logger=constants.FAMEML_LOGGER_KW):
+		fameml_main.runFameML(str(tmp_path / "corpus"), csvPath, 1, file_limits=fileLimits)
+	assert len(pd.read_csv(csvPath)) == 2
+	assert any("max_seconds, max_memory_mb only apply in worker processes" in record.getMessage() for record in caplog.records)
+	assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+	if rlimitAS is not None:
+		assert resource_guard.resource.getrlimit(resource_guard.resource.RLIMIT_AS) == rlimitAS
+
+	# Assert that workers skip both files over the time limit
+	fameml_main.runFameML(str(tmp_path / "corpus"), csvPath, 2, file_limits=resource_guard.getFileLimits(max_seconds=1e-6))
+	assert len(pd.read_csv(csvPath)) == 0
+	failureDF = pd.read_csv(result_writer.getParseFailurePath(csvPath))
+	assert list(failureDF["ERROR_CLASS"]) == ["WallTimeLimit", "WallTimeLimit"]
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_skipsFilesOverLimits(tmp_path, workers: int):
+	'''
+	## Unit Test: test_runFameML_skipsFilesOverLimits
+
+	Test that runFameML leaves a file over the size limit out of the CSV, lists it in the failure report with its reason,
+	does not cache it, and still analyzes every other file.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_skipsFilesOverLimits!")
+
+	# Write one repo with a big file and two small ones
+	repoPath = tmp_path / "corpus" / "repo_a"
+	os.makedirs(repoPath)
+	writeScript(str(repoPath / "big.py"), 5000)
+	writeScript(str(repoPath / "small_0.py"), 1)
+	writeScript(str(repoPath / "small_1.py"), 2)
+
+	# Run with a size limit, twice on the same cache
+	csvPath = str(tmp_path / "out.csv")
+	cachePath = str(tmp_path / "cache.sqlite")
+	fileLimits = resource_guard.getFileLimits(max_bytes=10000)
+	for _ in range(2):
+		fameml_main.runFameML(str(tmp_path / "corpus"), csvPath, workers, cache_path=cachePath, file_limits=fileLimits)
+
+		# Assert that only the big file was skipped, with its reason
+		resultDF = pd.read_csv(csvPath)
+		assert sorted(os.path.basename(filePath) for filePath in resultDF["FILE_FULL_PATH"]) == ["small_0.py", "small_1.py"]
+		failureDF = pd.read_csv(result_writer.getParseFailurePath(csvPath))
+		assert list(failureDF["ERROR_CLASS"]) == ["FileSizeLimit"]
+		assert os.path.basename(failureDF["FILE_FULL_PATH"][0]) == "big.py"
+
+	# Assert that without the limit the big file is analyzed
+	fameml_main.runFameML(str(tmp_path / "corpus"), csvPath, workers, cache_path=cachePath)
+	assert len(pd.read_csv(csvPath)) == 3
@@ -0,0 +1,88 @@
+'''
+Name: test_iterCompactCallSites.py
+Description: Unit tests for iterCompactCallSites function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import ast
+import textwrap
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import py_parser # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SAMPLE_SCRIPT = textwrap.dedent('''
+	import torch
+	x = torch.load(f, 'cpu', map_location=dev)
+	y = np.stack(batch[0][1], other[2], cfg.size, make(), 3)
+	z = build(name, 'str', 4, key=1)
+	net, ck = load_checkpoint(path, opt.dir, helper(), 'x', 5)
+	train_labels, val_labels = split.read(path)
+	cfg.model.fit(data, 'a', 1.0, epochs=3)
+	get_model().eval()
+	print(obj.attr, "s", call(), 7, end='')
+''')
+
+def test_iterCompactCallSites_rebuildsExtractorEntries():
+	'''
+	## Unit Test: test_iterCompactCallSites_rebuildsExtractorEntries
+
+	Test that every compact record turns back into the same entry as the list extractors, and that its argument count matches.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_iterCompactCallSites_rebuildsExtractorEntries!")
+
+	# Collect the compact records by extractor kind
+	pyTree = ast.parse(SAMPLE_SCRIPT)
+	compactDict = {extractor: [] for extractor in constants.EXTRACTOR_LIST}
+	for extractor, callSite in py_parser.iterCompactCallSites(pyTree):
+		assert callSite.kind == extractor
+		assert callSite.arg_count == len(callSite.getArgs())
+		compactDict[extractor].append(callSite.toTuple())
+
+	# Assert that they match the list extractors
+	assert compactDict == py_parser.getPythonCallSites(pyTree)
+	assert len(compactDict[constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW]) == 2
+
+def test_iterCompactCallSites_recordHasNoDict():
+	'''
+	## Unit Test: test_iterCompactCallSites_recordHasNoDict
+
+	Test that call-site records use slots and keep only the requested extractors.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_iterCompactCallSites_recordHasNoDict!")
+
+	# Extract attribute calls only
+	pyTree = ast.parse(SAMPLE_SCRIPT)
+	recordList = list(py_parser.iterCompactCallSites(pyTree, [constants.ATTRIB_FUNCS_KW]))
+
+	# Assert the records are slotted and of one kind
+	assert len(recordList) > 0
+	assert all(extractor == constants.ATTRIB_FUNCS_KW for extractor, _ in recordList)
+	assert not hasattr(recordList[0][1], "__dict__")
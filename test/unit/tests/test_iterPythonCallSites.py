@@ -0,0 +1,121 @@
+'''
+Name: test_iterPythonCallSites.py
+Description: Unit tests for iterPythonCallSites function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import ast
+import textwrap
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import py_parser # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SAMPLE_SCRIPT = textwrap.dedent('''
+	import torch, pickle
+	x = torch.load(f)
+	y = pickle.load(open(p, 'rb'))
+	net, ck = load_checkpoint(path)
+	train_labels, other = read_h5file(path)
+	try:
+		r = model.eval()
+	except IOError:
+		logger.error(err)
+''')
+
+def test_iterPythonCallSites_matchesListExtractors():
+	'''
+	## Unit Test: test_iterPythonCallSites_matchesListExtractors
+
+	Test that the streamed call sites of every extractor are the same, in the same order, as the list-returning extractors.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_iterPythonCallSites_matchesListExtractors!")
+
+	# Parse the sample script
+	pyTree = ast.parse(SAMPLE_SCRIPT)
+	listExtractorDict = {
+		constants.ATTRIB_FUNCS_KW: py_parser.getPythonAtrributeFuncs,
+		constants.FUNC_ASSIGNMENTS_KW: py_parser.getFunctionAssignments,
+		constants.FUNC_DEFINITIONS_KW: py_parser.getFunctionDefinitions,
+		constants.FUNC_ASSIGNMENTS_MULTI_LHS_KW: py_parser.getFunctionAssignmentsWithMultipleLHS,
+		constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW: py_parser.getLabelAssignments,
+	}
+
+	# Split the stream by extractor kind
+	streamedDict = {extractor: [] for extractor in constants.EXTRACTOR_LIST}
+	for extractor, callSite in py_parser.iterPythonCallSites(pyTree):
+		streamedDict[extractor].append(callSite)
+
+	# Assert that every extractor agrees with its list version
+	for extractor, listExtractor in listExtractorDict.items():
+		assert streamedDict[extractor] == listExtractor(pyTree)
+	assert streamedDict == py_parser.getPythonCallSites(pyTree)
+	assert len(streamedDict[constants.FUNC_ASSIGNMENTS_LABEL_LHS_KW]) == 1
+
+def test_iterPythonCallSites_streamedHitsMatchListHits():
+	'''
+	## Unit Test: test_iterPythonCallSites_streamedHitsMatchListHits
+
+	Test that matching the streamed call sites gives the same hits, in the same order, as matching the extracted lists.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_iterPythonCallSites_streamedHitsMatchListHits!")
+
+	# Match both ways
+	pyTree = ast.parse(SAMPLE_SCRIPT)
+	ruleIndex = lint_engine.getRuleIndex(constants.DETECTOR_LIST)
+	listHits = lint_engine.getCallSiteHits(py_parser.getPythonCallSites(pyTree, list(ruleIndex)), ruleIndex, constants.DETECTOR_LIST)
+	streamedHits = lint_engine.getStreamedCallSiteHits(py_parser.iterCompactCallSites(pyTree, list(ruleIndex)), ruleIndex, constants.DETECTOR_LIST)
+
+	# Assert that the hits are identical
+	assert streamedHits == listHits
+	assert [hit[0] for hit in streamedHits[constants.DATA_LOAD_COUNTA_KW]] == [3, 4]
+
+def test_checkAttribFuncsInExcept_collectsEveryCall():
+	'''
+	## Unit Test: test_checkAttribFuncsInExcept_collectsEveryCall
+
+	Test that attribute calls in an except body are collected in order.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_checkAttribFuncsInExcept_collectsEveryCall!")
+
+	# Parse an except body with two attribute calls
+	pyTree = ast.parse("try:\n\tpass\nexcept IOError:\n\tlogger.error(a)\n\tlogger.warn(b, c)\n")
+	exceptBody = py_parser.getPythonExcepts(pyTree)
+
+	# Assert both calls are found
+	attribList = py_parser.checkAttribFuncsInExcept(exceptBody)
+	assert [(receiver, funcName, lineNo) for receiver, funcName, lineNo, _ in attribList] == [("logger", "error", 4), ("logger", "warn", 5)]
@@ -0,0 +1,89 @@
+'''
+Name: test_mayMatchRules.py
+Description: Unit tests for mayMatchRules function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import py_parser # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+@pytest.mark.parametrize("sourceText,expected", [
+	("x = torch.load(f)\n", True),
+	("from setuptools import setup\nsetup(name='x')\n", False),
+	("loader = downloaded_file\n", False),
+	("x = torch.ｌｏａｄ(f)\n", True),
+	("# café\nsetup(name='x')\n", False),
+])
+def test_mayMatchRules_wholeMethodNames(sourceText: str, expected: bool):
+	'''
+	## Unit Test: test_mayMatchRules_wholeMethodNames
+
+	Test that the prefilter only passes sources that contain a rule method name as a whole identifier, including names the parser would normalize.
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_mayMatchRules_wholeMethodNames!")
+
+	# Assert the prefilter decision
+	ruleIndex = lint_engine.getRuleIndex(constants.DETECTOR_LIST)
+	assert lint_engine.mayMatchRules(sourceText.encode("utf-8"), ruleIndex) == expected
+
+def test_mayMatchRules_skipsTreeWalk(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_mayMatchRules_skipsTreeWalk
+
+	Test that a file without any rule keyword gets all-zero counts without walking its tree for call sites, while logging presence is still found.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_mayMatchRules_skipsTreeWalk!")
+
+	# Write a file no rule can match and count the call-site walks
+	scriptPath = tmp_path / "setup.py"
+	scriptPath.write_text("import logging\nfrom setuptools import setup\nlogging.info(pytorch)\n")
+	walkList = []
+	iterCompactCallSites = py_parser.iterCompactCallSites
+	def recordWalk(pyTree, extractorList):
+		walkList.append(extractorList)
+		return iterCompactCallSites(pyTree, extractorList)
+	monkeypatch.setattr(py_parser, "iterCompactCallSites", recordWalk)
+
+	# Assert zero counts without a walk
+	countDict = lint_engine.getDetectorCounts(str(scriptPath))
+	assert all(count == 0 for count in countDict.values())
+	assert walkList == []
+
+	# Assert logging presence is still found
+	countDict = lint_engine.getDetectorCounts(str(scriptPath), logging_flag=True)
+	assert countDict[constants.LOGGING_PRESENT_KW] == 1
+	assert walkList == []
@@ -0,0 +1,148 @@
+'''
+Name: test_openSource.py
+Description: Unit tests for the shared source file reader.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import mmap
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import result_cache # type: ignore[reportMissingImports]
+import source_reader # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SCRIPT_TEXT = "import torch\nimport logging\nmodel = torch.load(path)\nlogging.info(pytorch)\n"
+
+def countOpenFiles():
+	'''
+	Open file descriptors of this process.
+	'''
+	return len(os.listdir("/proc/self/fd"))
+
+def test_openSource_mmapMatchesRead(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_openSource_mmapMatchesRead
+
+	Test that a file at the memory map threshold is mapped, that it gets the same hits and content hash as a file read
+	in one go, and that no handle is left open either way.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_openSource_mmapMatchesRead!")
+
+	# Write the script and scan it read in one go
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write(SCRIPT_TEXT)
+	openFiles = countOpenFiles()
+	with source_reader.openSource(scriptPath) as sourceBytes:
+		assert isinstance(sourceBytes, bytes)
+	readHits = lint_engine.getDetectorHits(scriptPath, logging_flag=True)
+	readHash = result_cache.getContentHash(scriptPath)
+
+	# Scan it again memory-mapped
+	monkeypatch.setattr(source_reader, "MMAP_MIN_BYTES", 1)
+	with source_reader.openSource(scriptPath) as sourceBuffer:
+		assert isinstance(sourceBuffer, mmap.mmap)
+		assert sourceBuffer[:] == SCRIPT_TEXT.encode()
+
+	# Assert that both paths agree and closed their handles
+	assert lint_engine.getDetectorHits(scriptPath, logging_flag=True) == readHits
+	assert readHits[constants.LOGGING_PRESENT_KW]
+	assert result_cache.getContentHash(scriptPath) == readHash
+	assert countOpenFiles() == openFiles
+
+@pytest.mark.parametrize("scriptBytes", [
+	"# -*- coding: latin-1 -*-\nimport torch\nname = 'café'\nmodel = torch.load(name)\n".encode("latin-1"),
+	b"\xef\xbb\xbfimport torch\nmodel = torch.load(path)\n",
+	"import torch\nmodèle = torch.load(path)\n".encode("utf-8"),
+])
+def test_openSource_declaredEncodings(tmp_path, scriptBytes: bytes):
+	'''
+	## Unit Test: test_openSource_declaredEncodings
+
+	Test that files with a coding cookie, a BOM or UTF-8 identifiers parse and get their hits.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		scriptBytes: content of the script
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_openSource_declaredEncodings!")
+
+	# Write the script
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "wb") as scriptFile:
+		scriptFile.write(scriptBytes)
+
+	# Assert that it parses and the load is found
+	assert source_reader.parseSourceFile(scriptPath)[1] is None
+	hitDict = lint_engine.getDetectorHits(scriptPath)
+	assert constants.PARSE_ERROR_KW not in hitDict
+	assert sum(len(hitDict[detectorName]) for detectorName in constants.DETECTOR_LIST) >= 1
+
+@pytest.mark.parametrize("scriptBytes,errorClass", [
+	(b"x = '\xff'\n", "UnicodeDecodeError"),
+	(b"# -*- coding: ascii -*-\nx = '\xe9'\n", "UnicodeDecodeError"),
+	(b"# -*- coding: no-such-codec -*-\nx = 1\n", "SyntaxError"),
+	(b"def broken(:\n", "SyntaxError"),
+])
+def test_openSource_parseErrors(tmp_path, scriptBytes: bytes, errorClass: str):
+	'''
+	## Unit Test: test_openSource_parseErrors
+
+	Test that bytes that do not decode in the declared encoding are named UnicodeDecodeError, every other failure
+	SyntaxError, and that the handle is closed after the failure.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		scriptBytes: content of the script
+		errorClass: expected error class name
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_openSource_parseErrors!")
+
+	# Write the script
+	scriptPath = str(tmp_path / "broken.py")
+	with open(scriptPath, "wb") as scriptFile:
+		scriptFile.write(scriptBytes)
+
+	# Assert on the error class and the open handles
+	openFiles = countOpenFiles()
+	assert source_reader.parseSourceFile(scriptPath) == (None, errorClass)
+	assert lint_engine.getDetectorHits(scriptPath)[constants.PARSE_ERROR_KW] == [errorClass]
+	assert countOpenFiles() == openFiles
@@ -0,0 +1,216 @@
+'''
+Name: test_readNotebookSource.py
+Description: Unit tests for Jupyter notebook support.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import json
+import tracemalloc
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import notebook_reader # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Third Party
+import pandas as pd # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def makeNotebook(cellList, outputBytes=0):
+	'''
+	Builds nbformat 4 JSON from ( cell type, source ) pairs, every code cell carrying an image output of outputBytes.
+	'''
+	outputList = [{"output_type": "display_data", "data": {"image/png": "A" * outputBytes, "text/plain": ["<Figure \"x\">"]}, "metadata": {}}]
+	return {
+		"cells": [{"cell_type": cellType, "metadata": {}, "source": source, **({"outputs": outputList, "execution_count": 1} if cellType == "code" else {})}
+				  for cellType, source in cellList],
+		"metadata": {"kernelspec": {"name": "python3"}},
+		"nbformat": 4,
+		"nbformat_minor": 5
+	}
+
+SAMPLE_CELLS = [
+	("markdown", ["# Loading\n", "x = torch.load(path)\n"]),
+	("code", ["import torch\n", "%matplotlib inline\n", "model = torch.load(path)\n"]),
+	("code", "%%bash\nls -l\n"),
+	("code", "import pickle\n\nif ready:\n    !ls\n    data = pickle.load(f)"),
+]
+
+def test_readNotebookSource_codeCellsAndMagics(tmp_path):
+	'''
+	## Unit Test: test_readNotebookSource_codeCellsAndMagics
+
+	Test that only code cells are read, line magics keep their line as pass, cell magics drop the cell, and that
+	detections map back to their cell and the line in that cell.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_readNotebookSource_codeCellsAndMagics!")
+
+	# Write the notebook
+	notebookPath = str(tmp_path / "sample.ipynb")
+	with open(notebookPath, "w") as notebookFile:
+		json.dump(makeNotebook(SAMPLE_CELLS, 100), notebookFile, indent=1)
+
+	# Assert on the extracted source
+	sourceBytes, cellList = notebook_reader.readNotebookSource(notebookPath)
+	assert sourceBytes.decode() == "import torch\npass\nmodel = torch.load(path)\nimport pickle\n\nif ready:\n    pass\n    data = pickle.load(f)\n"
+	assert cellList == [[1, 2], [4, 4]]
+
+	# Assert that detections carry their cell
+	hitDict = lint_engine.getDetectorHits(notebookPath)
+	eventList = lint_engine.getDetectionEvents(notebookPath, hitDict)
+	assert [(event[constants.EVENT_CELL_KW], event[constants.EVENT_LINE_KW]) for event in eventList] == [(2, 3), (4, 5)]
+
+@pytest.mark.parametrize("notebookText", [
+	"",
+	"[1, 2]",
+	'{"cells": [{"cell_type": "code", "source": "x = 1"}',
+	'{"cells": [}',
+	'{"cells": []} trailing',
+	'{"cells": [{"cell_type": "code", "source": "unterminated}]}',
+])
+def test_readNotebookSource_malformedNotebooks(tmp_path, notebookText: str):
+	'''
+	## Unit Test: test_readNotebookSource_malformedNotebooks
+
+	Test that a file that is not notebook JSON raises NotebookFormatError and is reported as a parse failure by the engine.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		notebookText: content of the broken notebook
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_readNotebookSource_malformedNotebooks!")
+
+	# Write the notebook
+	notebookPath = str(tmp_path / "broken.ipynb")
+	with open(notebookPath, "w") as notebookFile:
+		notebookFile.write(notebookText)
+
+	# Assert that it is rejected
+	with pytest.raises(notebook_reader.NotebookFormatError):
+		notebook_reader.readNotebookSource(notebookPath)
+	assert lint_engine.getDetectorHits(notebookPath)[constants.PARSE_ERROR_KW] == ["NotebookFormatError"]
+
+def test_readNotebookSource_nbformat3(tmp_path):
+	'''
+	## Unit Test: test_readNotebookSource_nbformat3
+
+	Test that the code cells of every worksheet of an nbformat 3 notebook are read from their input field.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_readNotebookSource_nbformat3!")
+
+	# Write the notebook
+	notebookPath = str(tmp_path / "old.ipynb")
+	with open(notebookPath, "w") as notebookFile:
+		json.dump({"worksheets": [{"cells": [{"cell_type": "code", "input": ["a = 1\n", "b = 2"], "outputs": []}]},
+								  {"cells": [{"cell_type": "heading", "source": ["c = 3"]}, {"cell_type": "code", "input": "d = 4", "outputs": []}]}],
+				   "metadata": {}, "nbformat": 3, "nbformat_minor": 0}, notebookFile)
+
+	# Assert on the extracted source
+	assert notebook_reader.readNotebookSource(notebookPath) == (b"a = 1\nb = 2\nd = 4\n", [[1, 1], [3, 3]])
+
+def test_readNotebookSource_outputsNotLoaded(tmp_path):
+	'''
+	## Unit Test: test_readNotebookSource_outputsNotLoaded
+
+	Test that reading a notebook with large embedded outputs allocates far less than the outputs take up.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_readNotebookSource_outputsNotLoaded!")
+
+	# Write a notebook with about 8 MB of outputs
+	notebookPath = str(tmp_path / "heavy.ipynb")
+	with open(notebookPath, "w") as notebookFile:
+		json.dump(makeNotebook(SAMPLE_CELLS, 1 << 22), notebookFile)
+
+	# Read it while tracing allocations
+	tracemalloc.start()
+	try:
+		_, cellList = notebook_reader.readNotebookSource(notebookPath)
+		_, peakBytes = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+
+	# Assert that the outputs stayed on disk
+	assert cellList == [[1, 2], [4, 4]]
+	assert peakBytes < os.path.getsize(notebookPath) // 100
+
+def test_runFameML_analyzesNotebooks(tmp_path):
+	'''
+	## Unit Test: test_runFameML_analyzesNotebooks
+
+	Test that runFameML lists notebooks next to .py files and counts their detections.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_analyzesNotebooks!")
+
+	# Write a repo with a script and a notebook
+	repoPath = tmp_path / "corpus" / "repo_a"
+	os.makedirs(repoPath)
+	with open(repoPath / "script.py", "w") as scriptFile:
+		scriptFile.write("import torch\nx = torch.load(f)\n")
+	with open(repoPath / "sample.ipynb", "w") as notebookFile:
+		json.dump(makeNotebook(SAMPLE_CELLS), notebookFile)
+
+	# Run and read the rows back
+	csvPath = str(tmp_path / "out.csv")
+	fameml_main.runFameML(str(tmp_path / "corpus"), csvPath)
+	resultDF = pd.read_csv(csvPath)
+
+	# Assert that both files were analyzed
+	countDict = dict(zip(resultDF["FILE_FULL_PATH"].map(os.path.basename), resultDF["DATA_LOAD_COUNT"]))
+	assert countDict == {"sample.ipynb": 2, "script.py": 1}
@@ -0,0 +1,115 @@
+'''
+Name: test_rollUpCounts.py
+Description: Unit tests for CountMatrix, rollUpCounts and the roll-up of collectRepoResults.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import count_matrix # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def getExpectedRow(detectorRow):
+	'''
+	CSV count columns of one row of detector counts, summed one category at a time.
+	'''
+	countDict = dict(zip(constants.DETECTOR_LIST, detectorRow))
+	categoryRow = [sum(countDict[detector] for detector in detectorList) for detectorList in constants.CATEGORY_DETECTOR_LIST]
+	return tuple(categoryRow) + tuple(detectorRow[len(constants.DETECTOR_LIST):])
+
+@pytest.mark.parametrize("loggingFlag", [
+	False,
+	True,
+])
+def test_rollUpCounts_matchesPerFileSums(monkeypatch, loggingFlag: bool):
+	'''
+	## Unit Test: test_rollUpCounts_matchesPerFileSums
+
+	Test that a matrix that grows past several chunks keeps every row, and that its roll-up and column totals match per-file sums.
+
+	Args:
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+		loggingFlag: whether rows carry the LOGGING_PRESENT flag
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_rollUpCounts_matchesPerFileSums!")
+
+	# Fill a matrix with small chunks
+	monkeypatch.setattr(constants, "COUNT_MATRIX_CHUNK_ROWS", 3)
+	width = len(constants.DETECTOR_LIST) + int(loggingFlag)
+	rowList = [tuple((rowIndex * 7 + column) % 5 for column in range(width)) for rowIndex in range(10)]
+	detectorMatrix = count_matrix.CountMatrix(width, 2)
+	for row in rowList:
+		detectorMatrix.appendRow(row)
+
+	# Assert on the rows, the roll-up and the totals
+	assert len(detectorMatrix) == len(rowList)
+	assert list(detectorMatrix.iterRows()) == rowList
+	categoryMatrix = count_matrix.rollUpCounts(detectorMatrix)
+	expectedList = [getExpectedRow(row) for row in rowList]
+	assert list(categoryMatrix.iterRows()) == expectedList
+	assert categoryMatrix.width == len(constants.CSV_HEADER) - 2 + int(loggingFlag)
+	assert categoryMatrix.getColumnTotals() == [sum(column) for column in zip(*expectedList)]
+	assert count_matrix.rollUpRow(rowList[3]) == expectedList[3]
+	assert list(count_matrix.rollUpCounts(count_matrix.CountMatrix(width)).iterRows()) == []
+
+@pytest.mark.parametrize("minRows", [
+	0,
+	1000,
+])
+def test_collectRepoResults_matrixMatchesRowSums(monkeypatch, minRows: int):
+	'''
+	## Unit Test: test_collectRepoResults_matrixMatchesRowSums
+
+	Test that a repo rolled up through the matrix and a repo rolled up one row at a time give the same rows and totals,
+	with parse failures left out of both.
+
+	Args:
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+		minRows: repos with at least this many files use the matrix
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_collectRepoResults_matrixMatchesRowSums!")
+
+	# Build the results of a repo with one file that does not parse
+	monkeypatch.setattr(constants, "COUNT_MATRIX_MIN_ROWS", minRows)
+	width = len(constants.DETECTOR_LIST)
+	fileList = [f"repo/script_{rowIndex}.py" for rowIndex in range(6)]
+	resultList = [(tuple((rowIndex * 3 + column) % 4 for column in range(width)), None, None, None) for rowIndex in range(6)]
+	resultList[2] = (None, "SyntaxError", None, None)
+	totalList = [0] * (len(constants.CSV_HEADER) - 2)
+	failureList = []
+	rowList = fameml_main.collectRepoResults("repo", fileList, resultList, failureList, total_list=totalList)
+
+	# Assert on the rows, the totals and the failure
+	expectedList = [("repo", fileName) + getExpectedRow(resultTup[0]) for fileName, resultTup in zip(fileList, resultList) if resultTup[1] is None]
+	assert rowList == expectedList
+	assert all(type(count) is int for count in rowList[0][2:])
+	assert totalList == [sum(column) for column in zip(*(row[2:] for row in expectedList))]
+	assert failureList == [("repo", fileList[2], "SyntaxError")]
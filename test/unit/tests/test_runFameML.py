@@ -0,0 +1,332 @@
+'''
+Name: test_runFameML.py
+Description: Unit tests for runFameML function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import json
+import sys
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+import result_writer # type: ignore[reportMissingImports]
+
+# Third Party
+import pandas as pd # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+from test.unit.corpus import writeSampleCorpus
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+# three small repositories with a different number of detections per file
+SAMPLE_REPOS = [("repo_a", 2, 1), ("repo_b", 3, 1), ("repo_c", 1, 1)]
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_streamedCSVMatchesDataFrame(tmp_path, workers: int):
+	'''
+	## Unit Test: test_runFameML_streamedCSVMatchesDataFrame
+
+	Test that the streamed CSV is byte for byte what pandas writes for the same rows, and that every repo is in the manifest.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_streamedCSVMatchesDataFrame!")
+
+	# Run on the sample corpus
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	csvPath = str(tmp_path / "out.csv")
+	fameml_main.runFameML(corpusPath, csvPath, workers)
+
+	# Write the same rows through pandas
+	streamedDF = pd.read_csv(csvPath)
+	pandasPath = str(tmp_path / "pandas.csv")
+	pd.DataFrame(list(streamedDF.itertuples(index=False, name=None))).to_csv(pandasPath, header=constants.CSV_HEADER, index=False, encoding=constants.UTF_ENCODING)
+
+	# Assert that both files agree and all repos are completed
+	assert len(streamedDF) == 6
+	with open(csvPath) as streamedFile, open(pandasPath) as pandasFile:
+		assert streamedFile.read() == pandasFile.read()
+	completedSet, _ = result_writer.readManifest(result_writer.getManifestPath(csvPath))
+	assert completedSet == set(streamedDF["REPO_FULL_PATH"])
+
+def test_runFameML_resumeSkipsCompletedRepos(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_runFameML_resumeSkipsCompletedRepos
+
+	Test that a resumed run drops the rows of a repo that was cut off, skips completed repos and ends with the same CSV as a clean run.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_resumeSkipsCompletedRepos!")
+
+	# Run a clean scan for reference
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	cleanPath = str(tmp_path / "clean.csv")
+	fameml_main.runFameML(corpusPath, cleanPath)
+	repoList = list(pd.read_csv(cleanPath)["REPO_FULL_PATH"].unique())
+
+	# Fake a crash: the first repo is completed, half of the second repo's rows were written
+	csvPath = str(tmp_path / "out.csv")
+	writer, _ = result_writer.openResultWriter(csvPath)
+	result_writer.writeRepoRows(writer, repoList[0], fameml_main.getCSVData(fameml_main.getAllPythonFilesinRepo(repoList[0]), repoList[0]))
+	writer[0].write(repoList[1] + ",partial,row\n")
+	result_writer.closeResultWriter(writer)
+
+	# Resume, recording which repos get analyzed
+	analyzedList = []
+	getCSVData = fameml_main.getCSVData
+	def recordCSVData(fileList, repoPath, pool=None, failure_list=None, event_list=None, profile_list=None, dedup_state=None, total_list=None):
+		analyzedList.append(repoPath)
+		return getCSVData(fileList, repoPath, pool, failure_list, event_list, profile_list, dedup_state, total_list)
+	monkeypatch.setattr(fameml_main, "getCSVData", recordCSVData)
+	fameml_main.runFameML(corpusPath, csvPath, resume=True)
+
+	# Assert that only the unfinished repos were analyzed and the output matches the clean run
+	assert analyzedList == repoList[1:]
+	with open(csvPath) as resumedFile, open(cleanPath) as cleanFile:
+		assert resumedFile.read() == cleanFile.read()
+
+@pytest.mark.parametrize("headerOnly", [
+	False,
+	True,
+])
+def test_runFameML_resumeWithoutOutputStartsOver(tmp_path, headerOnly: bool):
+	'''
+	## Unit Test: test_runFameML_resumeWithoutOutputStartsOver
+
+	Test that a resumed run starts over when there is no output yet, or only the header of a CSV without a manifest.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		headerOnly: whether a CSV with only its header is left behind
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_resumeWithoutOutputStartsOver!")
+
+	# Run a clean scan for reference and leave the output of a run that never completed a repo
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	cleanPath = str(tmp_path / "clean.csv")
+	fameml_main.runFameML(corpusPath, cleanPath)
+	csvPath = str(tmp_path / "out.csv")
+	if headerOnly:
+		with open(csvPath, "w") as csvFile:
+			csvFile.write(",".join(constants.CSV_HEADER) + "\n")
+
+	# Assert that the resumed run is a full run
+	fameml_main.runFameML(corpusPath, csvPath, resume=True)
+	with open(csvPath) as resumedFile, open(cleanPath) as cleanFile:
+		assert resumedFile.read() == cleanFile.read()
+
+@pytest.mark.parametrize("removeFailures,removeManifest,eventsFlag,loggingFlag", [
+	(True, False, False, False),
+	(False, True, False, False),
+	(False, False, True, False),
+	(False, False, False, True),
+])
+def test_runFameML_resumeRefusesMismatchedOutput(tmp_path, removeFailures: bool, removeManifest: bool, eventsFlag: bool, loggingFlag: bool):
+	'''
+	## Unit Test: test_runFameML_resumeRefusesMismatchedOutput
+
+	Test that a resumed run raises instead of starting over when the parse failure report, the manifest or the event file of the
+	interrupted run is missing, or when the CSV was written with other columns, and that the existing CSV is left alone.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		removeFailures: whether the parse failure report of the interrupted run is deleted
+		removeManifest: whether the manifest of the interrupted run is deleted
+		eventsFlag: whether the resumed run asks for an event file the interrupted run did not write
+		loggingFlag: whether the resumed run adds the LOGGING_PRESENT column
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_resumeRefusesMismatchedOutput!")
+
+	# Run a scan to resume
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	csvPath = str(tmp_path / "out.csv")
+	fameml_main.runFameML(corpusPath, csvPath)
+	with open(csvPath) as csvFile:
+		csvText = csvFile.read()
+	if removeFailures:
+		os.remove(result_writer.getParseFailurePath(csvPath))
+	if removeManifest:
+		os.remove(result_writer.getManifestPath(csvPath))
+	eventsPath = str(tmp_path / "events.jsonl") if eventsFlag else None
+
+	# Assert that the resumed run refuses and keeps the CSV
+	with pytest.raises(ValueError):
+		fameml_main.runFameML(corpusPath, csvPath, resume=True, logging_flag=loggingFlag, events_path=eventsPath)
+	with open(csvPath) as csvFile:
+		assert csvFile.read() == csvText
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_parseFailureReport(tmp_path, workers: int):
+	'''
+	## Unit Test: test_runFameML_parseFailureReport
+
+	Test that files that do not parse are left out of the CSV and listed with their error class in the parse-failure report.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_parseFailureReport!")
+
+	# Add two broken files to the sample corpus
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	with open(os.path.join(corpusPath, "repo_b", "broken.py"), "w") as brokenFile:
+		brokenFile.write("def broken(:\n")
+	with open(os.path.join(corpusPath, "repo_c", "latin.py"), "wb") as latinFile:
+		latinFile.write(b"x = '\xe9'\n")
+
+	# Run the scan
+	csvPath = str(tmp_path / "out.csv")
+	fameml_main.runFameML(corpusPath, csvPath, workers)
+
+	# Assert the CSV only has the good files and the report has the broken ones
+	assert len(pd.read_csv(csvPath)) == 6
+	failureDF = pd.read_csv(result_writer.getParseFailurePath(csvPath))
+	assert list(failureDF.columns) == constants.PARSE_FAILURE_HEADER
+	assert sorted(zip(failureDF["FILE_FULL_PATH"].map(os.path.basename), failureDF["ERROR_CLASS"])) == [("broken.py", "SyntaxError"), ("latin.py", "UnicodeDecodeError")]
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_detectionEvents(tmp_path, capsys, workers: int):
+	'''
+	## Unit Test: test_runFameML_detectionEvents
+
+	Test that every detection is written as one JSON line with its rule id, and that the default summary console mode prints no per-detection lines.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		capsys: pytest output capture fixture - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_detectionEvents!")
+
+	# Run the scan with an event sink
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	csvPath = str(tmp_path / "out.csv")
+	eventsPath = str(tmp_path / "events.jsonl")
+	fameml_main.runFameML(corpusPath, csvPath, workers, events_path=eventsPath)
+	consoleOutput = capsys.readouterr().out
+
+	# Assert one event per torch.load call
+	with open(eventsPath) as eventsFile:
+		eventList = [json.loads(line) for line in eventsFile]
+	loadEvents = [event for event in eventList if event["detector"] == constants.DATA_LOAD_COUNTA_KW]
+	assert len(loadEvents) == 1 + 2 + 1 + 2 + 3 + 1
+	repoNames = [os.path.basename(event["repo"]) for event in loadEvents]
+	assert {repoName: repoNames.count(repoName) for repoName in repoNames} == {"repo_a": 3, "repo_b": 6, "repo_c": 1}
+	assert all(event["rule"] == "data_load_counta/attrib_funcs/torch.load" for event in loadEvents)
+	assert sorted(event["line"] for event in loadEvents if os.path.basename(event["file"]) == "script_2.py") == [2, 3, 4]
+
+	# Assert that the console only has the summary
+	assert constants.DETECTION_SUMMARY_KW in consoleOutput
+	assert constants.DATA_LOAD_COUNTA_KW.upper() not in consoleOutput.replace(constants.DETECTION_SUMMARY_KW, "")
+
+@pytest.mark.parametrize("workers", [
+	1,
+	2,
+])
+def test_runFameML_dedupMatchesFullScan(tmp_path, capsys, workers: int):
+	'''
+	## Unit Test: test_runFameML_dedupMatchesFullScan
+
+	Test that a deduplicated scan analyzes each distinct file content once and still writes every path, with the same CSV, failures and events as a full scan.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		capsys: pytest output capture fixture - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+		workers: number of pool workers
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameML_dedupMatchesFullScan!")
+
+	# Every repo has a copy of script_0.py, repo_a and repo_b share script_1.py, two copies do not parse
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	for repoName in ["repo_a", "repo_c"]:
+		with open(os.path.join(corpusPath, repoName, "broken.py"), "w") as brokenFile:
+			brokenFile.write("def broken(:\n")
+
+	# Run a full and a deduplicated scan
+	outputList = []
+	for dedupFlag in [False, True]:
+		csvPath = str(tmp_path / f"out_{dedupFlag}.csv")
+		eventsPath = str(tmp_path / f"events_{dedupFlag}.jsonl")
+		fameml_main.runFameML(corpusPath, csvPath, workers, events_path=eventsPath, dedup=dedupFlag)
+		with open(csvPath) as csvFile, open(result_writer.getParseFailurePath(csvPath)) as failureFile, open(eventsPath) as eventsFile:
+			outputList.append((csvFile.read(), failureFile.read(), sorted(eventsFile.read().splitlines())))
+	consoleOutput = capsys.readouterr().out
+	logger.info(consoleOutput)
+
+	# Assert that the outputs match and that the summary counts 8 files in 4 blobs
+	assert outputList[0] == outputList[1]
+	assert len(outputList[1][0].splitlines()) == 1 + 6
+	assert f"{constants.DEDUP_SUMMARY_KW} {{'files': 8, 'unique_blobs': 4, 'dedup_ratio': 2.0," in consoleOutput
@@ -0,0 +1,121 @@
+'''
+Name: test_runFameMLDelta.py
+Description: Unit tests for runFameMLDelta function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import subprocess
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+
+# Target Module Imports
+import main as fameml_main # type: ignore[reportMissingImports]
+import git_delta # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+def commitAll(repoPath, message):
+	'''
+	Commits the whole working tree of the sample repository and returns the commit hash.
+	'''
+	subprocess.check_call(["git", "-C", repoPath, "add", "-A"])
+	subprocess.check_call(["git", "-C", repoPath, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", message])
+	return git_delta.getCommitHash(repoPath, "HEAD")
+
+def writeScript(repoPath, name, loadCount):
+	'''
+	Writes a script with loadCount detections and enough file-specific lines that git does not pair it with another file.
+	'''
+	with open(os.path.join(repoPath, name), "w") as scriptFile:
+		scriptFile.write("".join(f"{name[:-3]}_{i} = {i}\n" for i in range(20)))
+		scriptFile.write("import torch\n" + "x = torch.load(f)\n" * loadCount)
+
+def test_runFameMLDelta_matchesFullRescan(tmp_path):
+	'''
+	## Unit Test: test_runFameMLDelta_matchesFullRescan
+
+	Test that an incremental scan over added, modified, renamed and deleted files gives the same CSV as a full rescan.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameMLDelta_matchesFullRescan!")
+
+	# Build the first commit
+	inputDir = tmp_path / "input"
+	repoPath = str(inputDir / "repo")
+	os.makedirs(repoPath)
+	subprocess.check_call(["git", "init", "-q", repoPath])
+	writeScript(repoPath, "kept.py", 1)
+	writeScript(repoPath, "modified.py", 2)
+	writeScript(repoPath, "moved.py", 3)
+	writeScript(repoPath, "removed.py", 4)
+	oldCommit = commitAll(repoPath, "first")
+	priorCSV = str(tmp_path / "prior.csv")
+	fameml_main.runFameML(str(inputDir), priorCSV)
+
+	# Build the second commit
+	writeScript(repoPath, "modified.py", 5)
+	os.rename(os.path.join(repoPath, "moved.py"), os.path.join(repoPath, "renamed.py"))
+	os.remove(os.path.join(repoPath, "removed.py"))
+	writeScript(repoPath, "added.py", 6)
+	newCommit = commitAll(repoPath, "second")
+
+	# Run the incremental scan and a full rescan
+	deltaCSV = str(tmp_path / "delta.csv")
+	fullCSV = str(tmp_path / "full.csv")
+	deltaDict = fameml_main.runFameMLDelta(repoPath, oldCommit, newCommit, priorCSV, deltaCSV)
+	fameml_main.runFameML(str(inputDir), fullCSV)
+
+	# Assert that only the changed files were analyzed and the CSVs agree
+	assert deltaDict == {"analyzed": 2, "carried_forward": 1, "renamed": 1, "deleted": 1}
+	with open(deltaCSV) as deltaFile, open(fullCSV) as fullFile:
+		assert deltaFile.read() == fullFile.read()
+
+def test_runFameMLDelta_rejectsOtherCheckout(tmp_path):
+	'''
+	## Unit Test: test_runFameMLDelta_rejectsOtherCheckout
+
+	Test that the incremental scan refuses to run when the repository is not checked out at the new commit.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runFameMLDelta_rejectsOtherCheckout!")
+
+	# Build a repository with two commits, checked out at the first
+	repoPath = str(tmp_path / "repo")
+	os.makedirs(repoPath)
+	subprocess.check_call(["git", "init", "-q", repoPath])
+	writeScript(repoPath, "a.py", 1)
+	oldCommit = commitAll(repoPath, "first")
+	writeScript(repoPath, "a.py", 2)
+	newCommit = commitAll(repoPath, "second")
+	subprocess.check_call(["git", "-C", repoPath, "checkout", "-q", oldCommit])
+
+	# Assert that the scan is rejected
+	with pytest.raises(ValueError):
+		fameml_main.runFameMLDelta(repoPath, oldCommit, newCommit, str(tmp_path / "prior.csv"), str(tmp_path / "delta.csv"))
@@ -0,0 +1,196 @@
+'''
+Name: test_runScan.py
+Description: Unit tests for the fame-ml command line.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import re
+import sys
+import subprocess
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+FAMEML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML")
+sys.path.insert(0, FAMEML_DIR)
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import fame_ml # type: ignore[reportMissingImports]
+import scan_report # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+from test.unit.corpus import writeSampleCorpus
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+'''
+import time budgets in milliseconds, for the imports a bare interpreter does not do, best of IMPORT_RUNS runs of python -X importtime ...
+measured against the interpreter's own startup imports so that a slow or loaded machine moves both sides, and about twice what
+the commands take on a developer machine so that only a new eager import of something heavy trips them
+'''
+HELP_IMPORT_BUDGET_MS = 100
+SCAN_IMPORT_BUDGET_MS = 200
+IMPORT_RUNS = 3
+HEAVY_MODULES = ["pandas", "numpy"]
+
+# two small repositories, the first file of each without detections
+SAMPLE_REPOS = [("repo_a", 2, 0), ("repo_b", 1, 0)]
+
+def writeScanCorpus(corpusPath):
+	'''
+	Writes the sample repositories and a file that does not parse.
+	'''
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	with open(os.path.join(corpusPath, "repo_b", "broken.py"), "w") as brokenFile:
+		brokenFile.write("def broken(:\n")
+
+def getImportTimes(commandList, cwd):
+	'''
+	Self microseconds of every module imported by running python -X importtime with commandList.
+	'''
+	processResult = subprocess.run([sys.executable, "-X", "importtime"] + commandList, cwd=cwd, capture_output=True, text=True, check=True)
+	importDict = {}
+	for importLine in processResult.stderr.splitlines():
+		importMatch = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)", importLine)
+		if importMatch:
+			importDict[importMatch.group(2)] = int(importMatch.group(1))
+	return importDict
+
+def getImportProfile(argList, cwd):
+	'''
+	( top-level names of the modules imported by fame_ml.py with argList, milliseconds spent importing modules that a bare
+	interpreter does not import ), best of IMPORT_RUNS runs.
+	'''
+	bestMs, moduleSet = None, set()
+	for _ in range(IMPORT_RUNS):
+		baselineSet = set(getImportTimes(["-c", "pass"], cwd))
+		importDict = getImportTimes([os.path.join(FAMEML_DIR, "fame_ml.py")] + argList, cwd)
+		moduleSet.update(moduleName.split(".")[0] for moduleName in importDict)
+		importMs = sum(importUs for moduleName, importUs in importDict.items() if moduleName not in baselineSet) / 1000
+		bestMs = importMs if bestMs is None else min(bestMs, importMs)
+	return moduleSet, bestMs
+
+@pytest.mark.parametrize("argList,budgetMs", [
+	(["--help"], HELP_IMPORT_BUDGET_MS),
+	(["scan", "corpus", "--output-csv", "out.csv", "--console", "none"], SCAN_IMPORT_BUDGET_MS),
+])
+def test_runScan_importBudget(tmp_path, argList: list, budgetMs: int):
+	'''
+	## Unit Test: test_runScan_importBudget
+
+	Test that --help and a small scan do not import pandas or numpy, and that their imports beyond those of a bare interpreter
+	stay within the import time budget.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		argList: command line arguments
+		budgetMs: import time budget in milliseconds
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runScan_importBudget!")
+
+	# Profile the imports of the command
+	writeScanCorpus(str(tmp_path / "corpus"))
+	moduleSet, importMs = getImportProfile(argList, str(tmp_path))
+	logger.info(f"{argList[0]} imports beyond a bare interpreter took {importMs} ms")
+
+	# Assert on the heavy modules and the budget
+	assert "constants" in moduleSet
+	assert not moduleSet.intersection(HEAVY_MODULES)
+	assert importMs < budgetMs
+
+def test_runScan_scanReportStats(tmp_path, capsys):
+	'''
+	## Unit Test: test_runScan_scanReportStats
+
+	Test that fame-ml scan writes the same CSV as runFameML, and that report and stats give the counts of that CSV.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		capsys: pytest fixture to capture output - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runScan_scanReportStats!")
+
+	# Scan through the command line and directly
+	corpusPath = str(tmp_path / "corpus")
+	writeScanCorpus(corpusPath)
+	csvPath = str(tmp_path / "out.csv")
+	assert fame_ml.main(["scan", corpusPath, "-o", csvPath]) == 0
+	directPath = str(tmp_path / "direct.csv")
+	fameml_main.runFameML(corpusPath, directPath)
+	with open(csvPath) as cliFile, open(directPath) as directFile:
+		assert cliFile.read() == directFile.read()
+
+	# Assert on the report
+	capsys.readouterr()
+	reportPath = str(tmp_path / "report.csv")
+	fame_ml.main(["report", csvPath, "--output", reportPath])
+	reportLines = capsys.readouterr().out.splitlines()
+	assert reportLines[0] == "CATEGORY:DATA_LOAD_COUNT, TOTAL_EVENT_COUNT:1, ATLEASTONE:1, PROP_VAL:33.333"
+	assert reportLines[1] == "CATEGORY:MODEL_LOAD_COUNT, TOTAL_EVENT_COUNT:0, ATLEASTONE:0, PROP_VAL:0.0"
+	_, repoList = scan_report.getCategoryReport(csvPath)
+	assert len(repoList) == 2 * len(constants.CSV_HEADER[2:])
+	with open(reportPath) as reportFile:
+		assert reportFile.readline().strip() == ",".join(constants.REPORT_HEADER)
+
+	# Assert on the stats
+	fame_ml.main(["stats", csvPath])
+	assert capsys.readouterr().out.splitlines() == ["REPO_COUNT: 2", "ALL_FILE_COUNT: 3", "ALL_FILE_SIZE: 4",
+													 "MISSING_FILE_COUNT: 0", "PARSE_FAILURE_COUNT: 1", "LIMIT_SKIP_COUNT: 0"]
+
+@pytest.mark.parametrize("argList", [
+	["scan"],
+	["scan", "corpus"],
+	["scan", "corpus", "-o", "out.csv", "--delta", "HEAD~1", "HEAD"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--workers", "2"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--resume"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--events", "events.jsonl"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--profile", "profile.json"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--dedup"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--logging"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--console", "hits"],
+	["scan", "corpus", "-o", "out.csv", "--prior-csv", "prior.csv", "--delta", "HEAD~1", "HEAD", "--console", "none"],
+])
+def test_runScan_missingInputs(argList: list, capsys):
+	'''
+	## Unit Test: test_runScan_missingInputs
+
+	Test that a scan without its inputs is a usage error rather than a scan of a default path, and that a --delta scan
+	rejects the full-scan options it would otherwise ignore.
+
+	Args:
+		argList: command line arguments
+		capsys: pytest fixture to capture output - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_runScan_missingInputs!")
+
+	# Assert that argparse rejects it
+	with pytest.raises(SystemExit) as exitInfo:
+		fame_ml.main(argList)
+	assert exitInfo.value.code == 2
+	if "--prior-csv" in argList:
+		assert argList[argList.index("HEAD") + 1] in capsys.readouterr().err
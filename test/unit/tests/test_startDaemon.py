@@ -0,0 +1,229 @@
+'''
+Name: test_startDaemon.py
+Description: Unit tests for the warm analysis daemon.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import json
+import time
+import signal
+import threading
+import subprocess
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+FAMEML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML")
+sys.path.insert(0, FAMEML_DIR)
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import analysis_daemon # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+SCRIPT_TEXT = "import torch\nimport pickle\nmodel = torch.load(path)\ndata = pickle.load(f)\n"
+NOTEBOOK_TEXT = json.dumps({"cells": [{"cell_type": "code", "source": ["%matplotlib inline\n", "model = torch.load(path)\n"], "outputs": []}],
+							"metadata": {}, "nbformat": 4, "nbformat_minor": 5})
+
+def getExpectedRecord(scriptPath, fileName):
+	'''
+	Record of a serial getFileResult with events on, under fileName.
+	'''
+	fameml_main.initWorkerState(None, events_flag=True)
+	try:
+		resultTup = fameml_main.getFileResult(scriptPath)
+	finally:
+		fameml_main.initWorkerState(None)
+	for event_ in resultTup[2] or []:
+		event_[constants.EVENT_FILE_KW] = fileName
+	return analysis_daemon.getResultRecord(fileName, resultTup, constants.CSV_HEADER[2:])
+
+def test_startDaemon_servesClients(tmp_path):
+	'''
+	## Unit Test: test_startDaemon_servesClients
+
+	Test that a daemon answers paths and source text from several clients at once with the counts and events of a
+	serial run, answers bad requests without dropping the connection, and stops on a shutdown request.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startDaemon_servesClients!")
+
+	# Write the files and the serial results
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write(SCRIPT_TEXT)
+	brokenPath = str(tmp_path / "broken.py")
+	with open(brokenPath, "w") as brokenFile:
+		brokenFile.write("def broken(:\n")
+	notebookPath = str(tmp_path / "sample.ipynb")
+	with open(notebookPath, "w") as notebookFile:
+		notebookFile.write(NOTEBOOK_TEXT)
+	expectedList = [getExpectedRecord(scriptPath, scriptPath), getExpectedRecord(brokenPath, brokenPath),
+					getExpectedRecord(scriptPath, "inline.py"), getExpectedRecord(notebookPath, "inline.ipynb")]
+	assert expectedList[0][constants.DAEMON_COUNTS_KW]["TOTAL_EVENT_COUNT"] == 2
+	assert expectedList[1][constants.DAEMON_ERROR_KW] == "SyntaxError"
+	assert expectedList[3][constants.DAEMON_EVENTS_KW][0][constants.EVENT_CELL_KW] == 1
+
+	# Start the daemon
+	socketPath = str(tmp_path / "fameml.sock")
+	server = analysis_daemon.startDaemon(socketPath, workers=2)
+	serveThread = threading.Thread(target=server.serve_forever)
+	serveThread.start()
+	try:
+		assert analysis_daemon.requestAnalysis(socketPath, op_=constants.DAEMON_PING_KW) == {"ok": True, "workers": 2}
+		assert os.stat(socketPath).st_mode & 0o777 == constants.DAEMON_SOCKET_MODE
+
+		# Send the same request from several clients at once
+		responseList = [None] * 4
+		def sendRequest(clientIndex):
+			responseList[clientIndex] = analysis_daemon.requestAnalysis(socketPath, [scriptPath, brokenPath],
+																		{"inline.py": SCRIPT_TEXT, "inline.ipynb": NOTEBOOK_TEXT})
+		clientList = [threading.Thread(target=sendRequest, args=(clientIndex,)) for clientIndex in range(len(responseList))]
+		for client_ in clientList:
+			client_.start()
+		for client_ in clientList:
+			client_.join()
+
+		# Assert that every client got the serial results
+		for response_ in responseList:
+			assert response_ == {"results": expectedList}
+		missingPath = str(tmp_path / "missing.py")
+		assert analysis_daemon.requestAnalysis(socketPath, [missingPath])["results"][0][constants.DAEMON_ERROR_KW] == "FileNotFoundError"
+
+		# Assert that bad requests are answered on the same connection
+		with analysis_daemon.socket.socket(analysis_daemon.socket.AF_UNIX) as client_:
+			client_.connect(socketPath)
+			client_.sendall(b'not json\n{"files": "script.py"}\n{"op": "restart"}\n{"op": "ping"}\n')
+			with client_.makefile("rb") as responseFile:
+				responseList = [json.loads(responseFile.readline()) for _ in range(4)]
+		assert [sorted(response_) for response_ in responseList] == [["error"], ["error"], ["error"], ["ok", "workers"]]
+
+		# Stop it with a shutdown request
+		assert analysis_daemon.requestAnalysis(socketPath, op_=constants.DAEMON_SHUTDOWN_KW)["ok"]
+		serveThread.join(timeout=30)
+		assert not serveThread.is_alive()
+	finally:
+		server.shutdown()
+		serveThread.join()
+		analysis_daemon.stopDaemon(server)
+	assert not os.path.exists(socketPath)
+
+def test_startDaemon_staleSocket(tmp_path):
+	'''
+	## Unit Test: test_startDaemon_staleSocket
+
+	Test that a socket file nobody listens on is replaced, and that a second daemon on a live socket is refused.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startDaemon_staleSocket!")
+
+	# Leave a dead socket file behind
+	socketPath = str(tmp_path / "fameml.sock")
+	with analysis_daemon.socket.socket(analysis_daemon.socket.AF_UNIX) as deadSocket:
+		deadSocket.bind(socketPath)
+
+	# Assert that it is replaced and that a live daemon is not
+	server = analysis_daemon.startDaemon(socketPath)
+	try:
+		with pytest.raises(ValueError):
+			analysis_daemon.startDaemon(socketPath)
+	finally:
+		analysis_daemon.stopDaemon(server)
+
+def test_serveDaemon_cli(tmp_path):
+	'''
+	## Unit Test: test_serveDaemon_cli
+
+	Test that fame-ml daemon serves requests and exits cleanly on SIGTERM.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_serveDaemon_cli!")
+
+	# Start the daemon and wait for its socket
+	socketPath = str(tmp_path / "fameml.sock")
+	daemonProcess = subprocess.Popen([sys.executable, "fame_ml.py", "daemon", socketPath], cwd=FAMEML_DIR)
+	try:
+		for _ in range(600):
+			if os.path.exists(socketPath):
+				break
+			time.sleep(0.1)
+
+		# Assert that it answers
+		scriptPath = str(tmp_path / "script.py")
+		with open(scriptPath, "w") as scriptFile:
+			scriptFile.write(SCRIPT_TEXT)
+		resultList = analysis_daemon.requestAnalysis(socketPath, [scriptPath])["results"]
+		assert resultList[0][constants.DAEMON_COUNTS_KW]["TOTAL_EVENT_COUNT"] == 2
+	finally:
+		daemonProcess.send_signal(signal.SIGTERM)
+		returnCode = daemonProcess.wait(timeout=60)
+
+	# Assert that it cleaned up
+	assert returnCode == 0
+	assert not os.path.exists(socketPath)
+
+def test_analyzeDaemonTask_analysisError(tmp_path, monkeypatch):
+	'''
+	## Unit Test: test_analyzeDaemonTask_analysisError
+
+	Test that a file whose analysis raises gets the class of the error as its parse error instead of failing the
+	request, and that the other tasks are still answered.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_analyzeDaemonTask_analysisError!")
+
+	# Make the analysis of inline source blow up
+	def raiseRecursion(fileName, sourceText):
+		raise RecursionError("maximum recursion depth exceeded")
+	monkeypatch.setattr(analysis_daemon, "analyzeSource", raiseRecursion)
+	scriptPath = str(tmp_path / "script.py")
+	with open(scriptPath, "w") as scriptFile:
+		scriptFile.write(SCRIPT_TEXT)
+
+	# Assert that the error is reported per task
+	assert analysis_daemon.analyzeDaemonTask(("deep.py", SCRIPT_TEXT)) == (None, "RecursionError", None, None)
+	assert analysis_daemon.analyzeDaemonTask((str(tmp_path / "missing.py"), None)) == (None, "FileNotFoundError", None, None)
+	assert analysis_daemon.analyzeDaemonTask((scriptPath, None))[1] is None
@@ -0,0 +1,222 @@
+'''
+Name: test_startLogPipeline.py
+Description: Unit tests for startLogPipeline function.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import logging
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory and the shared package root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana", "FAME-ML"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana"))
+
+# Target Module Imports
+import log_pipeline # type: ignore[reportMissingImports]
+import lint_engine # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+from src.MLForensics_farzana.mining.mining import makeChunks
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+@pytest.mark.parametrize("levelSpec,expectedLevels", [
+	("", {"fameml": logging.INFO, "fameml.engine": logging.WARNING, "mining": logging.WARNING}),
+	("fameml.engine=DEBUG, mining=error", {"fameml": logging.INFO, "fameml.engine": logging.DEBUG, "mining": logging.ERROR}),
+	("DEBUG", {"fameml": logging.DEBUG, "fameml.engine": logging.DEBUG, "mining": logging.DEBUG}),
+])
+def test_parseLevelSpec_perSubsystemLevels(levelSpec: str, expectedLevels: dict):
+	'''
+	## Unit Test: test_parseLevelSpec_perSubsystemLevels
+
+	Test that a level spec sets each named subsystem and leaves the others at their default.
+
+	Args:
+		levelSpec: spec string as given to --log-level
+		expectedLevels: levels expected for a few subsystems
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_parseLevelSpec_perSubsystemLevels!")
+
+	# Assert the parsed levels
+	levelDict = log_pipeline.parseLevelSpec(levelSpec)
+	for name, level in expectedLevels.items():
+		assert levelDict[name] == level
+
+	# Assert that an unknown level is refused
+	with pytest.raises(ValueError):
+		log_pipeline.parseLevelSpec("fameml=LOUD")
+
+def test_startLogPipeline_levelsGateEachSubsystem(tmp_path):
+	'''
+	## Unit Test: test_startLogPipeline_levelsGateEachSubsystem
+
+	Test that records of an enabled subsystem reach the log file through the queue while a subsystem left at its default level writes nothing.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startLogPipeline_levelsGateEachSubsystem!")
+
+	# A file the keyword prefilter rules out
+	scriptPath = tmp_path / "plain.py"
+	scriptPath.write_text("x = 1\n")
+
+	# Log the engine at DEBUG, mining at its default
+	logPath = str(tmp_path / "run.log")
+	log_pipeline.startLogPipeline(log_pipeline.parseLevelSpec("fameml.engine=DEBUG"), logPath)
+	try:
+		lint_engine.getDetectorHits(str(scriptPath))
+		list(makeChunks([1, 2, 3], 1))
+	finally:
+		log_pipeline.stopLogPipeline()
+
+	# Assert that only the engine record was written
+	with open(logPath) as logFile:
+		logLines = logFile.read().splitlines()
+	assert len(logLines) == 1
+	assert "[fameml.engine] [DEBUG]" in logLines[0]
+	assert str(scriptPath) in logLines[0]
+
+	# Assert that the loggers are back to normal
+	assert logging.getLogger("fameml.engine").level == logging.NOTSET
+	assert logging.getLogger("mining").propagate
+
+def test_startLogPipeline_poolWorkersJoin(tmp_path):
+	'''
+	## Unit Test: test_startLogPipeline_poolWorkersJoin
+
+	Test that records logged inside pool workers reach the parent's log file when the pipeline is process safe.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startLogPipeline_poolWorkersJoin!")
+
+	# Build a corpus with one broken file per repo
+	corpusPath = tmp_path / "corpus"
+	for repoName in ["repo_a", "repo_b"]:
+		repoPath = corpusPath / repoName
+		repoPath.mkdir(parents=True)
+		(repoPath / "good.py").write_text("import torch\nx = torch.load(f)\n")
+		(repoPath / "broken.py").write_text("def broken(:\n")
+
+	# Scan with two workers
+	logPath = str(tmp_path / "run.log")
+	log_pipeline.startLogPipeline(log_pipeline.parseLevelSpec("fameml.engine=DEBUG"), logPath, process_safe=True)
+	try:
+		fameml_main.runFameML(str(corpusPath), str(tmp_path / "out.csv"), workers=2)
+	finally:
+		log_pipeline.stopLogPipeline()
+
+	# Assert that both parse errors came from the workers and the progress lines from the parent
+	with open(logPath) as logFile:
+		logLines = logFile.read().splitlines()
+	parseLines = [line for line in logLines if "could not parse" in line]
+	assert len(parseLines) == 2
+	assert all("[MainProcess]" not in line for line in parseLines)
+	assert len([line for line in logLines if "[fameml] [INFO]" in line and "[MainProcess]" in line]) == 2
+
+def test_startLogPipeline_loggerNamesFromConstants():
+	'''
+	## Unit Test: test_startLogPipeline_loggerNamesFromConstants
+
+	Test that the pipeline takes the FAME-ML logger names from FAME-ML/constants.py, and reuses that module once FAME-ML
+	has imported it.
+
+	Args:
+		None
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startLogPipeline_loggerNamesFromConstants!")
+
+	# Assert that the names and the module are those of FAME-ML
+	import constants # type: ignore[reportMissingImports]
+	assert os.path.realpath(log_pipeline.FAMEML_CONSTANTS.__file__) == os.path.realpath(constants.__file__)
+	assert log_pipeline.loadFameConstants() is constants
+	assert (log_pipeline.FAMEML_LOGGER_KW, log_pipeline.ENGINE_LOGGER_KW, log_pipeline.CACHE_LOGGER_KW) == (constants.FAMEML_LOGGER_KW, constants.ENGINE_LOGGER_KW, constants.CACHE_LOGGER_KW)
+	assert fameml_main.FAMEML_LOGGER.name == log_pipeline.FAMEML_LOGGER_KW
+
+def test_startLogPipeline_defaultProgressWithoutPipeline(tmp_path, capsys, monkeypatch):
+	'''
+	## Unit Test: test_startLogPipeline_defaultProgressWithoutPipeline
+
+	Test that a library call of runFameML without the pipeline still shows its progress lines on stderr, that the
+	pipeline takes them over while it runs, and that a caller with handlers of its own does not get them twice.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		capsys: pytest fixture - see https://docs.pytest.org/en/stable/how-to/capture-stdout-stderr.html
+		monkeypatch: pytest fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_startLogPipeline_defaultProgressWithoutPipeline!")
+
+	# One repo with one file
+	corpusPath = tmp_path / "corpus"
+	(corpusPath / "repo_a").mkdir(parents=True)
+	(corpusPath / "repo_a" / "good.py").write_text("import torch\nx = torch.load(f)\n")
+	csvPath = str(tmp_path / "out.csv")
+	rootLogger = logging.getLogger()
+
+	# Assert that without the pipeline, or any root handler, the progress line goes to stderr
+	monkeypatch.setattr(rootLogger, "handlers", [])
+	capsys.readouterr()
+	fameml_main.runFameML(str(corpusPath), csvPath)
+	assert capsys.readouterr().err.splitlines() == ["Finished Analyzing: " + str(corpusPath / "repo_a")]
+
+	# Assert that the pipeline takes the line over and hands it back when it stops
+	logPath = str(tmp_path / "run.log")
+	log_pipeline.startLogPipeline(log_pipeline.parseLevelSpec(""), logPath)
+	try:
+		fameml_main.runFameML(str(corpusPath), csvPath)
+	finally:
+		log_pipeline.stopLogPipeline()
+	assert capsys.readouterr().err == ""
+	with open(logPath) as logFile:
+		assert "Finished Analyzing" in logFile.read()
+	assert log_pipeline.DEFAULT_HANDLER in logging.getLogger("fameml").handlers
+
+	# Assert that a caller with a root handler of its own gets the line only there
+	rootRecords = []
+	rootHandler = logging.Handler()
+	rootHandler.emit = rootRecords.append
+	monkeypatch.setattr(rootLogger, "handlers", [rootHandler])
+	fameml_main.runFameML(str(corpusPath), csvPath)
+	assert capsys.readouterr().err == ""
+	assert [record.getMessage() for record in rootRecords] == ["Finished Analyzing: " + str(corpusPath / "repo_a")]
@@ -0,0 +1,121 @@
+'''
+Name: test_writeResultTable.py
+Description: Unit tests for the columnar scan results.
+'''
+
+'''
+MODULE IMPORTS
+'''
+
+# System
+import os
+import sys
+import importlib.util
+
+# FAME-ML modules import each other by bare name, so expose the FAME-ML directory
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "MLForensics_farzana")
+sys.path.insert(0, os.path.join(PACKAGE_DIR, "FAME-ML"))
+
+# Target Module Imports
+import constants # type: ignore[reportMissingImports]
+import main as fameml_main # type: ignore[reportMissingImports]
+import result_table # type: ignore[reportMissingImports]
+
+# Unit Submodule Imports
+from test.unit.logging import UnitLogger
+from test.unit.corpus import writeSampleCorpus
+
+# Testing
+import pytest # type: ignore[reportMissingImports]
+
+# Third Party
+pytest.importorskip("pyarrow")
+import pandas as pd # type: ignore[reportMissingImports]
+
+# three repositories, one of them with a path that needs quoting in the CSV
+SAMPLE_REPOS = [("repo_a", 2, 1), ("repo,b", 3, 1), ("repo_c", 1, 1)]
+
+def loadFrequency():
+	'''
+	empirical/frequency.py as a module.
+	'''
+	moduleSpec = importlib.util.spec_from_file_location("frequency", os.path.join(PACKAGE_DIR, "empirical", "frequency.py"))
+	frequencyModule = importlib.util.module_from_spec(moduleSpec)
+	moduleSpec.loader.exec_module(frequencyModule)
+	return frequencyModule
+
+@pytest.mark.parametrize("tableName,loggingFlag", [
+	("out.parquet", False),
+	("out.arrow", True),
+])
+def test_writeResultTable_matchesCSV(tmp_path, monkeypatch, tableName: str, loggingFlag: bool):
+	'''
+	## Unit Test: test_writeResultTable_matchesCSV
+
+	Test that the columnar output of a scan holds the CSV rows with a dictionary-encoded repo column and unsigned counts,
+	across several read blocks, and that frequency.py reports the same proportions from it as from the CSV.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		monkeypatch: pytest monkeypatch fixture - see https://docs.pytest.org/en/stable/how-to/monkeypatch.html
+		tableName: columnar output file name
+		loggingFlag: whether the scan adds the LOGGING_PRESENT column
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_writeResultTable_matchesCSV!")
+
+	# Scan with small read blocks
+	monkeypatch.setattr(result_table, "READ_BLOCK_BYTES", 256)
+	corpusPath = str(tmp_path / "corpus")
+	writeSampleCorpus(corpusPath, SAMPLE_REPOS)
+	csvPath = str(tmp_path / "out.csv")
+	tablePath = str(tmp_path / tableName)
+	fameml_main.runFameML(corpusPath, csvPath, logging_flag=loggingFlag, columnar_path=tablePath)
+
+	# Assert that the table holds the CSV rows
+	csvDF = pd.read_csv(csvPath)
+	tableDF = result_table.readResultTable(tablePath)
+	assert isinstance(tableDF["REPO_FULL_PATH"].dtype, pd.CategoricalDtype)
+	assert tableDF["TOTAL_EVENT_COUNT"].dtype == "uint32"
+	assert [[str(row[0]), str(row[1])] + [int(count) for count in row[2:]] for row in tableDF.values.tolist()] == csvDF.values.tolist()
+	assert list(tableDF.columns) == (constants.CSV_LOGGING_HEADER if loggingFlag else constants.CSV_HEADER)
+
+	# Assert that frequency.py reads it directly
+	frequencyModule = loadFrequency()
+	for resultPath, proportionName in [(csvPath, "csv_prop.csv"), (tablePath, "table_prop.csv")]:
+		frequencyModule.reportProportion(resultPath, str(tmp_path / proportionName))
+	with open(tmp_path / "csv_prop.csv") as csvFile, open(tmp_path / "table_prop.csv") as tableFile:
+		assert csvFile.read() == tableFile.read()
+
+@pytest.mark.parametrize("tableName", [
+	"out.csv",
+	"out.xlsx",
+])
+def test_writeResultTable_badFormat(tmp_path, tableName: str):
+	'''
+	## Unit Test: test_writeResultTable_badFormat
+
+	Test that a columnar path without a Parquet or Arrow extension is refused before anything is scanned.
+
+	Args:
+		tmp_path: pytest temp directory - see https://docs.pytest.org/en/stable/how-to/tmp_path.html
+		tableName: columnar output file name
+	'''
+
+	# Get logger
+	logger = UnitLogger()
+	logger.info("Unit Testing Logger Initialized!")
+
+	# Print statement for testing
+	logger.info("Starting test_writeResultTable_badFormat!")
+
+	# Assert that the scan does not start
+	csvPath = str(tmp_path / "out.csv")
+	with pytest.raises(ValueError):
+		fameml_main.runFameML(str(tmp_path / "missing"), csvPath, columnar_path=str(tmp_path / tableName))
+	assert not os.path.exists(csvPath)